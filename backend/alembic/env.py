@@ -36,6 +36,15 @@ from app.models.topic import Topic
 from app.models.sub_topic import SubTopic
 from app.models.lesson import Lesson
 from app.models.seo_metadata import SeoMetadata
+from app.models.reading_order import ReadingOrder
+from app.models.content_block import ContentBlockRow
+from app.models.revision import Revision
+from app.models.published import PublishedPage, PublishedRoadmap
+from app.models.media_asset import MediaAsset
+from app.models.catalog_stat import CatalogStat
+from app.models.lesson_progress import LessonProgress
+from app.models.content_view import ContentView
+from app.models.related_content import RelatedContent
 
 
 target_metadata = Base.metadata
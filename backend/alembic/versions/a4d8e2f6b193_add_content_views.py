@@ -0,0 +1,33 @@
+"""add content_views (daily page view counters)
+
+Revision ID: a4d8e2f6b193
+Revises: f3c9e5a2b718
+Create Date: 2026-10-19 21:12:07.532918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e2f6b193'
+down_revision: Union[str, None] = 'f3c9e5a2b718'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "content_views",
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("views", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("entity", "day", "entity_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("content_views")
@@ -0,0 +1,36 @@
+"""add content_blocks (block-level content storage)
+
+Revision ID: a7d3b9e2f415
+Revises: f2a8c4d61e07
+Create Date: 2026-10-19 16:48:40.730215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3b9e2f415'
+down_revision: Union[str, None] = 'f2a8c4d61e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # The JSON content columns stay: rows are moved over by the
+    # content.migrate_blocks job and read from either place meanwhile.
+    op.create_table(
+        "content_blocks",
+        sa.Column("owner_type", sa.String(length=20), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("type", sa.String(length=50), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("owner_type", "owner_id", "position"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("content_blocks")
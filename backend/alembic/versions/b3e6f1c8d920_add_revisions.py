@@ -0,0 +1,43 @@
+"""add revisions (page history: snapshots + JSON diffs)
+
+Revision ID: b3e6f1c8d920
+Revises: a7d3b9e2f415
+Create Date: 2026-10-19 17:35:12.418603
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e6f1c8d920'
+down_revision: Union[str, None] = 'a7d3b9e2f415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Existing pages get their revision 1 on their first edit.
+    op.create_table(
+        "revisions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("owner_type", sa.String(length=20), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("number", sa.Integer(), nullable=False),
+        sa.Column("is_snapshot", sa.Boolean(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("changed", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_revisions_owner_number", "revisions",
+        ["owner_type", "owner_id", "number"], unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revisions_owner_number", table_name="revisions")
+    op.drop_table("revisions")
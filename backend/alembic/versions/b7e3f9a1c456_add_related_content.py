@@ -0,0 +1,41 @@
+"""add related_content (precomputed similar pages)
+
+Revision ID: b7e3f9a1c456
+Revises: a4d8e2f6b193
+Create Date: 2026-10-19 22:31:48.207663
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f9a1c456'
+down_revision: Union[str, None] = 'a4d8e2f6b193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "related_content",
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("related_entity", sa.String(length=20), nullable=False),
+        sa.Column("related_id", sa.Integer(), nullable=False),
+        sa.Column("slug", sa.Text(), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("entity", "entity_id", "rank"),
+    )
+    op.create_index(
+        "ix_related_content_target", "related_content", ["related_entity", "related_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_related_content_target", table_name="related_content")
+    op.drop_table("related_content")
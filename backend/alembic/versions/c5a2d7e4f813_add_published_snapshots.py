@@ -0,0 +1,52 @@
+"""add published_roadmaps and published_pages (publish snapshots)
+
+Revision ID: c5a2d7e4f813
+Revises: b3e6f1c8d920
+Create Date: 2026-10-19 18:12:47.903215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a2d7e4f813'
+down_revision: Union[str, None] = 'b3e6f1c8d920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "published_roadmaps",
+        sa.Column("roadmap_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("slug", sa.String(length=150), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("published_by", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["roadmap_id"], ["roadmaps.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["published_by"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("roadmap_id"),
+    )
+    op.create_index("ix_published_roadmaps_slug", "published_roadmaps", ["slug"])
+
+    op.create_table(
+        "published_pages",
+        sa.Column("roadmap_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("path", sa.Text(), nullable=False),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["roadmap_id"], ["roadmaps.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("roadmap_id", "version", "path"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("published_pages")
+    op.drop_index("ix_published_roadmaps_slug", table_name="published_roadmaps")
+    op.drop_table("published_roadmaps")
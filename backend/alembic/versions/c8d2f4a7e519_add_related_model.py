@@ -0,0 +1,50 @@
+"""add related_model and related_vectors (shared related-content model)
+
+Revision ID: c8d2f4a7e519
+Revises: b7e3f9a1c456
+Create Date: 2026-10-19 23:12:05.418336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2f4a7e519'
+down_revision: Union[str, None] = 'b7e3f9a1c456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "related_model",
+        sa.Column("generation", sa.String(length=32), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("terms", sa.JSON(), nullable=False),
+        sa.Column("idf", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint("generation"),
+    )
+    op.create_table(
+        "related_vectors",
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.String(length=32), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("indices", sa.LargeBinary(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("slug", sa.Text(), nullable=True),
+        sa.Column("title", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("entity", "entity_id"),
+    )
+    op.create_index(
+        "ix_related_vectors_seq", "related_vectors", ["generation", "seq"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_related_vectors_seq", table_name="related_vectors")
+    op.drop_table("related_vectors")
+    op.drop_table("related_model")
@@ -0,0 +1,48 @@
+"""cascade soft delete: deactivated_by + parent id indexes
+
+Revision ID: d4b7e1a93c52
+Revises: 8cf676a39821
+Create Date: 2026-10-19 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b7e1a93c52'
+down_revision: Union[str, None] = '8cf676a39821'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ["roadmaps", "technologies", "modules", "topics", "sub_topics", "lessons"]
+
+# Denormalized parent ids the cascading UPDATEs filter on.
+PARENT_COLUMNS = {
+    "technologies": ["roadmap_id"],
+    "modules": ["roadmap_id", "technology_id"],
+    "topics": ["roadmap_id", "technology_id", "module_id"],
+    "sub_topics": ["roadmap_id", "technology_id", "module_id", "topic_id"],
+    "lessons": ["roadmap_id", "technology_id", "module_id", "topic_id", "sub_topic_id"],
+}
+
+
+def upgrade():
+    for table in TABLES:
+        op.add_column(table, sa.Column("deactivated_by", sa.String(length=64), nullable=True))
+
+    for table, columns in PARENT_COLUMNS.items():
+        for col in columns:
+            op.create_index(op.f(f"ix_{table}_{col}"), table, [col], unique=False)
+
+
+def downgrade() -> None:
+    for table, columns in PARENT_COLUMNS.items():
+        for col in columns:
+            op.drop_index(op.f(f"ix_{table}_{col}"), table_name=table)
+
+    for table in TABLES:
+        op.drop_column(table, "deactivated_by")
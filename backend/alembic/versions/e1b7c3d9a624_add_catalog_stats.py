@@ -0,0 +1,34 @@
+"""add catalog_stats (admin dashboard rollups)
+
+Revision ID: e1b7c3d9a624
+Revises: d8f4a1b6c352
+Create Date: 2026-10-19 19:31:05.472819
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b7c3d9a624'
+down_revision: Union[str, None] = 'd8f4a1b6c352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Filled on the first GET /admin/stats, then kept up to date per write.
+    op.create_table(
+        "catalog_stats",
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("parent_id", sa.Integer(), nullable=False),
+        sa.Column("active", sa.Integer(), nullable=False),
+        sa.Column("inactive", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("entity", "parent_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_stats")
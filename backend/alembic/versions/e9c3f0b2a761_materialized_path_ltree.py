@@ -0,0 +1,48 @@
+"""materialized ltree path on topics, sub_topics and lessons
+
+Revision ID: e9c3f0b2a761
+Revises: d4b7e1a93c52
+Create Date: 2026-10-19 14:03:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.types import LTree
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9c3f0b2a761'
+down_revision: Union[str, None] = 'd4b7e1a93c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Ancestor id columns, top-down, that make up each table's path.
+PATH_COLUMNS = {
+    "topics": ["roadmap_id", "technology_id", "module_id"],
+    "sub_topics": ["roadmap_id", "technology_id", "module_id", "topic_id"],
+    "lessons": ["roadmap_id", "technology_id", "module_id", "topic_id", "sub_topic_id"],
+}
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS ltree")
+
+    for table, columns in PATH_COLUMNS.items():
+        op.add_column(table, sa.Column("path", LTree(), nullable=True))
+        op.execute(
+            f"UPDATE {table} SET path = text2ltree(concat_ws('.', {', '.join(columns)}))"
+        )
+        op.create_index(
+            op.f(f"ix_{table}_path"), table, ["path"], unique=False,
+            postgresql_using="gist",
+        )
+
+
+def downgrade() -> None:
+    for table in PATH_COLUMNS:
+        op.drop_index(op.f(f"ix_{table}_path"), table_name=table)
+        op.drop_column(table, "path")
@@ -0,0 +1,41 @@
+"""add reading_order (precomputed prev / next navigation)
+
+Revision ID: f2a8c4d61e07
+Revises: e9c3f0b2a761
+Create Date: 2026-10-19 15:27:06.551930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c4d61e07'
+down_revision: Union[str, None] = 'e9c3f0b2a761'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "reading_order",
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("technology_id", sa.Integer(), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("slug", sa.Text(), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["technology_id"], ["technologies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("entity", "entity_id"),
+    )
+    op.create_index(
+        "ix_reading_order_technology_seq", "reading_order",
+        ["technology_id", "seq"], unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reading_order_technology_seq", table_name="reading_order")
+    op.drop_table("reading_order")
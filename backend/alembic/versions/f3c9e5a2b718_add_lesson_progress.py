@@ -0,0 +1,37 @@
+"""add lesson_progress (learner progress)
+
+Revision ID: f3c9e5a2b718
+Revises: e1b7c3d9a624
+Create Date: 2026-10-19 20:04:39.118457
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9e5a2b718'
+down_revision: Union[str, None] = 'e1b7c3d9a624'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "lesson_progress",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("lesson_id", sa.Integer(), nullable=False),
+        sa.Column("percent", sa.Integer(), nullable=False),
+        sa.Column("completed", sa.Boolean(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["lesson_id"], ["lessons.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "lesson_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("lesson_progress")
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.user import User
 from app.core.security import decode_access_token
+from app.core.timing import measure
 
 
 # ======================================================
@@ -33,29 +34,30 @@ def get_current_user(
     """
     Extract user from JWT token.
     """
-    payload = decode_access_token(token)
+    with measure("auth"):
+        payload = decode_access_token(token)
 
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token",
-        )
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication token",
+            )
 
-    user_id: int | None = payload.get("sub")
+        user_id: int | None = payload.get("sub")
 
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-        )
+        if user_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token payload",
+            )
 
-    user = db.get(User, user_id)
+        user = db.get(User, user_id)
 
-    if not user or not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or inactive",
-        )
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or inactive",
+            )
 
     return user
 
@@ -111,3 +113,12 @@ def require_permissions(*required_permissions: str):
         return current_user
 
     return permission_checker
+
+
+# ======================================================
+# Draft access
+# ======================================================
+
+# The catalog tables are the working draft, read by editors only;
+# visitors are served the published snapshot (/published).
+require_draft_access = require_permissions("update_roadmap")
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, require_permissions
+from app.db.slow_query import slow_query_log
+from app.schemas.stats import CatalogStats
+from app.services.stats_service import get_stats, rebuild_all
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_permissions("view_analytics"))],
+)
+
+
+# SLOW QUERIES (this worker's ring buffer, newest first)
+@router.get("/slow-queries")
+def list_slow_queries(limit: int = Query(50, ge=1, le=1000)):
+    return slow_query_log.list(limit)
+
+
+@router.delete("/slow-queries")
+def clear_slow_queries():
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared"}
+
+
+# CATALOG COUNTS (per level and per parent, active / inactive)
+@router.get("/stats", response_model=CatalogStats)
+def stats(
+    rebuild: bool = Query(False, description="Recount everything first"),
+    db: Session = Depends(get_db),
+):
+    if rebuild:
+        rebuild_all(db)
+    return get_stats(db)
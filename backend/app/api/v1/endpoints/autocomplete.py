@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.autocomplete import Suggestion
+from app.services.autocomplete_service import MAX_RESULTS, autocomplete
+
+router = APIRouter(prefix="/autocomplete", tags=["Autocomplete"])
+
+
+# SUGGEST (titles and slugs starting with, or having a word starting with, `q`)
+@router.get("", response_model=list[Suggestion])
+def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=MAX_RESULTS),
+    db: Session = Depends(get_db),
+):
+    return autocomplete(db, q, limit)
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, require_draft_access, require_permissions
 from app.schemas.lesson import (
     LessonCreate,
     LessonUpdate,
@@ -11,8 +13,25 @@ from app.services.lesson_service import (
     create_lesson,
     update_lesson,
     delete_lesson,
+    restore_lesson,
+    list_lessons_by_sub_topic,
+    get_lesson_by_slug,
 )
 from app.crud.crud_lesson import crud_lesson
+from app.schemas.reorder import ReorderRequest
+from app.services.reorder_service import reorder_children
+from app.schemas.json_patch import JsonPatchResult, PatchOperation
+from app.services.json_patch_service import patch_sections
+from app.schemas.content_block import ContentBlockPage
+from app.services.content_service import get_blocks
+from app.schemas.revision import RevisionDetail, RevisionSummary
+from app.schemas.related import RelatedItem
+from app.services.related_service import get_related
+from app.services.revision_service import (
+    get_revision,
+    list_revisions,
+    restore_revision,
+)
 
 router = APIRouter(prefix="/lessons", tags=["Lessons"])
 
@@ -27,25 +46,52 @@ def create(payload: LessonCreate, db: Session = Depends(get_db)):
 @router.get(
     "/sub-topic/{sub_topic_id}",
     response_model=list[LessonResponse],
+    dependencies=[Depends(require_draft_access)],
 )
 def list_by_sub_topic(
     sub_topic_id: int,
     db: Session = Depends(get_db),
 ):
-    return crud_lesson.get_by_sub_topic(db, sub_topic_id)
+    return list_lessons_by_sub_topic(db, sub_topic_id)
 
 
 # READ ONE (slug-based)
 @router.get(
     "/sub-topic/{sub_topic_id}/{slug}",
     response_model=LessonResponse,
+    dependencies=[Depends(require_draft_access)],
 )
 def get_by_slug(
     sub_topic_id: int,
     slug: str,
     db: Session = Depends(get_db),
 ):
-    return crud_lesson.get_by_slug(db, sub_topic_id, slug)
+    return get_lesson_by_slug(db, sub_topic_id, slug)
+
+
+# CONTENT BLOCKS, a page at a time
+@router.get(
+    "/{lesson_id}/blocks",
+    response_model=ContentBlockPage,
+    dependencies=[Depends(require_draft_access)],
+)
+def blocks(
+    lesson_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return get_blocks(db, crud_lesson, lesson_id, offset, limit, "Lesson")
+
+
+# REORDER (drag & drop: one statement for the whole list)
+@router.patch(
+    "/reorder",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def reorder(payload: ReorderRequest, db: Session = Depends(get_db)):
+    count = reorder_children(db, crud_lesson, payload)
+    return {"message": "Lessons reordered", "count": count}
 
 
 # UPDATE
@@ -58,8 +104,87 @@ def update(
     return update_lesson(db, lesson_id, payload)
 
 
+# PATCH JSON sections (RFC 6902: content, examples, ...)
+@router.patch(
+    "/{lesson_id}",
+    response_model=JsonPatchResult,
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def patch(
+    lesson_id: int,
+    operations: List[PatchOperation],
+    db: Session = Depends(get_db),
+):
+    return patch_sections(db, crud_lesson, LessonUpdate, lesson_id, operations, "Lesson")
+
 # DELETE (soft)
 @router.delete("/{lesson_id}")
 def delete(lesson_id: int, db: Session = Depends(get_db)):
     delete_lesson(db, lesson_id)
     return {"message": "Lesson deactivated"}
+
+
+# RESTORE (the subtree deactivated with it comes back too)
+@router.post(
+    "/{lesson_id}/restore",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore(lesson_id: int, db: Session = Depends(get_db)):
+    restore_lesson(db, lesson_id)
+    return {"message": "Lesson restored"}
+
+
+# REVISIONS (newest first)
+@router.get(
+    "/{lesson_id}/revisions",
+    response_model=list[RevisionSummary],
+    dependencies=[Depends(require_draft_access)],
+)
+def revisions(
+    lesson_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return list_revisions(db, crud_lesson, lesson_id, offset, limit, "Lesson")
+
+
+# READ ONE REVISION (rebuilt from the nearest snapshot)
+@router.get(
+    "/{lesson_id}/revisions/{number}",
+    response_model=RevisionDetail,
+    dependencies=[Depends(require_draft_access)],
+)
+def revision(
+    lesson_id: int,
+    number: int,
+    db: Session = Depends(get_db),
+):
+    return get_revision(db, crud_lesson, lesson_id, number, "Lesson")
+
+
+# ROLL BACK to a revision (recorded as a new one)
+@router.post(
+    "/{lesson_id}/revisions/{number}/restore",
+    response_model=LessonResponse,
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore_to_revision(
+    lesson_id: int,
+    number: int,
+    db: Session = Depends(get_db),
+):
+    return restore_revision(db, crud_lesson, lesson_id, number, "Lesson")
+
+
+# RELATED (precomputed by content similarity, most similar first)
+@router.get(
+    "/{lesson_id}/related",
+    response_model=list[RelatedItem],
+    dependencies=[Depends(require_draft_access)],
+)
+def related(
+    lesson_id: int,
+    db: Session = Depends(get_db),
+):
+    return get_related(db, crud_lesson, lesson_id, "Lesson")
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, require_permissions
+from app.core.config import settings
+from app.crud.crud_media import crud_media
+from app.models.user import User
+from app.schemas.media import MediaAssetResponse
+from app.services.media_service import get_asset, upload_image
+
+router = APIRouter(prefix="/media", tags=["Media"])
+
+
+# UPLOAD (original + resized WebP / AVIF variants)
+@router.post("/", response_model=MediaAssetResponse)
+def upload(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permissions("update_roadmap")),
+):
+    # One byte over the limit is enough to reject it
+    data = file.file.read(settings.MEDIA_MAX_UPLOAD_BYTES + 1)
+    return upload_image(db, data, current_user.id)
+
+
+# READ ALL (newest first)
+@router.get("/", response_model=list[MediaAssetResponse])
+def list_all(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return crud_media.get_many(db, offset, limit)
+
+
+# READ ONE
+@router.get("/{asset_id}", response_model=MediaAssetResponse)
+def get_one(asset_id: int, db: Session = Depends(get_db)):
+    return get_asset(db, asset_id)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, require_draft_access, require_permissions
 from app.schemas.module import (
     ModuleCreate,
     ModuleUpdate,
@@ -11,8 +11,11 @@ from app.services.module_service import (
     create_module,
     update_module,
     delete_module,
+    restore_module,
 )
 from app.crud.crud_module import crud_module
+from app.schemas.reorder import ReorderRequest
+from app.services.reorder_service import reorder_children
 
 router = APIRouter(prefix="/modules", tags=["Modules"])
 
@@ -27,6 +30,7 @@ def create(payload: ModuleCreate, db: Session = Depends(get_db)):
 @router.get(
     "/technology/{technology_id}",
     response_model=list[ModuleResponse],
+    dependencies=[Depends(require_draft_access)],
 )
 def list_by_technology(
     technology_id: int,
@@ -39,6 +43,7 @@ def list_by_technology(
 @router.get(
     "/technology/{technology_id}/{slug}",
     response_model=ModuleResponse,
+    dependencies=[Depends(require_draft_access)],
 )
 def get_by_slug(
     technology_id: int,
@@ -48,6 +53,16 @@ def get_by_slug(
     return crud_module.get_by_slug(db, technology_id, slug)
 
 
+# REORDER (drag & drop: one statement for the whole list)
+@router.patch(
+    "/reorder",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def reorder(payload: ReorderRequest, db: Session = Depends(get_db)):
+    count = reorder_children(db, crud_module, payload)
+    return {"message": "Modules reordered", "count": count}
+
+
 # UPDATE
 @router.put("/{module_id}", response_model=ModuleResponse)
 def update(
@@ -63,3 +78,13 @@ def update(
 def delete(module_id: int, db: Session = Depends(get_db)):
     delete_module(db, module_id)
     return {"message": "Module deactivated"}
+
+
+# RESTORE (the subtree deactivated with it comes back too)
+@router.post(
+    "/{module_id}/restore",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore(module_id: int, db: Session = Depends(get_db)):
+    restore_module(db, module_id)
+    return {"message": "Module restored"}
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.navigation import NavigationResponse
+from app.services.navigation_service import get_navigation
+
+router = APIRouter(prefix="/navigation", tags=["Navigation"])
+
+
+# PREV / NEXT (entity: topic | sub_topic | lesson)
+@router.get("/{entity}/{entity_id}", response_model=NavigationResponse)
+def navigation(entity: str, entity_id: int, db: Session = Depends(get_db)):
+    return get_navigation(db, entity, entity_id)
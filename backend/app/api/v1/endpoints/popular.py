@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.views import PopularItem
+from app.services.view_service import get_popular
+
+router = APIRouter(prefix="/popular", tags=["Popular"])
+
+
+# MOST VIEWED (published page views over the last `days` days)
+@router.get("", response_model=list[PopularItem])
+def popular(
+    entity: str = Query("lesson", description="roadmap, technology, module, topic, sub_topic or lesson"),
+    days: int = Query(7, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    return get_popular(db, entity, days, limit)
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db
+from app.models.user import User
+from app.schemas.progress import LessonProgressResponse, ProgressEvent, TechnologyProgress
+from app.services.progress_service import (
+    get_lesson_progress,
+    get_technology_progress,
+    record_progress,
+)
+
+router = APIRouter(prefix="/progress", tags=["Progress"])
+
+
+# RECORD (buffered: written within PROGRESS_FLUSH_SECONDS)
+@router.post("/lessons/{lesson_id}", status_code=status.HTTP_202_ACCEPTED)
+def record(
+    lesson_id: int,
+    payload: ProgressEvent,
+    current_user: User = Depends(get_current_user),
+):
+    record_progress(current_user.id, lesson_id, payload)
+    return {"message": "Progress recorded"}
+
+
+# READ ONE LESSON
+@router.get("/lessons/{lesson_id}", response_model=LessonProgressResponse)
+def lesson(
+    lesson_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return get_lesson_progress(db, current_user.id, lesson_id)
+
+
+# READ TECHNOLOGY (with per-module percentages)
+@router.get("/technologies/{technology_id}", response_model=TechnologyProgress)
+def technology(
+    technology_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return get_technology_progress(db, current_user.id, technology_id)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.content_block import ContentBlockPage
+from app.schemas.publish import PublishedRoadmapResponse
+from app.services.publish_service import (
+    get_published_blocks,
+    get_published_page,
+    list_published,
+)
+
+router = APIRouter(prefix="/published", tags=["Published"])
+
+
+# READ ALL (live version of each published roadmap)
+@router.get("", response_model=list[PublishedRoadmapResponse])
+def list_all(db: Session = Depends(get_db)):
+    return list_published(db)
+
+
+# CONTENT BLOCKS of a page, a page at a time. Declared before the page
+# route, so "blocks" as the last slug of a path is taken by this one.
+@router.get("/{path:path}/blocks", response_model=ContentBlockPage)
+def get_blocks(
+    path: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return get_published_blocks(db, path, offset, limit)
+
+
+# READ ONE PAGE (by slug path, served as stored)
+@router.get("/{path:path}")
+def get_page(path: str, request: Request, db: Session = Depends(get_db)):
+    body, etag = get_published_page(db, path)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
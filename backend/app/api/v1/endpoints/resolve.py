@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.resolve import ResolveResponse
+from app.services.resolver_service import resolve_path
+
+router = APIRouter(prefix="/resolve", tags=["Resolve"])
+
+
+# SLUG PATH -> IDS
+@router.get("", response_model=ResolveResponse)
+def resolve(
+    path: str = Query(..., example="frontend/javascript/basics/closures"),
+    db: Session = Depends(get_db),
+):
+    return resolve_path(db, path)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, require_draft_access, require_permissions
+from app.models.user import User
 from app.schemas.roadmap import (
     RoadmapCreate,
     RoadmapUpdate,
@@ -11,8 +12,12 @@ from app.services.roadmap_service import (
     create_roadmap,
     update_roadmap,
     delete_roadmap,
+    restore_roadmap,
+    list_roadmaps,
+    get_roadmap_by_slug,
 )
-from app.crud.crud_roadmap import crud_roadmap
+from app.schemas.publish import PublishResult
+from app.services.publish_service import publish_roadmap, unpublish_roadmap
 
 router = APIRouter(prefix="/roadmaps", tags=["Roadmaps"])
 
@@ -24,15 +29,23 @@ def create(payload: RoadmapCreate, db: Session = Depends(get_db)):
 
 
 # READ ALL
-@router.get("/", response_model=list[RoadmapResponse])
+@router.get(
+    "/",
+    response_model=list[RoadmapResponse],
+    dependencies=[Depends(require_draft_access)],
+)
 def list_all(db: Session = Depends(get_db)):
-    return crud_roadmap.get_all(db)
+    return list_roadmaps(db)
 
 
 # READ ONE (by slug – frontend friendly)
-@router.get("/{slug}", response_model=RoadmapResponse)
+@router.get(
+    "/{slug}",
+    response_model=RoadmapResponse,
+    dependencies=[Depends(require_draft_access)],
+)
 def get_by_slug(slug: str, db: Session = Depends(get_db)):
-    return crud_roadmap.get_by_slug(db, slug)
+    return get_roadmap_by_slug(db, slug)
 
 
 # UPDATE
@@ -50,3 +63,33 @@ def update(
 def delete(roadmap_id: int, db: Session = Depends(get_db)):
     delete_roadmap(db, roadmap_id)
     return {"message": "Roadmap deactivated"}
+
+
+# RESTORE (the subtree deactivated with it comes back too)
+@router.post(
+    "/{roadmap_id}/restore",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore(roadmap_id: int, db: Session = Depends(get_db)):
+    restore_roadmap(db, roadmap_id)
+    return {"message": "Roadmap restored"}
+
+
+# PUBLISH (freeze the active subtree as the new public version)
+@router.post("/{roadmap_id}/publish", response_model=PublishResult)
+def publish(
+    roadmap_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permissions("publish_roadmap")),
+):
+    return publish_roadmap(db, roadmap_id, current_user.id)
+
+
+# UNPUBLISH (the draft stays as it is)
+@router.delete(
+    "/{roadmap_id}/publish",
+    dependencies=[Depends(require_permissions("publish_roadmap"))],
+)
+def unpublish(roadmap_id: int, db: Session = Depends(get_db)):
+    unpublish_roadmap(db, roadmap_id)
+    return {"message": "Roadmap unpublished"}
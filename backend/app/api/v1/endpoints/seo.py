@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends
+import os
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse, HTMLResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
@@ -7,7 +10,10 @@ from app.services.seo_service import (
     create_seo,
     update_seo,
     delete_seo,
+    get_prerendered_head,
+    SITEMAP_INDEX,
 )
+from app.core.config import settings
 from app.crud.crud_seo import crud_seo
 
 router = APIRouter(prefix="/seo", tags=["SEO"])
@@ -19,6 +25,34 @@ def create(payload: SeoCreate, db: Session = Depends(get_db)):
     return create_seo(db, payload)
 
 
+# SITEMAP INDEX (regenerated by the seo.sitemap job after content writes)
+@router.get("/sitemap.xml", include_in_schema=False)
+def sitemap():
+    return _sitemap_file(SITEMAP_INDEX)
+
+
+# SITEMAP FILES (listed by the index)
+@router.get("/sitemap-{number}.xml", include_in_schema=False)
+def sitemap_chunk(number: int):
+    return _sitemap_file(f"sitemap-{number}.xml")
+
+
+def _sitemap_file(name: str) -> FileResponse:
+    path = os.path.join(settings.SITEMAP_DIR, name)
+    if not os.path.exists(path):
+        raise HTTPException(404, "Sitemap not generated yet")
+    return FileResponse(path, media_type="application/xml")
+
+
+# PRE-RENDERED <head> (crawlers / link previews)
+@router.get("/head/{entity}/{entity_id}", response_class=HTMLResponse)
+def prerendered_head(entity: str, entity_id: int, db: Session = Depends(get_db)):
+    head = get_prerendered_head(db, entity, entity_id)
+    if head is None:
+        raise HTTPException(404, "Page not found")
+    return HTMLResponse(head)
+
+
 # READ
 @router.get("/{seo_id}", response_model=SeoResponse)
 def get(seo_id: int, db: Session = Depends(get_db)):
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, require_draft_access, require_permissions
 from app.schemas.sub_topic import (
     SubTopicCreate,
     SubTopicUpdate,
@@ -11,8 +13,25 @@ from app.services.sub_topic_service import (
     create_sub_topic,
     update_sub_topic,
     delete_sub_topic,
+    restore_sub_topic,
+    list_sub_topics_by_topic,
+    get_sub_topic_by_slug,
 )
 from app.crud.crud_sub_topic import crud_sub_topic
+from app.schemas.reorder import ReorderRequest
+from app.services.reorder_service import reorder_children
+from app.schemas.json_patch import JsonPatchResult, PatchOperation
+from app.services.json_patch_service import patch_sections
+from app.schemas.content_block import ContentBlockPage
+from app.services.content_service import get_blocks
+from app.schemas.revision import RevisionDetail, RevisionSummary
+from app.schemas.related import RelatedItem
+from app.services.related_service import get_related
+from app.services.revision_service import (
+    get_revision,
+    list_revisions,
+    restore_revision,
+)
 
 router = APIRouter(prefix="/sub-topics", tags=["SubTopics"])
 
@@ -27,25 +46,52 @@ def create(payload: SubTopicCreate, db: Session = Depends(get_db)):
 @router.get(
     "/topic/{topic_id}",
     response_model=list[SubTopicResponse],
+    dependencies=[Depends(require_draft_access)],
 )
 def list_by_topic(
     topic_id: int,
     db: Session = Depends(get_db),
 ):
-    return crud_sub_topic.get_by_topic(db, topic_id)
+    return list_sub_topics_by_topic(db, topic_id)
 
 
 # READ ONE (slug-based)
 @router.get(
     "/topic/{topic_id}/{slug}",
     response_model=SubTopicResponse,
+    dependencies=[Depends(require_draft_access)],
 )
 def get_by_slug(
     topic_id: int,
     slug: str,
     db: Session = Depends(get_db),
 ):
-    return crud_sub_topic.get_by_slug(db, topic_id, slug)
+    return get_sub_topic_by_slug(db, topic_id, slug)
+
+
+# CONTENT BLOCKS, a page at a time
+@router.get(
+    "/{sub_topic_id}/blocks",
+    response_model=ContentBlockPage,
+    dependencies=[Depends(require_draft_access)],
+)
+def blocks(
+    sub_topic_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return get_blocks(db, crud_sub_topic, sub_topic_id, offset, limit, "SubTopic")
+
+
+# REORDER (drag & drop: one statement for the whole list)
+@router.patch(
+    "/reorder",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def reorder(payload: ReorderRequest, db: Session = Depends(get_db)):
+    count = reorder_children(db, crud_sub_topic, payload)
+    return {"message": "Sub-topics reordered", "count": count}
 
 
 # UPDATE
@@ -58,8 +104,87 @@ def update(
     return update_sub_topic(db, sub_topic_id, payload)
 
 
+# PATCH JSON sections (RFC 6902: content, examples, ...)
+@router.patch(
+    "/{sub_topic_id}",
+    response_model=JsonPatchResult,
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def patch(
+    sub_topic_id: int,
+    operations: List[PatchOperation],
+    db: Session = Depends(get_db),
+):
+    return patch_sections(db, crud_sub_topic, SubTopicUpdate, sub_topic_id, operations, "SubTopic")
+
 # DELETE (soft)
 @router.delete("/{sub_topic_id}")
 def delete(sub_topic_id: int, db: Session = Depends(get_db)):
     delete_sub_topic(db, sub_topic_id)
     return {"message": "SubTopic deactivated"}
+
+
+# RESTORE (the subtree deactivated with it comes back too)
+@router.post(
+    "/{sub_topic_id}/restore",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore(sub_topic_id: int, db: Session = Depends(get_db)):
+    restore_sub_topic(db, sub_topic_id)
+    return {"message": "SubTopic restored"}
+
+
+# REVISIONS (newest first)
+@router.get(
+    "/{sub_topic_id}/revisions",
+    response_model=list[RevisionSummary],
+    dependencies=[Depends(require_draft_access)],
+)
+def revisions(
+    sub_topic_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return list_revisions(db, crud_sub_topic, sub_topic_id, offset, limit, "SubTopic")
+
+
+# READ ONE REVISION (rebuilt from the nearest snapshot)
+@router.get(
+    "/{sub_topic_id}/revisions/{number}",
+    response_model=RevisionDetail,
+    dependencies=[Depends(require_draft_access)],
+)
+def revision(
+    sub_topic_id: int,
+    number: int,
+    db: Session = Depends(get_db),
+):
+    return get_revision(db, crud_sub_topic, sub_topic_id, number, "SubTopic")
+
+
+# ROLL BACK to a revision (recorded as a new one)
+@router.post(
+    "/{sub_topic_id}/revisions/{number}/restore",
+    response_model=SubTopicResponse,
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore_to_revision(
+    sub_topic_id: int,
+    number: int,
+    db: Session = Depends(get_db),
+):
+    return restore_revision(db, crud_sub_topic, sub_topic_id, number, "SubTopic")
+
+
+# RELATED (precomputed by content similarity, most similar first)
+@router.get(
+    "/{sub_topic_id}/related",
+    response_model=list[RelatedItem],
+    dependencies=[Depends(require_draft_access)],
+)
+def related(
+    sub_topic_id: int,
+    db: Session = Depends(get_db),
+):
+    return get_related(db, crud_sub_topic, sub_topic_id, "SubTopic")
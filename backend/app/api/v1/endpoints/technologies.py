@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, require_draft_access, require_permissions
 from app.schemas.technology import (
     TechnologyCreate,
     TechnologyUpdate,
@@ -11,8 +11,13 @@ from app.services.technology_service import (
     create_technology,
     update_technology,
     delete_technology,
+    restore_technology,
+    list_technologies_by_roadmap,
+    get_technology_by_slug,
 )
 from app.crud.crud_technology import crud_technology
+from app.schemas.reorder import ReorderRequest
+from app.services.reorder_service import reorder_children
 
 router = APIRouter(prefix="/technologies", tags=["Technologies"])
 
@@ -27,6 +32,7 @@ def create(payload: TechnologyCreate, db: Session = Depends(get_db)):
 @router.get(
     "/",
     response_model=list[TechnologyResponse],
+    dependencies=[Depends(require_draft_access)],
 )
 def list_all(
     db: Session = Depends(get_db)
@@ -38,24 +44,36 @@ def list_all(
 @router.get(
     "/roadmap/{roadmap_id}",
     response_model=list[TechnologyResponse],
+    dependencies=[Depends(require_draft_access)],
 )
 def list_by_roadmap(
     roadmap_id: int, db: Session = Depends(get_db)
 ):
-    return crud_technology.get_by_roadmap(db, roadmap_id)
+    return list_technologies_by_roadmap(db, roadmap_id)
 
 
 # READ ONE (slug-based)
 @router.get(
     "/roadmap/{roadmap_id}/{slug}",
     response_model=TechnologyResponse,
+    dependencies=[Depends(require_draft_access)],
 )
 def get_by_slug(
     roadmap_id: int,
     slug: str,
     db: Session = Depends(get_db),
 ):
-    return crud_technology.get_by_slug(db, roadmap_id, slug)
+    return get_technology_by_slug(db, roadmap_id, slug)
+
+
+# REORDER (drag & drop: one statement for the whole list)
+@router.patch(
+    "/reorder",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def reorder(payload: ReorderRequest, db: Session = Depends(get_db)):
+    count = reorder_children(db, crud_technology, payload)
+    return {"message": "Technologies reordered", "count": count}
 
 
 # UPDATE
@@ -73,3 +91,13 @@ def update(
 def delete(tech_id: int, db: Session = Depends(get_db)):
     delete_technology(db, tech_id)
     return {"message": "Technology deactivated"}
+
+
+# RESTORE (the subtree deactivated with it comes back too)
+@router.post(
+    "/{tech_id}/restore",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore(tech_id: int, db: Session = Depends(get_db)):
+    restore_technology(db, tech_id)
+    return {"message": "Technology restored"}
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, require_draft_access, require_permissions
 from app.schemas.topic import (
     TopicCreate,
     TopicUpdate,
@@ -11,8 +13,25 @@ from app.services.topic_service import (
     create_topic,
     update_topic,
     delete_topic,
+    restore_topic,
+    list_topics_by_module,
+    get_topic_by_slug,
 )
 from app.crud.crud_topic import crud_topic
+from app.schemas.reorder import ReorderRequest
+from app.services.reorder_service import reorder_children
+from app.schemas.json_patch import JsonPatchResult, PatchOperation
+from app.services.json_patch_service import patch_sections
+from app.schemas.content_block import ContentBlockPage
+from app.services.content_service import get_blocks
+from app.schemas.revision import RevisionDetail, RevisionSummary
+from app.schemas.related import RelatedItem
+from app.services.related_service import get_related
+from app.services.revision_service import (
+    get_revision,
+    list_revisions,
+    restore_revision,
+)
 
 router = APIRouter(prefix="/topics", tags=["Topics"])
 
@@ -27,25 +46,52 @@ def create(payload: TopicCreate, db: Session = Depends(get_db)):
 @router.get(
     "/module/{module_id}",
     response_model=list[TopicResponse],
+    dependencies=[Depends(require_draft_access)],
 )
 def list_by_module(
     module_id: int,
     db: Session = Depends(get_db),
 ):
-    return crud_topic.get_by_module(db, module_id)
+    return list_topics_by_module(db, module_id)
 
 
 # READ ONE (slug-based)
 @router.get(
     "/module/{module_id}/{slug}",
     response_model=TopicResponse,
+    dependencies=[Depends(require_draft_access)],
 )
 def get_by_slug(
     module_id: int,
     slug: str,
     db: Session = Depends(get_db),
 ):
-    return crud_topic.get_by_slug(db, module_id, slug)
+    return get_topic_by_slug(db, module_id, slug)
+
+
+# CONTENT BLOCKS, a page at a time
+@router.get(
+    "/{topic_id}/blocks",
+    response_model=ContentBlockPage,
+    dependencies=[Depends(require_draft_access)],
+)
+def blocks(
+    topic_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return get_blocks(db, crud_topic, topic_id, offset, limit, "Topic")
+
+
+# REORDER (drag & drop: one statement for the whole list)
+@router.patch(
+    "/reorder",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def reorder(payload: ReorderRequest, db: Session = Depends(get_db)):
+    count = reorder_children(db, crud_topic, payload)
+    return {"message": "Topics reordered", "count": count}
 
 
 # UPDATE
@@ -58,8 +104,87 @@ def update(
     return update_topic(db, topic_id, payload)
 
 
+# PATCH JSON sections (RFC 6902: content, examples, ...)
+@router.patch(
+    "/{topic_id}",
+    response_model=JsonPatchResult,
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def patch(
+    topic_id: int,
+    operations: List[PatchOperation],
+    db: Session = Depends(get_db),
+):
+    return patch_sections(db, crud_topic, TopicUpdate, topic_id, operations, "Topic")
+
 # DELETE (soft)
 @router.delete("/{topic_id}")
 def delete(topic_id: int, db: Session = Depends(get_db)):
     delete_topic(db, topic_id)
     return {"message": "Topic deactivated"}
+
+
+# RESTORE (the subtree deactivated with it comes back too)
+@router.post(
+    "/{topic_id}/restore",
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore(topic_id: int, db: Session = Depends(get_db)):
+    restore_topic(db, topic_id)
+    return {"message": "Topic restored"}
+
+
+# REVISIONS (newest first)
+@router.get(
+    "/{topic_id}/revisions",
+    response_model=list[RevisionSummary],
+    dependencies=[Depends(require_draft_access)],
+)
+def revisions(
+    topic_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    return list_revisions(db, crud_topic, topic_id, offset, limit, "Topic")
+
+
+# READ ONE REVISION (rebuilt from the nearest snapshot)
+@router.get(
+    "/{topic_id}/revisions/{number}",
+    response_model=RevisionDetail,
+    dependencies=[Depends(require_draft_access)],
+)
+def revision(
+    topic_id: int,
+    number: int,
+    db: Session = Depends(get_db),
+):
+    return get_revision(db, crud_topic, topic_id, number, "Topic")
+
+
+# ROLL BACK to a revision (recorded as a new one)
+@router.post(
+    "/{topic_id}/revisions/{number}/restore",
+    response_model=TopicResponse,
+    dependencies=[Depends(require_permissions("update_roadmap"))],
+)
+def restore_to_revision(
+    topic_id: int,
+    number: int,
+    db: Session = Depends(get_db),
+):
+    return restore_revision(db, crud_topic, topic_id, number, "Topic")
+
+
+# RELATED (precomputed by content similarity, most similar first)
+@router.get(
+    "/{topic_id}/related",
+    response_model=list[RelatedItem],
+    dependencies=[Depends(require_draft_access)],
+)
+def related(
+    topic_id: int,
+    db: Session = Depends(get_db),
+):
+    return get_related(db, crud_topic, topic_id, "Topic")
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import users, roles, subscriptions, profiles, permissions, role_permissions, roadmaps, technologies, modules,topics, sub_topics, lessons,seo
+from app.api.v1.endpoints import users, roles, subscriptions, profiles, permissions, role_permissions, roadmaps, technologies, modules,topics, sub_topics, lessons,seo, navigation, resolve, published, media, progress, popular, autocomplete, admin
 
 api_router = APIRouter()
 
@@ -22,9 +22,17 @@ api_router.include_router(topics.router)
 api_router.include_router(sub_topics.router)
 api_router.include_router(lessons.router)
 api_router.include_router(seo.router)
+api_router.include_router(navigation.router)
+api_router.include_router(resolve.router)
+api_router.include_router(published.router)
+api_router.include_router(media.router)
+api_router.include_router(progress.router)
+api_router.include_router(popular.router)
+api_router.include_router(autocomplete.router)
 
 
 
 
 
 
+api_router.include_router(admin.router)
@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+
+
+# ======================================================
+# Backends
+# ======================================================
+
+class MemoryBackend:
+    """
+    Per-process LRU with a TTL per entry.
+
+    Each worker holds its own copy; a write only clears the copy of the
+    worker that handled it, the TTL bounds staleness everywhere else.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return False
+            self._entries[key] = (now + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+
+class RedisBackend:
+    """
+    Entries shared by all workers (and Celery) through Redis, stored as JSON.
+
+    `client` is a sync `redis.Redis` (or `fakeredis.FakeRedis`); cached
+    reads are served from sync endpoints running in the threadpool.
+    """
+
+    def __init__(self, client, prefix: str = "cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        raw = self.client.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(self.prefix + key, json.dumps(value), px=int(ttl * 1000))
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        return bool(self.client.set(self.prefix + key, json.dumps(value), px=int(ttl * 1000), nx=True))
+
+    def delete(self, key: str) -> None:
+        self.client.unlink(self.prefix + key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}{prefix}*", count=500))
+        if keys:
+            self.client.unlink(*keys)
+
+
+def get_backend():
+    if settings.CACHE_BACKEND == "redis":
+        import redis
+
+        return RedisBackend(redis.Redis.from_url(settings.REDIS_URL))
+    return MemoryBackend()
+
+
+# ======================================================
+# Named caches
+# ======================================================
+
+class Cache:
+    """
+    Usage:
+    roadmaps = catalog_cache.get_or_set("roadmaps", lambda: load(db))
+
+    Values must be JSON-serialisable (cache the response dicts, not ORM
+    rows) so the memory and Redis backends behave the same. None is never
+    cached.
+    """
+
+    def __init__(self, name: str, ttl: float, backend=None):
+        self.name = name
+        self.ttl = ttl
+        self._backend = backend
+
+    @property
+    def backend(self):
+        # Created on first use so importing the app never opens a connection.
+        if self._backend is None:
+            self._backend = get_backend()
+        return self._backend
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def get(self, key: str) -> Any | None:
+        value = self.backend.get(self._key(key))
+        record_cache(self.name, value is not None)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.backend.set(self._key(key), value, self.ttl)
+
+    def get_or_set(self, key: str, loader: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def add(self, key: str, value: Any) -> bool:
+        """Set only if absent (or expired); True if this call set it."""
+        return self.backend.add(self._key(key), value, self.ttl)
+
+    def delete(self, key: str) -> None:
+        self.backend.delete(self._key(key))
+
+    def invalidate(self, prefix: str = "") -> None:
+        self.backend.delete_prefix(self._key(prefix))
+
+
+# Roadmaps and technologies, by list and by slug.
+catalog_cache = Cache("catalog", ttl=settings.CACHE_TTL_SECONDS)
+
+# Rendered <head> per page, refreshed by the prerender job after writes.
+prerender_cache = Cache("prerender", ttl=24 * 3600)
+
+# Which version of each roadmap is published; cleared by publish_roadmap.
+published_cache = Cache("published", ttl=settings.CACHE_TTL_SECONDS)
+
+# Published page bodies, keyed by version: never change once written.
+snapshot_cache = Cache("snapshot", ttl=30 * 24 * 3600)
+
+# Most viewed rows per entity; view counts are only written periodically.
+popular_cache = Cache("popular", ttl=settings.VIEW_FLUSH_SECONDS)
+
+# Debounced jobs: a key is held while a run is queued, so the writes of
+# one window share it. Expires as the job starts.
+scheduled_jobs = Cache("scheduled", ttl=settings.SITEMAP_DEBOUNCE_SECONDS)
@@ -1,4 +1,6 @@
+import ipaddress
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,10 +15,12 @@ class Settings:
     DB_PORT = os.getenv("DB_PORT")
     DB_NAME = os.getenv("DB_NAME")
 
-    DATABASE_URL = (
+    # A full DATABASE_URL (as used by alembic) wins over the parts above.
+    DATABASE_URL = os.getenv("DATABASE_URL") or (
         f"postgresql://{DB_USER}:{DB_PASSWORD}"
         f"@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
+    DB_SSLMODE = os.getenv("DB_SSLMODE", "require")  # Supabase requires SSL
 
     SECRET_KEY = os.getenv("SECRET_KEY")
     ALGORITHM = os.getenv("ALGORITHM")
@@ -31,4 +35,95 @@ class Settings:
         if origin.strip()
     ]
 
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true") == "true"
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory | redis
+    # Proxies in front of the app (nginx, load balancer), as addresses or
+    # networks: "127.0.0.1,10.0.0.0/8". Requests they forward are limited
+    # by the client address in X-Forwarded-For instead of theirs.
+    TRUSTED_PROXIES = [
+        ipaddress.ip_network(proxy.strip(), strict=False)
+        for proxy in os.getenv("TRUSTED_PROXIES", "").split(",")
+        if proxy.strip()
+    ]
+
+    CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
+    # Run tasks inline (tests / local dev without a worker).
+    CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "false") == "true"
+
+    SITE_URL = os.getenv("SITE_URL", "http://localhost:3000").rstrip("/")
+    # Generated sitemap files (sitemap_index.xml, sitemap-N.xml): runtime
+    # output, kept out of the source tree. Point it at a volume the web
+    # workers and the Celery worker share.
+    SITEMAP_DIR = os.getenv("SITEMAP_DIR", os.path.join(tempfile.gettempdir(), "eduwise-sitemaps"))
+    # Public base URL of those files, as listed in the index
+    SITEMAP_URL = os.getenv("SITEMAP_URL", "http://localhost:8000/api/v1/seo").rstrip("/")
+    # Writes within this window share one regeneration
+    SITEMAP_DEBOUNCE_SECONDS = float(os.getenv("SITEMAP_DEBOUNCE_SECONDS", "60"))
+
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # memory | redis
+    CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "300"))
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true") == "true"
+
+    # Where topic / sub-topic / lesson content is written: "json" (the
+    # content column) or "blocks" (one content_blocks row per block).
+    CONTENT_STORAGE = os.getenv("CONTENT_STORAGE", "json")
+
+    # Page history keeps a full copy every N revisions and diffs between,
+    # so rebuilding one replays at most N - 1 diffs.
+    REVISION_SNAPSHOT_INTERVAL = int(os.getenv("REVISION_SNAPSHOT_INTERVAL", "20"))
+
+    # Published versions whose pages are kept after a newer one goes live
+    # (readers of the old version finish on it; older ones are dropped).
+    PUBLISHED_VERSIONS_KEPT = int(os.getenv("PUBLISHED_VERSIONS_KEPT", "2"))
+
+    # Uploaded images: "local" (MEDIA_ROOT, served at MEDIA_URL) or "s3"
+    # (any S3-compatible bucket; MEDIA_URL is its public base URL).
+    MEDIA_STORAGE = os.getenv("MEDIA_STORAGE", "local")
+    MEDIA_ROOT = os.getenv("MEDIA_ROOT", "static/media")
+    MEDIA_URL = os.getenv("MEDIA_URL", "/media")
+    MEDIA_S3_BUCKET = os.getenv("MEDIA_S3_BUCKET", "eduwise-media")
+    MEDIA_S3_ENDPOINT_URL = os.getenv("MEDIA_S3_ENDPOINT_URL")  # None: AWS
+    MEDIA_MAX_UPLOAD_BYTES = int(os.getenv("MEDIA_MAX_UPLOAD_MB", "10")) * 1024 * 1024
+    MEDIA_MAX_PIXELS = int(os.getenv("MEDIA_MAX_PIXELS", "40000000"))
+    MEDIA_VARIANT_WIDTHS = [
+        int(w) for w in os.getenv("MEDIA_VARIANT_WIDTHS", "320,640,960,1280,1920").split(",")
+    ]
+    MEDIA_FORMATS = os.getenv("MEDIA_FORMATS", "avif,webp").split(",")
+    MEDIA_WORKERS = int(os.getenv("MEDIA_WORKERS", "2"))  # encoder processes per app worker
+
+    # Learner progress is buffered per worker and written in bulk this
+    # often (or as soon as this many user/lesson pairs are pending).
+    PROGRESS_FLUSH_SECONDS = float(os.getenv("PROGRESS_FLUSH_SECONDS", "5"))
+    PROGRESS_BUFFER_SIZE = int(os.getenv("PROGRESS_BUFFER_SIZE", "5000"))
+
+    # Page views are counted in memory per worker (in this many shards,
+    # to keep request threads off one lock) and added to the daily
+    # counters this often.
+    VIEW_FLUSH_SECONDS = float(os.getenv("VIEW_FLUSH_SECONDS", "10"))
+    VIEW_COUNTER_SHARDS = int(os.getenv("VIEW_COUNTER_SHARDS", "16"))
+
+    # Related pages: the top K by TF-IDF cosine scoring at least
+    # RELATED_MIN_SCORE, scored in blocks of about RELATED_BATCH_CELLS
+    # similarities (8 bytes each) at a time.
+    RELATED_TOP_K = int(os.getenv("RELATED_TOP_K", "10"))
+    RELATED_MIN_SCORE = float(os.getenv("RELATED_MIN_SCORE", "0.05"))
+    RELATED_BATCH_CELLS = int(os.getenv("RELATED_BATCH_CELLS", "4000000"))
+
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true") == "true"
+
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500"))
+    SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true") == "true"
+    SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+    # Distinct statements waiting for an EXPLAIN; more are not explained
+    SLOW_QUERY_EXPLAIN_QUEUE = int(os.getenv("SLOW_QUERY_EXPLAIN_QUEUE", "16"))
+
+    OTEL_ENABLED = os.getenv("OTEL_ENABLED", "false") == "true"
+    OTEL_EXPORTER = os.getenv("OTEL_EXPORTER", "otlp")  # otlp | console | memory
+    OTEL_EXPORTER_OTLP_ENDPOINT = os.getenv(
+        "OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+    )
+    OTEL_SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "eduwise-api")
+
 settings = Settings()
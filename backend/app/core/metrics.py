@@ -0,0 +1,152 @@
+import os
+import time
+
+from anyio import to_thread
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+# Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR
+# and /metrics merges them, whichever worker serves the scrape.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+# ======================================================
+# Metric definitions
+# ======================================================
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests by route template and status",
+    ["method", "route", "status"],
+)
+REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "5xx responses and unhandled exceptions",
+    ["method", "route"],
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled",
+    multiprocess_mode="livesum",
+)
+
+THREADPOOL_BUSY = Gauge(
+    "threadpool_busy_threads",
+    "Threads borrowed from the anyio pool that runs sync endpoints",
+    multiprocess_mode="livesum",
+)
+THREADPOOL_CAPACITY = Gauge(
+    "threadpool_capacity_threads",
+    "Size of the anyio thread pool",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the SQLAlchemy pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size_connections",
+    "Configured SQLAlchemy pool size",
+    multiprocess_mode="livesum",
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache name and result (hit / miss)",
+    ["cache", "result"],
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+# ======================================================
+# ASGI middleware
+# ======================================================
+
+class MetricsMiddleware:
+    """
+    Records latency / status per route template.
+
+    Labelled children are memoised so the hot path is a dict lookup plus
+    the observation itself.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._latency: dict[tuple[str, str], object] = {}
+        self._requests: dict[tuple[str, str, str], object] = {}
+
+    def _observe(self, method: str, route: str, status: int, duration: float) -> None:
+        key = (method, route)
+        latency = self._latency.get(key)
+        if latency is None:
+            latency = self._latency[key] = REQUEST_LATENCY.labels(method, route)
+        latency.observe(duration)
+
+        status_key = (method, route, str(status))
+        counter = self._requests.get(status_key)
+        if counter is None:
+            counter = self._requests[status_key] = REQUESTS.labels(*status_key)
+        counter.inc()
+
+        if status >= 500:
+            REQUEST_ERRORS.labels(method, route).inc()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            return await self.app(scope, receive, send)
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            IN_FLIGHT.dec()
+            route = scope.get("route")
+            # Unmatched paths share one label to keep cardinality bounded.
+            route_path = getattr(route, "path", "unmatched")
+            self._observe(scope["method"], route_path, status_code, duration)
+
+            limiter = to_thread.current_default_thread_limiter()
+            THREADPOOL_BUSY.set(limiter.borrowed_tokens)
+            THREADPOOL_CAPACITY.set(limiter.total_tokens)
+
+
+# ======================================================
+# /metrics
+# ======================================================
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
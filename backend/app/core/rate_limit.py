@@ -0,0 +1,327 @@
+import ipaddress
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.core.security import decode_access_token
+
+
+# ======================================================
+# Policies
+# ======================================================
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    Token bucket policy matched against a request.
+
+    - `capacity` is the burst size, `refill_per_second` the sustained rate.
+    - `key` is "ip" or "principal" (JWT `sub`, falling back to the IP).
+    - `charge` is "request" (every call costs a token) or "failure"
+      (only 4xx responses cost a token; used for brute-force protection).
+    """
+    name: str
+    path_prefix: str
+    capacity: int
+    refill_per_second: float
+    methods: frozenset[str] = frozenset()
+    key: str = "principal"
+    charge: str = "request"
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods and method not in self.methods:
+            return False
+        return path.startswith(self.path_prefix)
+
+    @property
+    def idle_ttl(self) -> float:
+        # After this long without hits a bucket is full again, so
+        # forgetting it is indistinguishable from keeping it.
+        return self.capacity / self.refill_per_second
+
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# First matching policy wins.
+DEFAULT_POLICIES = [
+    RateLimitPolicy(
+        name="login",
+        path_prefix="/api/v1/auth/login",
+        methods=frozenset({"POST"}),
+        capacity=5,
+        refill_per_second=5 / 300,
+        key="ip",
+        charge="failure",
+    ),
+    RateLimitPolicy(
+        name="signup",
+        path_prefix="/api/v1/users/",
+        methods=frozenset({"POST"}),
+        capacity=5,
+        refill_per_second=5 / 3600,
+        key="ip",
+    ),
+    RateLimitPolicy(
+        name="write",
+        path_prefix="/api/v1/",
+        methods=WRITE_METHODS,
+        capacity=60,
+        refill_per_second=1.0,
+    ),
+    RateLimitPolicy(
+        name="read",
+        path_prefix="/api/v1/",
+        methods=frozenset({"GET"}),
+        capacity=120,
+        refill_per_second=20.0,
+    ),
+]
+
+
+# ======================================================
+# Backends
+# ======================================================
+
+class MemoryBackend:
+    """
+    In-process token buckets.
+
+    Each key stores only `(tokens, last_refill)`. Buckets are kept in one
+    OrderedDict per idle TTL, by last access, so in each of them the head
+    is the first to expire and idle buckets are evicted from the heads in
+    amortised O(1) on every call.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: dict[float, OrderedDict[str, tuple[float, float]]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _evict(self, now: float) -> None:
+        for ttl, buckets in self._buckets.items():
+            while buckets and now - next(iter(buckets.values()))[1] >= ttl:
+                buckets.popitem(last=False)
+                self._size -= 1
+        while self._size > self.max_keys:
+            # Over the cap: drop the least recently used bucket of any TTL
+            oldest = min(
+                (b for b in self._buckets.values() if b),
+                key=lambda b: next(iter(b.values()))[1],
+            )
+            oldest.popitem(last=False)
+            self._size -= 1
+
+    def _refill(self, key: str, policy: RateLimitPolicy, now: float) -> float:
+        bucket = self._buckets.get(policy.idle_ttl, {}).get(key)
+        if bucket is None:
+            return float(policy.capacity)
+        tokens, last = bucket
+        return min(
+            policy.capacity,
+            tokens + (now - last) * policy.refill_per_second,
+        )
+
+    async def peek(self, key: str, policy: RateLimitPolicy) -> float:
+        now = time.monotonic()
+        with self._lock:
+            return self._refill(key, policy, now)
+
+    async def consume(
+        self, key: str, policy: RateLimitPolicy, cost: float = 1.0
+    ) -> tuple[bool, float]:
+        """
+        Take `cost` tokens. Returns (allowed, tokens_left).
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._refill(key, policy, now)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            buckets = self._buckets.setdefault(policy.idle_ttl, OrderedDict())
+            if key not in buckets:
+                self._size += 1
+            buckets[key] = (tokens, now)
+            buckets.move_to_end(key)
+            self._evict(now)
+        return allowed, tokens
+
+
+# Atomic token bucket. The hash expires once the bucket would be full
+# again, so idle keys disappear without a sweeper.
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    allowed = 1
+    tokens = tokens - cost
+end
+
+if cost > 0 then
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil((capacity / rate) * 1000))
+end
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBackend:
+    """
+    Token buckets shared by all workers through Redis.
+
+    `client` is a `redis.asyncio.Redis` (or `fakeredis.FakeAsyncRedis`).
+    """
+
+    def __init__(self, client, prefix: str = "ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_TOKEN_BUCKET_LUA)
+
+    async def _run(self, key, policy, cost):
+        allowed, tokens = await self._script(
+            keys=[self.prefix + key],
+            args=[policy.capacity, policy.refill_per_second, time.time(), cost],
+        )
+        return bool(allowed), float(tokens)
+
+    async def peek(self, key: str, policy: RateLimitPolicy) -> float:
+        _, tokens = await self._run(key, policy, 0)
+        return tokens
+
+    async def consume(
+        self, key: str, policy: RateLimitPolicy, cost: float = 1.0
+    ) -> tuple[bool, float]:
+        return await self._run(key, policy, cost)
+
+
+def get_backend():
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        from redis import asyncio as aioredis
+
+        return RedisBackend(aioredis.from_url(settings.REDIS_URL))
+    return MemoryBackend()
+
+
+# ======================================================
+# ASGI middleware
+# ======================================================
+
+def _trusted(ip: str) -> bool:
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return any(address in network for network in settings.TRUSTED_PROXIES)
+
+
+def _client_ip(scope) -> str:
+    """
+    The peer address, or, when the peer is a trusted proxy, the nearest
+    X-Forwarded-For hop that is not one (each proxy appends the address
+    it received the request from, so only the right end can be believed).
+    """
+    client = scope.get("client")
+    ip = client[0] if client else "unknown"
+    if not settings.TRUSTED_PROXIES or not _trusted(ip):
+        return ip
+    forwarded = ",".join(
+        value.decode("latin-1")
+        for name, value in scope.get("headers", ())
+        if name == b"x-forwarded-for"
+    )
+    for hop in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+        ip = hop
+        if not _trusted(hop):
+            break
+    return ip
+
+
+def _principal(scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                payload = decode_access_token(token)
+                if payload and payload.get("sub") is not None:
+                    return f"user:{payload['sub']}"
+            break
+    return f"ip:{_client_ip(scope)}"
+
+
+class RateLimitMiddleware:
+    """
+    Rejects requests with 429 once the matching policy's bucket is empty.
+    """
+
+    def __init__(self, app, policies=None, backend=None):
+        self.app = app
+        self.policies = DEFAULT_POLICIES if policies is None else policies
+        self.backend = backend or get_backend()
+
+    def _match(self, method: str, path: str) -> RateLimitPolicy | None:
+        for policy in self.policies:
+            if policy.matches(method, path):
+                return policy
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        policy = self._match(scope["method"], scope["path"])
+        if policy is None:
+            return await self.app(scope, receive, send)
+
+        who = f"ip:{_client_ip(scope)}" if policy.key == "ip" else _principal(scope)
+        key = f"{policy.name}:{who}"
+
+        if policy.charge == "failure":
+            if await self.backend.peek(key, policy) < 1:
+                return await self._reject(send, policy)
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and 400 <= message["status"] < 500:
+                    await self.backend.consume(key, policy)
+                await send(message)
+
+            return await self.app(scope, receive, send_wrapper)
+
+        allowed, _ = await self.backend.consume(key, policy)
+        if not allowed:
+            return await self._reject(send, policy)
+        return await self.app(scope, receive, send)
+
+    async def _reject(self, send, policy: RateLimitPolicy):
+        retry_after = math.ceil(1 / policy.refill_per_second)
+        body = json.dumps({"detail": "Too many requests"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,67 @@
+import os
+import tempfile
+
+from app.core.config import settings
+
+# Keys are content hashes, so a stored file never changes.
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+# ======================================================
+# Backends
+# ======================================================
+
+class LocalStorage:
+    """Files under MEDIA_ROOT, served by the app itself (see main.py) or a proxy."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def save(self, key: str, data: bytes, content_type: str) -> None:
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so readers never see a half-written file.
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+
+class S3Storage:
+    """
+    An S3 bucket, or anything speaking its API (MinIO, R2, ...) via
+    MEDIA_S3_ENDPOINT_URL. MEDIA_URL is where the bucket is served from.
+    """
+
+    def __init__(self, client, bucket: str):
+        self.client = client
+        self.bucket = bucket
+
+    def save(self, key: str, data: bytes, content_type: str) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            CacheControl=IMMUTABLE,
+        )
+
+
+def get_storage():
+    if settings.MEDIA_STORAGE == "s3":
+        import boto3
+
+        client = boto3.client("s3", endpoint_url=settings.MEDIA_S3_ENDPOINT_URL)
+        return S3Storage(client, settings.MEDIA_S3_BUCKET)
+    return LocalStorage(settings.MEDIA_ROOT)
+
+
+_storage = None
+
+
+def media_storage():
+    # Created on first use so importing the app never opens a connection.
+    global _storage
+    if _storage is None:
+        _storage = get_storage()
+    return _storage
@@ -0,0 +1,130 @@
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger("app.request")
+
+
+class RequestStats:
+    """
+    Per-request counters filled in by the middleware and the engine hooks.
+    """
+    __slots__ = ("scope", "start", "db_time", "db_count", "spans")
+
+    def __init__(self, scope: dict | None = None):
+        self.scope = scope or {}
+        self.start = time.perf_counter()
+        self.db_time = 0.0
+        self.db_count = 0
+        self.spans: dict[str, float] = {}
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    @property
+    def method(self) -> str | None:
+        return self.scope.get("method")
+
+    @property
+    def route(self) -> str | None:
+        """
+        Route template once routing has happened, raw path before that.
+        """
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path")
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current.get()
+
+
+def record_query(duration: float) -> None:
+    """
+    Called from `after_cursor_execute` for every statement.
+    """
+    stats = _current.get()
+    if stats is not None:
+        stats.db_time += duration
+        stats.db_count += 1
+
+
+@contextmanager
+def measure(name: str):
+    """
+    Usage:
+    with measure("auth"):
+        ...
+    """
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.spans[name] = stats.spans.get(name, 0.0) + time.perf_counter() - start
+
+
+def _server_timing(stats: RequestStats, total: float) -> bytes:
+    parts = [
+        f"total;dur={total * 1000:.1f}",
+        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.db_count} queries"',
+    ]
+    # Named spans (e.g. auth) overlap with db/app; they are a breakdown,
+    # not an extra slice of the total.
+    for name, duration in stats.spans.items():
+        parts.append(f"{name};dur={duration * 1000:.1f}")
+    # Everything outside the DB: validation, business logic, serialization.
+    parts.append(f"app;dur={max(total - stats.db_time, 0.0) * 1000:.1f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class TimingMiddleware:
+    """
+    Adds a `Server-Timing` header (total / db / app) to every HTTP response
+    and writes one JSON log line per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(stats, stats.elapsed)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            logger.info(json.dumps({
+                "event": "request",
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": stats.route,
+                "status": status_code,
+                "duration_ms": round(stats.elapsed * 1000, 2),
+                "db_ms": round(stats.db_time * 1000, 2),
+                "db_queries": stats.db_count,
+                **{f"{k}_ms": round(v * 1000, 2) for k, v in stats.spans.items()},
+            }))
@@ -0,0 +1,220 @@
+import functools
+import inspect
+
+from app.core.config import settings
+
+# Set by setup_tracing(). While it is None every hook below returns after a
+# single global lookup, and the opentelemetry packages are never imported.
+_tracer = None
+_provider = None
+_extract = None
+_SpanKind = None
+_StatusCode = None
+
+
+def setup_tracing(exporter: str | None = None):
+    """
+    Install a tracer provider for this process.
+
+    exporter: "otlp" (default, OTLP over HTTP), "console" or "memory".
+    Returns the span exporter; tests read spans back from the in-memory one.
+    """
+    global _tracer, _provider, _extract, _SpanKind, _StatusCode
+
+    from opentelemetry.propagate import extract
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.trace import SpanKind, StatusCode
+
+    exporter = exporter or settings.OTEL_EXPORTER
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME})
+    )
+
+    if exporter == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        span_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    elif exporter == "console":
+        span_exporter = ConsoleSpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    else:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        span_exporter = OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+        provider.add_span_processor(BatchSpanProcessor(span_exporter))
+
+    _provider = provider
+    _extract, _SpanKind, _StatusCode = extract, SpanKind, StatusCode
+    _tracer = provider.get_tracer("app")
+    return span_exporter
+
+
+def shutdown_tracing() -> None:
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = _provider = None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+# ======================================================
+# Service / CRUD spans
+# ======================================================
+
+def _set_call_attributes(span, entity: str, id_arg: str, params, args, kwargs) -> None:
+    span.set_attribute("app.entity.type", entity)
+    for name, value in (*zip(params, args), *kwargs.items()):
+        if name in (id_arg, "id") and isinstance(value, int):
+            span.set_attribute("app.entity.id", value)
+        elif name.endswith("_id") and isinstance(value, int):
+            span.set_attribute(f"app.{name}", value)
+        elif name == "slug" and isinstance(value, str):
+            span.set_attribute("app.entity.slug", value)
+        elif name in ("payload", "obj_in", "db_obj"):
+            slug = getattr(value, "slug", None)
+            if isinstance(slug, str):
+                span.set_attribute("app.entity.slug", slug)
+            ident = getattr(value, "id", None)
+            if isinstance(ident, int):
+                span.set_attribute("app.entity.id", ident)
+
+
+def traced(entity: str, id_arg: str | None = None, name: str | None = None):
+    """
+    Usage:
+    @traced("topic")
+    def update_topic(db, topic_id, payload): ...
+
+    Records entity type, the entity id (`<entity>_id` or `id_arg`), parent
+    ids and the slug from the arguments, and the id of a returned row.
+    """
+    id_arg = id_arg or f"{entity}_id"
+
+    def decorator(fn):
+        span_name = name or fn.__qualname__
+        params = tuple(inspect.signature(fn).parameters)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+
+            with _tracer.start_as_current_span(span_name) as span:
+                _set_call_attributes(span, entity, id_arg, params, args, kwargs)
+                result = fn(*args, **kwargs)
+                ident = getattr(result, "id", None)
+                if isinstance(ident, int):
+                    span.set_attribute("app.entity.id", ident)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def traced_methods(entity: str, id_arg: str | None = None):
+    """
+    Class decorator for the CRUD singletons: wraps every public method,
+    including the ones inherited from CRUDBase.
+    """
+    def decorator(cls):
+        for attr, value in inspect.getmembers(cls, inspect.isfunction):
+            if not attr.startswith("_"):
+                wrapped = traced(entity, id_arg, name=f"{cls.__name__}.{attr}")(value)
+                setattr(cls, attr, wrapped)
+        return cls
+
+    return decorator
+
+
+# ======================================================
+# SQL spans (driven by the engine hooks in app.db.instrumentation)
+# ======================================================
+
+def start_sql_span(conn, statement: str):
+    if _tracer is None:
+        return None
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else "SQL"
+    return _tracer.start_span(
+        operation,
+        kind=_SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": statement,
+        },
+    )
+
+
+def end_sql_span(span, error: BaseException | None = None) -> None:
+    if span is None:
+        return
+    if error is not None:
+        span.record_exception(error)
+        span.set_status(_StatusCode.ERROR, str(error))
+    span.end()
+
+
+# ======================================================
+# ASGI middleware (request spans)
+# ======================================================
+
+class TracingMiddleware:
+    """
+    One SERVER span per request, continuing an incoming `traceparent`.
+    Renamed to the route template once routing has happened.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if _tracer is None or scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with _tracer.start_as_current_span(
+            method,
+            context=_extract(carrier),
+            kind=_SpanKind.SERVER,
+            attributes={"http.method": method, "http.target": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+                for key, value in scope.get("path_params", {}).items():
+                    if isinstance(value, (str, int)):
+                        attr = "app.entity.slug" if key == "slug" else f"app.{key}"
+                        span.set_attribute(attr, value)
+                span.set_attribute("http.status_code", status_code)
+                if status_code >= 500:
+                    span.set_status(_StatusCode.ERROR)
@@ -1,11 +1,300 @@
+from functools import cached_property
+from typing import Any, Generic, Iterable, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Integer, case, column, delete, insert, null, select, update, values
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.crud.crud_content_block import BLOCK_OWNERS, crud_content_block
+from app.crud.crud_tree import PATH_LEVELS, crud_tree
+from app.db.base import Base
+from app.db.events import record_changes
+
+ModelType = TypeVar("ModelType", bound=Base)
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+
+class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    Writes are single `INSERT / UPDATE ... RETURNING` statements: the row
+    comes back with its server-side defaults (id, timestamps) and is put
+    in the identity map, so there is no refresh SELECT after the commit.
+
+    Every write takes `commit=False` so a service can group several of
+    them into one transaction.
+    """
+
+    # Column holding the direct parent's id (e.g. "module_id" for topics).
+    parent_key: str | None = None
 
-class CRUDBase:
-    def __init__(self, model):
+    def __init__(self, model: type[ModelType], entity: str):
         self.model = model
+        self.entity = entity
+
+    @cached_property
+    def _collections(self) -> list[str]:
+        # Resolved on first write, once every mapper is configured.
+        return [rel.key for rel in self.model.__mapper__.relationships if rel.uselist]
+
+    # ---------- helpers ----------
+    def _values(self, obj_in: BaseModel | dict[str, Any], **dump) -> dict[str, Any]:
+        if isinstance(obj_in, dict):
+            return obj_in
+        return obj_in.model_dump(**dump)
+
+    def _with_path(self, values: dict[str, Any]) -> dict[str, Any]:
+        if self.entity not in PATH_LEVELS:
+            return values
+        return {**values, "path": crud_tree.build_path(self.entity, values)}
+
+    def _moves(self, db: Session, db_obj: ModelType, values: dict[str, Any]) -> bool:
+        # A new direct parent brings its own ancestors (and a new path);
+        # the caller checks that the parent exists.
+        if not self.parent_key:
+            return False
+        new_parent = values.pop(self.parent_key, None)
+        old_parent = getattr(db_obj, self.parent_key)
+        if new_parent is None or new_parent == old_parent:
+            return False
+        # The parent it leaves changes too (child counts, listings)
+        record_changes(db, self.parent_key.removesuffix("_id"), [old_parent], "updated")
+        values.update(crud_tree.parent_ids(db, self.entity, new_parent))
+        values.update(self._with_path(values))
+        return True
+
+    def _split_blocks(self, values: dict[str, Any]) -> tuple[dict[str, Any], list | None]:
+        # With CONTENT_STORAGE=blocks, `content` goes to content_blocks
+        # and the JSON column is cleared.
+        if (
+            settings.CONTENT_STORAGE != "blocks"
+            or self.entity not in BLOCK_OWNERS
+            or "content" not in values
+        ):
+            return values, None
+        values = dict(values)
+        blocks = values.pop("content") or []
+        return values, blocks
+
+    def _store_blocks(self, db: Session, obj: ModelType, blocks: list | None) -> None:
+        if blocks is None:
+            return
+        crud_content_block.replace(db, self.entity, obj.id, blocks)
+        # The response still shows what was written
+        set_committed_value(obj, "content", blocks)
+
+    def load_blocks(self, db: Session, objs: list[ModelType]) -> list[ModelType]:
+        """
+        Put `content` kept in content_blocks back on rows read whole (one
+        query for all of them); rows still holding it in the column keep it.
+        """
+        if settings.CONTENT_STORAGE != "blocks" or self.entity not in BLOCK_OWNERS:
+            return objs
+        missing = [obj for obj in objs if obj.content is None]
+        if missing:
+            blocks = crud_content_block.get_for_owners(db, self.entity, [obj.id for obj in missing])
+            for obj in missing:
+                if obj.id in blocks:
+                    set_committed_value(obj, "content", blocks[obj.id])
+        return objs
 
-    def create(self, db: Session, obj):
-        db.add(obj)
-        db.commit()
-        db.refresh(obj)
+    def _mark_new(self, objs: list[ModelType]) -> list[ModelType]:
+        # A row that was just inserted has no children yet; saying so
+        # saves a lazy-load SELECT per collection when it is serialised.
+        for obj in objs:
+            for key in self._collections:
+                set_committed_value(obj, key, [])
+        return objs
+
+    def _finish(
+        self, db: Session, ids: Iterable[int], op: str, commit: bool, fields=None
+    ) -> None:
+        record_changes(db, self.entity, ids, op, fields)
+        if commit:
+            db.commit()
+
+    # ---------- reads ----------
+    def get(self, db: Session, id: int) -> ModelType | None:
+        return db.get(self.model, id)
+
+    def get_fields(self, db: Session, id: int, fields: list[str], for_update: bool = False):
+        """
+        Just these columns of one row, or None. `for_update` locks the row
+        until commit (a read-modify-write of a few columns).
+        """
+        columns = [getattr(self.model, field) for field in fields]
+        stmt = select(self.model.id, *columns).where(self.model.id == id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        return db.execute(stmt).first()
+
+    # ---------- writes ----------
+    def create(
+        self,
+        db: Session,
+        obj_in: CreateSchemaType | dict[str, Any],
+        commit: bool = True,
+    ) -> ModelType:
+        # Unset optionals are left out so column defaults apply.
+        values = self._with_path(self._values(obj_in, exclude_none=True))
+        values, blocks = self._split_blocks(values)
+        obj = db.scalars(insert(self.model).returning(self.model), [values]).one()
+        self._mark_new([obj])
+        self._store_blocks(db, obj, blocks)
+        self._finish(db, [obj.id], "created", commit)
+        return obj
+
+    def create_many(
+        self,
+        db: Session,
+        objs_in: list[CreateSchemaType | dict[str, Any]],
+        commit: bool = True,
+    ) -> list[ModelType]:
+        if not objs_in:
+            return []
+        rows, blocks = zip(*(
+            self._split_blocks(self._with_path(self._values(obj_in, exclude_none=True)))
+            for obj_in in objs_in
+        ))
+        objs = db.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            list(rows),
+        ).all()
+        self._mark_new(objs)
+        for obj, obj_blocks in zip(objs, blocks):
+            self._store_blocks(db, obj, obj_blocks)
+        self._finish(db, [obj.id for obj in objs], "created", commit)
+        return objs
+
+    def update(
+        self,
+        db: Session,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType | dict[str, Any],
+        commit: bool = True,
+    ) -> ModelType:
+        values = dict(self._values(obj_in, exclude_unset=True))
+        moved = self._moves(db, db_obj, values)
+        values, blocks = self._split_blocks(values)
+        if blocks is not None:
+            values["content"] = null()
+        if not values:
+            return self.load_blocks(db, [db_obj])[0]
+        # Refreshes db_obj in place from the RETURNING row.
+        obj = db.scalars(
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**values)
+            .returning(self.model)
+        ).one()
+        if moved:
+            crud_tree.move_subtree(db, self.entity, obj)
+        if blocks is None:
+            self.load_blocks(db, [obj])
+        else:
+            self._store_blocks(db, obj, blocks)
+        self._finish(db, [obj.id], "updated", commit, values)
         return obj
+
+    def update_fields(
+        self,
+        db: Session,
+        id: int,
+        values: dict[str, Any],
+        commit: bool = True,
+    ):
+        """
+        UPDATE only `values` on one row without loading it; returns
+        updated_at plus those columns.
+        """
+        columns = [getattr(self.model, field) for field in values]
+        row = db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model.updated_at, *columns),
+            execution_options={"synchronize_session": False},
+        ).one()
+        self._finish(db, [id], "updated", commit, values)
+        return row
+
+    def update_many(
+        self,
+        db: Session,
+        rows: list[dict[str, Any]],
+        commit: bool = True,
+    ) -> None:
+        """
+        Bulk UPDATE by primary key: every dict carries "id" plus the
+        columns to set. Rows sharing the same keys go out as one
+        executemany.
+        """
+        if not rows:
+            return
+        db.execute(update(self.model), rows)
+        fields = {key for row in rows for key in row} - {"id"}
+        self._finish(db, [row["id"] for row in rows], "updated", commit, fields)
+
+    def soft_delete(self, db: Session, db_obj: ModelType, commit: bool = True) -> None:
+        db.execute(
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(is_active=False)
+        )
+        self._finish(db, [db_obj.id], "updated", commit, {"is_active"})
+
+    def delete(self, db: Session, db_obj: ModelType, commit: bool = True) -> None:
+        db.execute(delete(self.model).where(self.model.id == db_obj.id))
+        self._finish(db, [db_obj.id], "deleted", commit)
+
+    def reorder(
+        self,
+        db: Session,
+        parent_id: int,
+        ids: list[int],
+        commit: bool = True,
+    ) -> set[int]:
+        """
+        Set order_index = position in `ids` for children of `parent_id`,
+        in one statement. Returns the ids actually updated; ids that do
+        not belong to the parent are left alone, so a caller validating
+        the list passes commit=False and rolls back on a mismatch.
+        """
+        parent = getattr(self.model, self.parent_key)
+        if db.get_bind().dialect.name == "postgresql":
+            new_order = values(
+                column("id", Integer),
+                column("order_index", Integer),
+                name="new_order",
+            ).data(list(zip(ids, range(len(ids)))))
+            stmt = (
+                update(self.model)
+                .where(self.model.id == new_order.c.id, parent == parent_id)
+                .values(order_index=new_order.c.order_index)
+            )
+        else:
+            # No UPDATE ... FROM (VALUES) with column aliases elsewhere.
+            stmt = (
+                update(self.model)
+                .where(self.model.id.in_(ids), parent == parent_id)
+                .values(order_index=case(
+                    {id_: index for index, id_ in enumerate(ids)},
+                    value=self.model.id,
+                ))
+            )
+
+        updated = set(db.scalars(
+            stmt.returning(self.model.id),
+            execution_options={"synchronize_session": False},
+        ))
+        self._finish(db, updated, "updated", commit, {"order_index"})
+        return updated
+
+    def child_ids(self, db: Session, parent_id: int) -> set[int]:
+        """Ids of the active children of `parent_id`."""
+        parent = getattr(self.model, self.parent_key)
+        return set(db.scalars(
+            select(self.model.id).where(parent == parent_id, self.model.is_active.is_(True))
+        ))
@@ -0,0 +1,71 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.content_block import ContentBlockRow
+
+# Entities whose `content` can live in content_blocks.
+BLOCK_OWNERS = {"topic", "sub_topic", "lesson"}
+
+
+class CRUDContentBlock:
+    def _owner(self, owner_type: str, owner_id: int):
+        return (
+            ContentBlockRow.owner_type == owner_type,
+            ContentBlockRow.owner_id == owner_id,
+        )
+
+    def count(self, db: Session, owner_type: str, owner_id: int) -> int:
+        return db.scalar(
+            select(func.count()).select_from(ContentBlockRow).where(*self._owner(owner_type, owner_id))
+        )
+
+    def get_page(self, db: Session, owner_type: str, owner_id: int, offset: int, limit: int) -> list[dict]:
+        # Primary-key range scan: (owner_type, owner_id, position)
+        return list(db.scalars(
+            select(ContentBlockRow.data)
+            .where(*self._owner(owner_type, owner_id))
+            .order_by(ContentBlockRow.position)
+            .offset(offset)
+            .limit(limit)
+        ))
+
+    def get_all(self, db: Session, owner_type: str, owner_id: int) -> list[dict] | None:
+        """Every block in order; None if this owner has no rows."""
+        blocks = self.get_page(db, owner_type, owner_id, 0, None)
+        return blocks or None
+
+    def get_for_owners(
+        self, db: Session, owner_type: str, owner_ids: list[int] | None
+    ) -> dict[int, list[dict]]:
+        """
+        Blocks of many owners (None: all of this type) in one query, by
+        owner id (owners without rows left out).
+        """
+        result: dict[int, list[dict]] = {}
+        q = select(ContentBlockRow.owner_id, ContentBlockRow.data).where(
+            ContentBlockRow.owner_type == owner_type
+        )
+        if owner_ids is not None:
+            q = q.where(ContentBlockRow.owner_id.in_(owner_ids))
+        rows = db.execute(q.order_by(ContentBlockRow.owner_id, ContentBlockRow.position))
+        for owner_id, data in rows:
+            result.setdefault(owner_id, []).append(data)
+        return result
+
+    def replace(self, db: Session, owner_type: str, owner_id: int, blocks: list[dict]) -> None:
+        """Swap in the owner's blocks (caller commits)."""
+        db.execute(delete(ContentBlockRow).where(*self._owner(owner_type, owner_id)))
+        if blocks:
+            db.execute(insert(ContentBlockRow), [
+                {
+                    "owner_type": owner_type,
+                    "owner_id": owner_id,
+                    "position": position,
+                    "type": block["type"],
+                    "data": block,
+                }
+                for position, block in enumerate(blocks)
+            ])
+
+
+crud_content_block = CRUDContentBlock()
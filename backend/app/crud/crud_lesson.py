@@ -1,19 +1,13 @@
 from sqlalchemy.orm import Session
+from app.crud.base import CRUDBase
 from app.models.lesson import Lesson
 from app.schemas.lesson import LessonCreate, LessonUpdate
+from app.core.tracing import traced_methods
 
 
-class CRUDLesson:
-
-    def create(self, db: Session, obj_in: LessonCreate) -> Lesson:
-        lesson = Lesson(**obj_in.model_dump(exclude_none=True))  # ⭐ changed
-        db.add(lesson)
-        db.commit()
-        db.refresh(lesson)
-        return lesson
-
-    def get(self, db: Session, lesson_id: int) -> Lesson | None:
-        return db.get(Lesson, lesson_id)
+@traced_methods("lesson")
+class CRUDLesson(CRUDBase[Lesson, LessonCreate, LessonUpdate]):
+    parent_key = "sub_topic_id"
 
     def get_by_slug(self, db: Session, sub_topic_id: int, slug: str) -> Lesson | None:
         return (
@@ -33,19 +27,5 @@ class CRUDLesson:
             q = q.filter(Lesson.is_active.is_(True))
         return q.order_by(Lesson.order_index).all()
 
-    def update(self, db: Session, db_obj: Lesson, obj_in: LessonUpdate) -> Lesson:
-        data = obj_in.model_dump(exclude_unset=True)
-
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
-    def soft_delete(self, db: Session, db_obj: Lesson):
-        db_obj.is_active = False
-        db.commit()
-
 
-crud_lesson = CRUDLesson()
\ No newline at end of file
+crud_lesson = CRUDLesson(Lesson, "lesson")
@@ -0,0 +1,25 @@
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.media_asset import MediaAsset
+
+
+class CRUDMedia:
+    def get(self, db: Session, id: int) -> MediaAsset | None:
+        return db.get(MediaAsset, id)
+
+    def get_by_sha(self, db: Session, sha256: str) -> MediaAsset | None:
+        return db.scalars(select(MediaAsset).where(MediaAsset.sha256 == sha256)).first()
+
+    def get_many(self, db: Session, offset: int, limit: int) -> list[MediaAsset]:
+        return db.scalars(
+            select(MediaAsset).order_by(MediaAsset.id.desc()).offset(offset).limit(limit)
+        ).all()
+
+    def create(self, db: Session, values: dict) -> MediaAsset:
+        asset = db.scalars(insert(MediaAsset).returning(MediaAsset), [values]).one()
+        db.commit()
+        return asset
+
+
+crud_media = CRUDMedia()
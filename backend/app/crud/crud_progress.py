@@ -0,0 +1,55 @@
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import Lesson, LessonProgress
+
+
+class CRUDProgress:
+    def get(self, db: Session, user_id: int, lesson_id: int) -> LessonProgress | None:
+        return db.get(LessonProgress, (user_id, lesson_id))
+
+    def upsert_many(self, db: Session, rows: list[dict]) -> None:
+        """
+        One INSERT ... ON CONFLICT for the whole batch, merged with what
+        is stored: the higher percent, completion (and its time) kept.
+        Caller commits.
+        """
+        if not rows:
+            return
+        postgres = db.get_bind().dialect.name == "postgresql"
+        stmt = (pg_insert if postgres else sqlite_insert)(LessonProgress).values(rows)
+        new, table = stmt.excluded, LessonProgress.__table__.c
+        greatest = func.greatest if postgres else func.max  # sqlite's max(a, b) is scalar
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.user_id, table.lesson_id],
+            set_={
+                "percent": greatest(table.percent, new.percent),
+                "completed": table.completed | new.completed,
+                "completed_at": func.coalesce(table.completed_at, new.completed_at),
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def by_module(self, db: Session, user_id: int, technology_id: int):
+        """
+        (module_id, total, completed) over the technology's active
+        lessons, in one grouped query.
+        """
+        progress = and_(LessonProgress.lesson_id == Lesson.id, LessonProgress.user_id == user_id)
+        return db.execute(
+            select(
+                Lesson.module_id,
+                func.count(Lesson.id).label("total"),
+                func.count(case((LessonProgress.completed.is_(True), 1))).label("completed"),
+            )
+            .outerjoin(LessonProgress, progress)
+            .where(Lesson.technology_id == technology_id, Lesson.is_active.is_(True))
+            .group_by(Lesson.module_id)
+            .order_by(Lesson.module_id)
+        ).all()
+
+
+crud_progress = CRUDProgress()
@@ -0,0 +1,58 @@
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.published import PublishedPage, PublishedRoadmap
+
+
+class CRUDPublished:
+    # ---------- live versions ----------
+    def get(self, db: Session, roadmap_id: int) -> PublishedRoadmap | None:
+        return db.get(PublishedRoadmap, roadmap_id)
+
+    def get_by_slug(self, db: Session, slug: str) -> PublishedRoadmap | None:
+        return db.scalars(select(PublishedRoadmap).where(PublishedRoadmap.slug == slug)).first()
+
+    def get_all(self, db: Session) -> list[PublishedRoadmap]:
+        return db.scalars(select(PublishedRoadmap).order_by(PublishedRoadmap.title)).all()
+
+    def set_live(self, db: Session, roadmap_id: int, values: dict) -> PublishedRoadmap:
+        """Point the roadmap at a new version (caller commits)."""
+        if self.get(db, roadmap_id) is None:
+            stmt = insert(PublishedRoadmap).values(roadmap_id=roadmap_id, **values)
+        else:
+            stmt = (
+                update(PublishedRoadmap)
+                .where(PublishedRoadmap.roadmap_id == roadmap_id)
+                .values(**values)
+            )
+        return db.scalars(stmt.returning(PublishedRoadmap)).one()
+
+    def remove(self, db: Session, roadmap_id: int) -> None:
+        """Take the roadmap offline, all versions included (caller commits)."""
+        self.prune(db, roadmap_id, keep_from=None)
+        db.execute(delete(PublishedRoadmap).where(PublishedRoadmap.roadmap_id == roadmap_id))
+
+    # ---------- pages ----------
+    def get_page(self, db: Session, roadmap_id: int, version: int, path: str):
+        """(entity, entity_id, body) of one page, None if there is no such page."""
+        return db.execute(
+            select(PublishedPage.entity, PublishedPage.entity_id, PublishedPage.body).where(
+                PublishedPage.roadmap_id == roadmap_id,
+                PublishedPage.version == version,
+                PublishedPage.path == path,
+            )
+        ).first()
+
+    def add_pages(self, db: Session, rows: list[dict]) -> None:
+        if rows:
+            db.execute(insert(PublishedPage), rows)
+
+    def prune(self, db: Session, roadmap_id: int, keep_from: int | None) -> None:
+        """Drop the pages of versions older than `keep_from` (None: all of them)."""
+        stmt = delete(PublishedPage).where(PublishedPage.roadmap_id == roadmap_id)
+        if keep_from is not None:
+            stmt = stmt.where(PublishedPage.version < keep_from)
+        db.execute(stmt)
+
+
+crud_published = CRUDPublished()
@@ -0,0 +1,48 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.reading_order import ReadingOrder
+
+
+# First key of this table's advisory locks (the second is the technology)
+LOCK_SPACE = 3901
+
+
+class CRUDReadingOrder:
+    def lock(self, db: Session, technology_id: int) -> None:
+        """
+        Hold a technology's sequence until commit, so rebuilds of it run
+        one after another (Postgres advisory lock; SQLite already has a
+        single writer).
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(select(func.pg_advisory_xact_lock(LOCK_SPACE, technology_id)))
+
+    def get(self, db: Session, entity: str, entity_id: int) -> ReadingOrder | None:
+        return db.get(ReadingOrder, (entity, entity_id))
+
+    def get_neighbours(self, db: Session, technology_id: int, seq: int) -> dict[int, ReadingOrder]:
+        """Rows at seq - 1 and seq + 1 (either may be missing), by seq."""
+        rows = db.scalars(
+            select(ReadingOrder).where(
+                ReadingOrder.technology_id == technology_id,
+                ReadingOrder.seq.in_([seq - 1, seq + 1]),
+            )
+        )
+        return {row.seq: row for row in rows}
+
+    def count(self, db: Session, technology_id: int) -> int:
+        # max(seq) is an index lookup; the sequence has no gaps.
+        last = db.scalar(
+            select(func.max(ReadingOrder.seq)).where(ReadingOrder.technology_id == technology_id)
+        )
+        return 0 if last is None else last + 1
+
+    def replace(self, db: Session, technology_id: int, rows: list[dict]) -> None:
+        """Swap in a technology's whole sequence (caller commits)."""
+        db.execute(delete(ReadingOrder).where(ReadingOrder.technology_id == technology_id))
+        if rows:
+            db.execute(insert(ReadingOrder), rows)
+
+
+crud_reading_order = CRUDReadingOrder()
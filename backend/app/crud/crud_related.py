@@ -0,0 +1,122 @@
+from collections import defaultdict
+
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.related_content import RelatedContent, RelatedModel, RelatedVector
+
+
+def _keys(entity_col, id_col, keys) -> list:
+    # (entity, id) pairs as one IN per entity
+    by_entity: dict[str, list[int]] = defaultdict(list)
+    for entity, entity_id in keys:
+        by_entity[entity].append(entity_id)
+    return [and_(entity_col == entity, id_col.in_(ids)) for entity, ids in by_entity.items()]
+
+
+# Advisory lock held while related content (and its model) is rewritten
+LOCK_KEY = 3902
+
+
+class CRUDRelated:
+    def lock(self, db: Session) -> None:
+        """
+        Held until commit, so rebuilds and refreshes run one after another
+        (Postgres advisory lock; SQLite already has a single writer).
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(select(func.pg_advisory_xact_lock(LOCK_KEY)))
+
+    def get(self, db: Session, entity: str, entity_id: int) -> list[RelatedContent]:
+        # Primary-key range scan: (entity, entity_id, rank)
+        return db.scalars(
+            select(RelatedContent)
+            .where(RelatedContent.entity == entity, RelatedContent.entity_id == entity_id)
+            .order_by(RelatedContent.rank)
+        ).all()
+
+    def get_many(self, db: Session, keys: set[tuple[str, int]]) -> dict[tuple[str, int], list[RelatedContent]]:
+        """Neighbours of many pages in one query, by (entity, id), best first."""
+        result: dict[tuple[str, int], list[RelatedContent]] = defaultdict(list)
+        if not keys:
+            return result
+        rows = db.scalars(
+            select(RelatedContent)
+            .where(or_(*_keys(RelatedContent.entity, RelatedContent.entity_id, keys)))
+            .order_by(RelatedContent.entity, RelatedContent.entity_id, RelatedContent.rank)
+        )
+        for row in rows:
+            result[(row.entity, row.entity_id)].append(row)
+        return result
+
+    def pointing_at(self, db: Session, keys: set[tuple[str, int]]) -> set[tuple[str, int]]:
+        """Pages having any of these pages among their neighbours."""
+        if not keys:
+            return set()
+        rows = db.execute(
+            select(RelatedContent.entity, RelatedContent.entity_id)
+            .where(or_(*_keys(RelatedContent.related_entity, RelatedContent.related_id, keys)))
+            .distinct()
+        )
+        return {(row.entity, row.entity_id) for row in rows}
+
+    def thresholds(self, db: Session) -> dict[tuple[str, int], tuple[int, float]]:
+        """(neighbours stored, lowest score) per page that has any."""
+        rows = db.execute(
+            select(
+                RelatedContent.entity,
+                RelatedContent.entity_id,
+                func.count().label("count"),
+                func.min(RelatedContent.score).label("lowest"),
+            ).group_by(RelatedContent.entity, RelatedContent.entity_id)
+        )
+        return {(row.entity, row.entity_id): (row.count, row.lowest) for row in rows}
+
+    def replace(self, db: Session, keys: set[tuple[str, int]] | None, rows: list[dict]) -> None:
+        """
+        Swap in the neighbours of these pages (None: of every page).
+        Caller commits.
+        """
+        stmt = delete(RelatedContent)
+        if keys is not None:
+            if not keys:
+                return
+            stmt = stmt.where(or_(*_keys(RelatedContent.entity, RelatedContent.entity_id, keys)))
+        db.execute(stmt)
+        if rows:
+            db.execute(insert(RelatedContent), rows)
+
+    def head(self, db: Session) -> RelatedModel | None:
+        # Re-read, the row changes under other workers' refreshes
+        return db.scalars(select(RelatedModel).execution_options(populate_existing=True)).first()
+
+    def vectors(self, db: Session, generation: str, after: int | None = None) -> list[RelatedVector]:
+        """Page vectors of a model, or only those written after refresh `after`."""
+        q = select(RelatedVector).where(RelatedVector.generation == generation)
+        if after is not None:
+            q = q.where(RelatedVector.seq > after)
+        return db.scalars(q.order_by(RelatedVector.entity, RelatedVector.entity_id)).all()
+
+    def replace_model(self, db: Session, model: dict, vectors: list[dict]) -> None:
+        """Swap in a new generation with all its vectors. Caller commits."""
+        db.execute(delete(RelatedVector))
+        db.execute(delete(RelatedModel))
+        db.execute(insert(RelatedModel), [model])
+        if vectors:
+            db.execute(insert(RelatedVector), vectors)
+
+    def replace_vectors(self, db: Session, head: RelatedModel, vectors: list[dict]) -> int:
+        """
+        Write these pages' vectors as the next refresh of `head`; returns
+        its seq. Caller commits.
+        """
+        seq = head.seq + 1
+        db.execute(update(RelatedModel).where(RelatedModel.generation == head.generation).values(seq=seq))
+        keys = {(row["entity"], row["entity_id"]) for row in vectors}
+        if keys:
+            db.execute(delete(RelatedVector).where(or_(*_keys(RelatedVector.entity, RelatedVector.entity_id, keys))))
+            db.execute(insert(RelatedVector), [{**row, "generation": head.generation, "seq": seq} for row in vectors])
+        return seq
+
+
+crud_related = CRUDRelated()
@@ -0,0 +1,57 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.revision import Revision
+
+
+class CRUDRevision:
+    def _owner(self, owner_type: str, owner_id: int):
+        return Revision.owner_type == owner_type, Revision.owner_id == owner_id
+
+    def last_number(self, db: Session, owner_type: str, owner_id: int) -> int:
+        """Number of the owner's latest revision, 0 if it has none."""
+        last = db.scalar(select(func.max(Revision.number)).where(*self._owner(owner_type, owner_id)))
+        return last or 0
+
+    def get_many(self, db: Session, owner_type: str, owner_id: int, offset: int, limit: int):
+        # Newest first, without the (possibly large) data column
+        return db.execute(
+            select(Revision.number, Revision.is_snapshot, Revision.changed, Revision.created_at)
+            .where(*self._owner(owner_type, owner_id))
+            .order_by(Revision.number.desc())
+            .offset(offset)
+            .limit(limit)
+        ).all()
+
+    def get_chain(self, db: Session, owner_type: str, owner_id: int, number: int) -> list[Revision]:
+        """
+        The nearest snapshot at or before `number`, then every diff up to
+        `number`, in order. Empty if there is no such revision.
+        """
+        owner = self._owner(owner_type, owner_id)
+        snapshot = (
+            select(func.max(Revision.number))
+            .where(*owner, Revision.is_snapshot.is_(True), Revision.number <= number)
+            .scalar_subquery()
+        )
+        chain = db.scalars(
+            select(Revision)
+            .where(*owner, Revision.number >= snapshot, Revision.number <= number)
+            .order_by(Revision.number)
+        ).all()
+        return chain if chain and chain[-1].number == number else []
+
+    def add(self, db: Session, owner_type: str, owner_id: int, number: int,
+            is_snapshot: bool, data, changed: list[str]) -> None:
+        """Caller commits."""
+        db.execute(insert(Revision).values(
+            owner_type=owner_type,
+            owner_id=owner_id,
+            number=number,
+            is_snapshot=is_snapshot,
+            data=data,
+            changed=changed,
+        ))
+
+
+crud_revision = CRUDRevision()
@@ -1,38 +1,23 @@
-from sqlalchemy.orm import Session
-from app.models.seo_metadata import SeoMetadata
-from app.schemas.seo import SeoCreate, SeoUpdate
-
-
-class CRUDSeo:
+from typing import Any
 
-    def create(self, db: Session, obj_in: SeoCreate) -> SeoMetadata:
-        seo = SeoMetadata(**obj_in.model_dump())
-        db.add(seo)
-        db.commit()
-        db.refresh(seo)
-        return seo
+from pydantic import BaseModel
 
-    def get(self, db: Session, seo_id: int) -> SeoMetadata | None:
-        return db.get(SeoMetadata, seo_id)
-
-    def update(
-        self,
-        db: Session,
-        db_obj: SeoMetadata,
-        obj_in: SeoUpdate,
-    ) -> SeoMetadata:
-        for field, value in obj_in.model_dump(
-            exclude_unset=True
-        ).items():
-            setattr(db_obj, field, value)
+from app.crud.base import CRUDBase
+from app.models.seo_metadata import SeoMetadata
+from app.schemas.seo import SeoCreate, SeoUpdate
+from app.core.tracing import traced_methods
+from app.utils.images import image_size
 
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
 
-    def delete(self, db: Session, db_obj: SeoMetadata):
-        db.delete(db_obj)
-        db.commit()
+@traced_methods("seo")
+class CRUDSeo(CRUDBase[SeoMetadata, SeoCreate, SeoUpdate]):
+    def _values(self, obj_in: BaseModel | dict[str, Any], **dump) -> dict[str, Any]:
+        values = super()._values(obj_in, **dump)
+        # An uploaded og:image knows its own size
+        size = image_size(values.get("og_image_url"))
+        if size and not (values.get("og_image_width") and values.get("og_image_height")):
+            values = {**values, "og_image_width": size[0], "og_image_height": size[1]}
+        return values
 
 
-crud_seo = CRUDSeo()
+crud_seo = CRUDSeo(SeoMetadata, "seo")
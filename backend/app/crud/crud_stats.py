@@ -0,0 +1,40 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.crud.crud_tree import DEPTH
+from app.models.catalog_stat import CatalogStat
+
+# First key of this table's advisory locks (the second is the level)
+LOCK_SPACE = 3903
+
+
+class CRUDStats:
+    def lock(self, db: Session, entity: str) -> None:
+        """
+        Hold the rollups of one level until commit, so two refreshes
+        recount it one after the other instead of racing on the primary
+        key (Postgres advisory lock; SQLite already has a single writer).
+        Take it before counting, and levels top-down.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(select(func.pg_advisory_xact_lock(LOCK_SPACE, DEPTH[entity])))
+
+    def get_all(self, db: Session) -> list[CatalogStat]:
+        return db.scalars(
+            select(CatalogStat).order_by(CatalogStat.entity, CatalogStat.parent_id)
+        ).all()
+
+    def replace(self, db: Session, entity: str, parent_ids: set[int] | None, rows: list[dict]) -> None:
+        """
+        Swap in the rollups of these parents of `entity` (None: all of
+        them); parents left without rows are dropped. Caller commits.
+        """
+        stmt = delete(CatalogStat).where(CatalogStat.entity == entity)
+        if parent_ids is not None:
+            stmt = stmt.where(CatalogStat.parent_id.in_(parent_ids))
+        db.execute(stmt)
+        if rows:
+            db.execute(insert(CatalogStat), rows)
+
+
+crud_stats = CRUDStats()
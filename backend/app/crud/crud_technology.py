@@ -1,20 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from app.crud.base import CRUDBase
 from app.models.technology import Technology
 from app.schemas.technology import TechnologyCreate, TechnologyUpdate
+from app.core.tracing import traced_methods
 
 
-class CRUDTechnology:
-
-    # Note: Complex create logic with SEO is now handled in technology_service.py
-    def create(self, db: Session, obj_in: TechnologyCreate) -> Technology:
-        tech = Technology(**obj_in.model_dump())
-        db.add(tech)
-        db.commit()
-        db.refresh(tech)
-        return tech
-
-    def get(self, db: Session, tech_id: int) -> Technology | None:
-        return db.get(Technology, tech_id)
+@traced_methods("technology", id_arg="tech_id")
+class CRUDTechnology(CRUDBase[Technology, TechnologyCreate, TechnologyUpdate]):
+    parent_key = "roadmap_id"
 
     def get_by_slug(
         self, db: Session, roadmap_id: int, slug: str
@@ -31,7 +24,7 @@ class CRUDTechnology:
     def get_by_roadmap(
         self, db: Session, roadmap_id: int, active_only: bool = True
     ):
-        q = db.query(Technology).filter(
+        q = db.query(Technology).options(selectinload(Technology.seo)).filter(
             Technology.roadmap_id == roadmap_id
         )
         if active_only:
@@ -39,28 +32,10 @@ class CRUDTechnology:
         return q.order_by(Technology.order_index).all()
 
     def get_all(self, db: Session, active_only: bool = True):
-        q = db.query(Technology)
+        q = db.query(Technology).options(selectinload(Technology.seo))
         if active_only:
             q = q.filter(Technology.is_active.is_(True))
         return q.order_by(Technology.id.desc()).all()
 
-    # Note: Complex update logic with SEO is now handled in technology_service.py
-    def update(
-        self,
-        db: Session,
-        db_obj: Technology,
-        obj_in: TechnologyUpdate,
-    ) -> Technology:
-        for field, value in obj_in.model_dump(exclude_unset=True).items():
-            setattr(db_obj, field, value)
-
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
-    def soft_delete(self, db: Session, db_obj: Technology):
-        db_obj.is_active = False
-        db.commit()
-
 
-crud_technology = CRUDTechnology()
+crud_technology = CRUDTechnology(Technology, "technology")
@@ -1,19 +1,13 @@
 from sqlalchemy.orm import Session, selectinload
+from app.crud.base import CRUDBase
 from app.models.topic import Topic
 from app.schemas.topic import TopicCreate, TopicUpdate
+from app.core.tracing import traced_methods
 
 
-class CRUDTopic:
-
-    def create(self, db: Session, obj_in: TopicCreate) -> Topic:
-        topic = Topic(**obj_in.model_dump(exclude_none=True))  # ⭐ changed
-        db.add(topic)
-        db.commit()
-        db.refresh(topic)
-        return topic
-
-    def get(self, db: Session, topic_id: int) -> Topic | None:
-        return db.get(Topic, topic_id)
+@traced_methods("topic")
+class CRUDTopic(CRUDBase[Topic, TopicCreate, TopicUpdate]):
+    parent_key = "module_id"
 
     def get_by_slug(self, db: Session, module_id: int, slug: str) -> Topic | None:
         return (
@@ -33,19 +27,5 @@ class CRUDTopic:
             q = q.filter(Topic.is_active.is_(True))
         return q.order_by(Topic.order_index).all()
 
-    def update(self, db: Session, db_obj: Topic, obj_in: TopicUpdate) -> Topic:
-        data = obj_in.model_dump(exclude_unset=True)
-
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
-    def soft_delete(self, db: Session, db_obj: Topic):
-        db_obj.is_active = False
-        db.commit()
-
 
-crud_topic = CRUDTopic()
\ No newline at end of file
+crud_topic = CRUDTopic(Topic, "topic")
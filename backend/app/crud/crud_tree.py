@@ -0,0 +1,203 @@
+from functools import reduce
+
+from sqlalchemy import Text, and_, cast, func, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.db.events import record_changes
+from app.db.types import LTree
+from app.models import Lesson, Module, Roadmap, SubTopic, Technology, Topic
+
+# Catalog levels, top-down. Every row carries the id of each level above
+# it (a lesson has roadmap_id ... sub_topic_id), so a whole subtree is
+# addressed with one `WHERE <entity>_id = :id` per level below the root.
+LEVELS = [
+    ("roadmap", Roadmap),
+    ("technology", Technology),
+    ("module", Module),
+    ("topic", Topic),
+    ("sub_topic", SubTopic),
+    ("lesson", Lesson),
+]
+DEPTH = {name: depth for depth, (name, _) in enumerate(LEVELS)}
+
+# Levels storing a materialized `path` of their ancestors' ids ("1.4.9"
+# for a topic of module 9), so a subtree is one indexed range / `<@` scan.
+PATH_LEVELS = {"topic", "sub_topic", "lesson"}
+
+# Columns a deactivate / restore writes
+TOGGLED = ("is_active", "deactivated_by")
+
+
+class CRUDTree:
+    """
+    Cascading soft delete / restore as one UPDATE per level, in one
+    transaction (so the post-commit hooks run once for the whole subtree).
+
+    Deactivated descendants are tagged with the root ("module:3"); restore
+    only brings back rows carrying that tag, so a lesson that was already
+    switched off on its own stays off.
+
+    Also owns the materialized paths: CRUDBase asks for them on create and
+    calls `move_subtree` when a row gets a new parent.
+    """
+
+    def _subtree(self, entity: str):
+        depth = DEPTH[entity]
+        return LEVELS[depth][1], LEVELS[depth + 1:]
+
+    def _above(self, entity: str) -> list[str]:
+        return [name for name, _ in LEVELS[:DEPTH[entity]]]
+
+    def _run(self, db: Session, entity: str, model, stmt, fields, sync=False) -> int:
+        ids = list(db.scalars(
+            stmt.returning(model.id),
+            execution_options={"synchronize_session": sync},
+        ))
+        record_changes(db, entity, ids, "updated", fields)
+        return len(ids)
+
+    def inactive_parent(self, db: Session, entity: str, obj) -> str | None:
+        """Name of the direct parent level if it is switched off, else None."""
+        depth = DEPTH[entity]
+        if depth == 0:
+            return None
+        name, model = LEVELS[depth - 1]
+        parent = db.get(model, getattr(obj, f"{name}_id"))
+        return None if parent is None or parent.is_active else name
+
+    def deactivate(self, db: Session, entity: str, id: int, commit: bool = True) -> int:
+        """Soft delete a row and its active descendants; returns rows touched."""
+        root, below = self._subtree(entity)
+        tag = f"{entity}:{id}"
+
+        count = self._run(db, entity, root, (
+            update(root)
+            .where(root.id == id, root.is_active.is_(True))
+            .values(is_active=False, deactivated_by=tag)
+        ), TOGGLED)
+        for name, model in below:
+            count += self._run(db, name, model, (
+                update(model)
+                .where(getattr(model, f"{entity}_id") == id, model.is_active.is_(True))
+                .values(is_active=False, deactivated_by=tag)
+            ), TOGGLED)
+
+        if commit:
+            db.commit()
+        return count
+
+    def restore(self, db: Session, entity: str, id: int, commit: bool = True) -> int:
+        """Undo `deactivate` for the same root; returns rows touched."""
+        root, below = self._subtree(entity)
+        tag = f"{entity}:{id}"
+
+        count = self._run(db, entity, root, (
+            update(root)
+            .where(root.id == id)
+            .values(is_active=True, deactivated_by=None)
+        ), TOGGLED)
+        for name, model in below:
+            count += self._run(db, name, model, (
+                update(model)
+                .where(getattr(model, f"{entity}_id") == id, model.deactivated_by == tag)
+                .values(is_active=True, deactivated_by=None)
+            ), TOGGLED)
+
+        if commit:
+            db.commit()
+        return count
+
+    # ---------- materialized path ----------
+    def build_path(self, entity: str, values: dict) -> str:
+        """`path` of a row of `entity` with these parent id columns."""
+        return ".".join(str(values[f"{name}_id"]) for name in self._above(entity))
+
+    def node_path(self, entity: str, obj) -> str:
+        """Path of `obj` itself: its ancestors' ids, then its own."""
+        ids = [getattr(obj, f"{name}_id") for name in self._above(entity)]
+        return ".".join(str(id_) for id_ in [*ids, obj.id])
+
+    def _under(self, db: Session, model, node: str):
+        if db.get_bind().dialect.name == "postgresql":
+            return model.path.op("<@")(literal(node, LTree()))
+        # Text paths: a range scan on the b-tree index ('/' sorts right after '.').
+        return or_(
+            model.path == node,
+            and_(model.path > node + ".", model.path < node + "/"),
+        )
+
+    def _path_expr(self, db: Session, model, entity: str, fixed: dict):
+        # SQL for the path of every row of `model`, with the ids in `fixed`
+        # substituted (an UPDATE's SET sees the old column values).
+        parts = [
+            literal(str(fixed[col])) if col in fixed else cast(getattr(model, col), Text)
+            for col in (f"{name}_id" for name in self._above(entity))
+        ]
+        expr = reduce(lambda path, part: path + "." + part, parts)
+        if db.get_bind().dialect.name == "postgresql":
+            return func.text2ltree(expr)
+        return expr
+
+    def subtree(self, db: Session, entity: str, obj, active_only: bool = True) -> dict[str, list]:
+        """
+        Every row below `obj`, per level: one indexed query per level
+        (path scan where there is a path, the parent id column elsewhere).
+        """
+        node = self.node_path(entity, obj)
+        result = {}
+        for name, model in self._subtree(entity)[1]:
+            if name in PATH_LEVELS:
+                q = select(model).where(self._under(db, model, node))
+            else:
+                q = select(model).where(getattr(model, f"{entity}_id") == obj.id)
+            if active_only:
+                q = q.where(model.is_active.is_(True))
+            result[name] = db.scalars(q.order_by(model.order_index)).all()
+        return result
+
+    def resolve(self, db: Session, slugs: list[str]) -> list[int] | None:
+        """
+        Ids along a slug path (roadmap first), or None: one query joining
+        the levels the path goes through, active rows only.
+        """
+        if not slugs or len(slugs) > len(LEVELS):
+            return None
+        levels = LEVELS[:len(slugs)]
+        q = select(*[model.id for _, model in levels])
+        for (name, model), (_, child) in zip(levels, levels[1:]):
+            q = q.join(child, getattr(child, f"{name}_id") == model.id)
+        for (_, model), slug in zip(levels, slugs):
+            q = q.where(model.slug == slug, model.is_active.is_(True))
+        row = db.execute(q.limit(1)).first()
+        return list(row) if row else None
+
+    def parent_ids(self, db: Session, entity: str, parent_id: int) -> dict[str, int] | None:
+        """Ancestor id columns for a row of `entity` placed under `parent_id`."""
+        name, model = LEVELS[DEPTH[entity] - 1]
+        parent = db.get(model, parent_id)
+        if parent is None:
+            return None
+        ids = {f"{above}_id": getattr(parent, f"{above}_id") for above in self._above(name)}
+        ids[f"{name}_id"] = parent.id
+        return ids
+
+    def move_subtree(self, db: Session, entity: str, obj) -> int:
+        """
+        After `obj` was given new ancestors, copy its ancestor ids (and the
+        paths built from them) onto every row below it. Returns rows touched.
+        """
+        fixed = {f"{name}_id": getattr(obj, f"{name}_id") for name in self._above(entity)}
+        count = 0
+        for name, model in self._subtree(entity)[1]:
+            values = dict(fixed)
+            if name in PATH_LEVELS:
+                values["path"] = self._path_expr(db, model, name, fixed)
+            count += self._run(db, name, model, (
+                update(model)
+                .where(getattr(model, f"{entity}_id") == obj.id)
+                .values(**values)
+            ), values.keys(), sync="fetch")
+        return count
+
+
+crud_tree = CRUDTree()
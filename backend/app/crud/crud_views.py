@@ -0,0 +1,49 @@
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.content_view import ContentView
+
+
+class CRUDViews:
+    def add_many(self, db: Session, rows: list[dict]) -> None:
+        """
+        Add each row's `views` to its (entity, day, entity_id) counter,
+        creating it if needed: one INSERT ... ON CONFLICT for the batch.
+        Caller commits.
+        """
+        if not rows:
+            return
+        postgres = db.get_bind().dialect.name == "postgresql"
+        stmt = (pg_insert if postgres else sqlite_insert)(ContentView).values(rows)
+        table = ContentView.__table__.c
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.entity, table.day, table.entity_id],
+            set_={"views": table.views + stmt.excluded.views},
+        )
+        db.execute(stmt)
+
+    def top(self, db: Session, entity: str, model, since: date, limit: int):
+        """
+        (row, views) for the most viewed active rows of `entity` since
+        `since`, most viewed first. Summed per row from the daily counters.
+        """
+        totals = (
+            select(ContentView.entity_id, func.sum(ContentView.views).label("views"))
+            .where(ContentView.entity == entity, ContentView.day >= since)
+            .group_by(ContentView.entity_id)
+            .subquery()
+        )
+        return db.execute(
+            select(model, totals.c.views)
+            .join(totals, totals.c.entity_id == model.id)
+            .where(model.is_active.is_(True))
+            .order_by(totals.c.views.desc(), model.id)
+            .limit(limit)
+        ).all()
+
+
+crud_views = CRUDViews()
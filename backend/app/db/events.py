@@ -0,0 +1,134 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import catalog_cache
+from app.models import Lesson, Module, Roadmap, SeoMetadata, SubTopic, Technology, Topic
+
+logger = logging.getLogger("app.events")
+
+# Models whose writes are reported to post-commit hooks.
+TRACKED = {
+    Roadmap: "roadmap",
+    Technology: "technology",
+    Module: "module",
+    Topic: "topic",
+    SubTopic: "sub_topic",
+    Lesson: "lesson",
+    SeoMetadata: "seo",
+}
+
+# Cached in catalog_cache; roadmap / technology responses embed their SEO.
+CATALOG = frozenset({"roadmap", "technology", "seo"})
+
+
+@dataclass(frozen=True)
+class Change:
+    entity: str
+    id: int
+    op: str  # created | updated | deleted (soft deletes are updates)
+    # Columns an update wrote; None if not known (and for creates / deletes)
+    fields: frozenset[str] | None = None
+
+    def touches(self, fields) -> bool:
+        """Whether this change may have written any of `fields`."""
+        return self.op != "updated" or self.fields is None or not self.fields.isdisjoint(fields)
+
+
+_hooks: list[Callable[[list[Change]], None]] = []
+
+
+def on_commit(hook: Callable[[list[Change]], None]):
+    """
+    Register `hook(changes)` to run once after every commit that wrote a
+    tracked row. Rolled-back changes are never reported.
+
+    Usage:
+    @on_commit
+    def reindex(changes):
+        ...
+    """
+    _hooks.append(hook)
+    return hook
+
+
+def record_changes(session: Session, entity: str, ids, op: str, fields=None) -> None:
+    """
+    Report rows written by Core-style statements (INSERT / UPDATE ...
+    RETURNING, set-based updates), which never go through a flush.
+    `fields`: the columns an update set, if the caller knows them.
+    """
+    pending = session.info.setdefault("pending_changes", {})
+    fields = None if fields is None else frozenset(fields)
+    for id_ in ids:
+        _merge(pending, (entity, id_), op, fields)
+
+
+def _merge(pending: dict, key: tuple[str, int], op: str, fields: frozenset[str] | None) -> None:
+    # "created" wins over a later update in the same transaction; the
+    # columns of several updates add up (unknown stays unknown).
+    if key not in pending:
+        pending[key] = (op, fields)
+        return
+    first, seen = pending[key]
+    pending[key] = (first, None if seen is None or fields is None else seen | fields)
+
+
+# ======================================================
+# Session listeners
+# ======================================================
+
+@event.listens_for(Session, "after_flush")
+def _collect(session, flush_context):
+    # Primary keys of new rows are assigned by now and session.new /
+    # dirty / deleted still describe what this flush wrote.
+    pending = session.info.setdefault("pending_changes", {})
+    for objects, op in (
+        (session.new, "created"),
+        (session.dirty, "updated"),
+        (session.deleted, "deleted"),
+    ):
+        for obj in objects:
+            entity = TRACKED.get(type(obj))
+            if entity is None:
+                continue
+            fields = None
+            if op == "updated":
+                if not session.is_modified(obj, include_collections=False):
+                    continue
+                fields = frozenset(
+                    attr.key for attr in inspect(obj).attrs if attr.history.has_changes()
+                )
+            _merge(pending, (entity, obj.id), op, fields)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch(session):
+    pending = session.info.pop("pending_changes", None)
+    if not pending:
+        return
+
+    changes = [Change(entity, id_, op, fields) for (entity, id_), (op, fields) in pending.items()]
+    for hook in _hooks:
+        try:
+            hook(changes)
+        except Exception:  # the commit already happened; never fail the request
+            logger.exception("Post-commit hook %s failed", getattr(hook, "__name__", hook))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop("pending_changes", None)
+
+
+# ======================================================
+# Built-in hooks
+# ======================================================
+
+@on_commit
+def invalidate_catalog_cache(changes: list[Change]) -> None:
+    if any(change.entity in CATALOG for change in changes):
+        catalog_cache.invalidate()
@@ -0,0 +1,66 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_SIZE
+from app.core.timing import record_query
+from app.core.tracing import end_sql_span, start_sql_span, tracing_enabled
+from app.db.slow_query import SKIP_OPTION, slow_query_log
+
+SLOW_QUERY_THRESHOLD = settings.SLOW_QUERY_THRESHOLD_MS / 1000
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+    if tracing_enabled():
+        conn.info.setdefault("query_span", []).append(start_sql_span(conn, statement))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start"].pop()
+    record_query(duration)
+    if conn.info.get("query_span"):
+        end_sql_span(conn.info["query_span"].pop())
+
+    if (
+        duration >= SLOW_QUERY_THRESHOLD
+        and context is not None
+        and not context.execution_options.get(SKIP_OPTION)
+    ):
+        slow_query_log.record(conn.engine, statement, parameters, duration, executemany)
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+    if conn is not None and conn.info.get("query_span"):
+        end_sql_span(conn.info["query_span"].pop(), exception_context.original_exception)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKED_OUT.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """
+    Attach the per-statement hooks used for request timing, tracing and
+    the slow query log, and the pool hooks used for metrics.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", _on_checkin)
+    size = getattr(engine.pool, "size", None)
+    if callable(size):
+        DB_POOL_SIZE.set(size())
+    return engine
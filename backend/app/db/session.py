@@ -1,15 +1,26 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.instrumentation import instrument_engine
+
+if settings.DATABASE_URL.startswith("sqlite"):
+    # Local/test databases; FastAPI runs sync endpoints in a threadpool.
+    connect_args = {"check_same_thread": False}
+else:
+    connect_args = {"sslmode": settings.DB_SSLMODE}
 
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    connect_args={"sslmode": "require"}  # Supabase requires SSL
+    connect_args=connect_args,
 )
+instrument_engine(engine)
 
+# Rows written with RETURNING stay loaded after commit instead of being
+# re-SELECTed when the response is serialised.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
@@ -0,0 +1,140 @@
+import itertools
+import json
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.timing import current_stats
+
+logger = logging.getLogger("app.slow_query")
+
+# Execution option that keeps the EXPLAIN statements themselves out of the log.
+SKIP_OPTION = "skip_slow_query_log"
+
+_EXPLAINABLE = ("select", "insert", "update", "delete", "with")
+
+
+def redact(parameters) -> object:
+    """
+    Keep the shape of the bound parameters, never their values.
+    """
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of slow statements for this worker.
+
+    Plans are captured off the request path on a single background thread
+    and cached per statement, so a hot slow query is EXPLAINed once. At
+    most `max_pending` statements wait for a plan: while one is queued or
+    running, repeats of it are not queued again, and new statements are
+    dropped once the queue is full.
+    """
+
+    def __init__(self, size: int = 200, plan_cache_size: int = 256, max_pending: int = 16):
+        self.entries: deque[dict] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._plans: OrderedDict[str, object] = OrderedDict()
+        self._plan_cache_size = plan_cache_size
+        self._pending: set[str] = set()  # statements queued or being explained
+        self._max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+
+    def record(self, engine: Engine, statement: str, parameters, duration: float, executemany: bool) -> dict:
+        stats = current_stats()
+        entry = {
+            "id": next(self._ids),
+            "at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration * 1000, 2),
+            "statement": statement,
+            "parameters": redact(parameters),
+            "route": stats.route if stats else None,
+            "method": stats.method if stats else None,
+            "plan": self._plans.get(statement),
+        }
+        with self._lock:
+            self.entries.append(entry)
+
+        logger.warning(json.dumps({"event": "slow_query", **{k: v for k, v in entry.items() if k != "plan"}}))
+
+        if (
+            settings.SLOW_QUERY_EXPLAIN
+            and entry["plan"] is None
+            and not executemany
+            and statement.lstrip().lower().startswith(_EXPLAINABLE)
+        ) and self._reserve(statement):
+            with self._lock:
+                # Two first slow queries at once would otherwise start two pools
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+                executor = self._executor
+            executor.submit(self._explain, engine, entry, statement, parameters)
+        return entry
+
+    def _reserve(self, statement: str) -> bool:
+        with self._lock:
+            if statement in self._pending or len(self._pending) >= self._max_pending:
+                return False
+            self._pending.add(statement)
+            return True
+
+    def _explain(self, engine: Engine, entry: dict, statement: str, parameters) -> None:
+        try:
+            self._capture(engine, entry, statement, parameters)
+        finally:
+            with self._lock:
+                self._pending.discard(statement)
+
+    def _capture(self, engine: Engine, entry: dict, statement: str, parameters) -> None:
+        try:
+            if engine.dialect.name == "postgresql":
+                sql = f"EXPLAIN (ANALYZE off, FORMAT JSON) {statement}"
+            else:
+                sql = f"EXPLAIN QUERY PLAN {statement}"
+
+            with engine.connect().execution_options(**{SKIP_OPTION: True}) as conn:
+                rows = conn.exec_driver_sql(sql, parameters).fetchall()
+
+            if engine.dialect.name == "postgresql":
+                plan = rows[0][0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+            else:
+                plan = [list(row) for row in rows]
+        except Exception as exc:  # plan capture must never break anything
+            entry["plan_error"] = str(exc)
+            return
+
+        entry["plan"] = plan
+        with self._lock:
+            self._plans[statement] = plan
+            self._plans.move_to_end(statement)
+            while len(self._plans) > self._plan_cache_size:
+                self._plans.popitem(last=False)
+
+    def list(self, limit: int | None = None) -> list[dict]:
+        with self._lock:
+            entries = list(self.entries)
+        entries.reverse()
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self._plans.clear()
+
+
+slow_query_log = SlowQueryLog(
+    size=settings.SLOW_QUERY_LOG_SIZE, max_pending=settings.SLOW_QUERY_EXPLAIN_QUEUE
+)
@@ -0,0 +1,24 @@
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator, UserDefinedType
+
+
+class _LTREE(UserDefinedType):
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "LTREE"
+
+
+class LTree(TypeDecorator):
+    """
+    Dot-separated label path ("1.4.9"): Postgres `ltree`, plain text on
+    other databases. Values are str either way.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(_LTREE())
+        return dialect.type_descriptor(Text())
@@ -1,13 +1,50 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.logging import setup_logging
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.timing import TimingMiddleware
+from app.core.tracing import TracingMiddleware, setup_tracing
+from app.services.progress_service import progress_buffer
+from app.services.view_service import view_counter
+from app.services.warmup import warm_up
+from app.worker import tasks  # noqa: F401  (registers the post-commit jobs)
+
+setup_logging()
+
+if settings.OTEL_ENABLED:
+    setup_tracing()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs before uvicorn reports the worker as started.
+    if settings.WARMUP_ENABLED:
+        await run_in_threadpool(warm_up, app)
+    progress_buffer.start()
+    view_counter.start()
+    yield
+    # Write buffered progress and views before the worker exits
+    await run_in_threadpool(progress_buffer.stop)
+    await run_in_threadpool(view_counter.stop)
+
 
 app = FastAPI(
     title=settings.APP_NAME,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
+# Added first so it sits inside CORS and 429s still carry CORS headers.
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ALLOWED_ORIGINS,
@@ -16,4 +53,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Covers every other middleware except tracing.
+app.add_middleware(TimingMiddleware)
+
+# Outermost; passes straight through unless tracing was set up.
+app.add_middleware(TracingMiddleware)
+
 app.include_router(api_router, prefix="/api/v1")
+
+# Uploaded images, when they are stored on this machine (put a proxy or
+# CDN in front in production: the file names are content hashes).
+if settings.MEDIA_STORAGE == "local" and settings.MEDIA_URL.startswith("/"):
+    app.mount(
+        settings.MEDIA_URL,
+        StaticFiles(directory=settings.MEDIA_ROOT, check_dir=False),
+        name="media",
+    )
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
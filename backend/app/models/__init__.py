@@ -10,4 +10,13 @@ from .module import Module
 from .topic import Topic
 from .sub_topic import SubTopic
 from .lesson import Lesson
-from .seo_metadata import SeoMetadata
\ No newline at end of file
+from .seo_metadata import SeoMetadata
+from .reading_order import ReadingOrder
+from .content_block import ContentBlockRow
+from .revision import Revision
+from .published import PublishedPage, PublishedRoadmap
+from .media_asset import MediaAsset
+from .catalog_stat import CatalogStat
+from .lesson_progress import LessonProgress
+from .content_view import ContentView
+from .related_content import RelatedContent, RelatedModel, RelatedVector
\ No newline at end of file
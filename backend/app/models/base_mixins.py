@@ -1,4 +1,4 @@
-from sqlalchemy import DateTime, Boolean, Integer, func
+from sqlalchemy import DateTime, Boolean, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 class TimestampMixin:
@@ -16,3 +16,8 @@ class OrderableMixin:
 
 class ActiveMixin:
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+class CascadeMixin:
+    # "<entity>:<id>" of the row whose soft delete deactivated this one;
+    # restoring that row reactivates exactly the rows carrying its tag.
+    deactivated_by: Mapped[str | None] = mapped_column(String(64))
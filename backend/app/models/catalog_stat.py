@@ -0,0 +1,18 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class CatalogStat(Base):
+    """
+    Rollup: how many rows of `entity` sit under one parent, active and
+    not. Roadmaps have no parent and use parent_id 0. Kept current per
+    parent after each catalog commit (see stats_service).
+    """
+    __tablename__ = "catalog_stats"
+
+    entity: Mapped[str] = mapped_column(String(20), primary_key=True)
+    parent_id: Mapped[int] = mapped_column(primary_key=True)
+
+    active: Mapped[int]
+    inactive: Mapped[int]
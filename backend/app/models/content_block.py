@@ -0,0 +1,19 @@
+from sqlalchemy import JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ContentBlockRow(Base):
+    """
+    One block of a topic / sub-topic / lesson `content`, so a page can be
+    loaded a screen at a time. Owners without rows still keep their
+    blocks in the JSON `content` column.
+    """
+    __tablename__ = "content_blocks"
+
+    owner_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    owner_id: Mapped[int] = mapped_column(primary_key=True)
+    position: Mapped[int] = mapped_column(primary_key=True)
+
+    type: Mapped[str] = mapped_column(String(50))
+    data: Mapped[dict] = mapped_column(JSON)  # the whole block, type included
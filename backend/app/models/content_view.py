@@ -0,0 +1,21 @@
+from datetime import date
+
+from sqlalchemy import Date, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ContentView(Base):
+    """
+    Page views of one catalog row on one (UTC) day. Counted in memory by
+    each worker and added here in batches (see view_service), so reading
+    a page never writes to the content tables.
+    """
+    __tablename__ = "content_views"
+
+    # Key order serves "top rows of one entity since a day" as a range scan
+    entity: Mapped[str] = mapped_column(String(20), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    entity_id: Mapped[int] = mapped_column(primary_key=True)
+
+    views: Mapped[int] = mapped_column(default=0)
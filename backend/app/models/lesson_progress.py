@@ -0,0 +1,28 @@
+from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class LessonProgress(Base):
+    """
+    How far one user got in one lesson. Only ever moves forward: the
+    furthest scroll position wins and completion sticks.
+    """
+    __tablename__ = "lesson_progress"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    lesson_id: Mapped[int] = mapped_column(
+        ForeignKey("lessons.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    percent: Mapped[int] = mapped_column(default=0)  # 0-100, read so far
+    completed: Mapped[bool] = mapped_column(default=False)
+    completed_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True))
+
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import JSON, ForeignKey, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+from app.models.base_mixins import TimestampMixin
+
+
+class MediaAsset(Base, TimestampMixin):
+    """An uploaded image and the resized variants made from it."""
+    __tablename__ = "media_assets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    sha256: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+
+    url: Mapped[str] = mapped_column(Text)  # the original
+    content_type: Mapped[str] = mapped_column(String(50))
+    width: Mapped[int]
+    height: Mapped[int]
+    size_bytes: Mapped[int]
+
+    # [{"format": "webp", "width": 640, "height": 360, "url": ..., "size_bytes": ...}]
+    variants: Mapped[list[dict]] = mapped_column(JSON)
+
+    uploaded_by: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL")
+    )
@@ -1,14 +1,14 @@
 from sqlalchemy import String, Text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
-from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin
+from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin
 
-class Module(Base, TimestampMixin, OrderableMixin, ActiveMixin):
+class Module(Base, TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin):
     __tablename__ = "modules"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    roadmap_id: Mapped[int] = mapped_column(ForeignKey("roadmaps.id", ondelete="CASCADE"))
-    technology_id: Mapped[int] = mapped_column(ForeignKey("technologies.id", ondelete="CASCADE"))
+    roadmap_id: Mapped[int] = mapped_column(ForeignKey("roadmaps.id", ondelete="CASCADE"), index=True)
+    technology_id: Mapped[int] = mapped_column(ForeignKey("technologies.id", ondelete="CASCADE"), index=True)
 
     slug: Mapped[str] = mapped_column(String(150), index=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -0,0 +1,45 @@
+from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class PublishedRoadmap(Base):
+    """
+    Which snapshot of a roadmap is live. Publishing writes a new version
+    of its pages, then moves `version` here in the same transaction.
+    """
+    __tablename__ = "published_roadmaps"
+
+    roadmap_id: Mapped[int] = mapped_column(
+        ForeignKey("roadmaps.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int]
+
+    # As of that version (the draft may have been renamed since)
+    slug: Mapped[str] = mapped_column(String(150), index=True)
+    title: Mapped[str] = mapped_column(String(255))
+
+    published_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    published_by: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL")
+    )
+
+
+class PublishedPage(Base):
+    """
+    One page (roadmap, technology, ... lesson) of a published version,
+    stored as the response body itself. Rows are never updated.
+    """
+    __tablename__ = "published_pages"
+
+    roadmap_id: Mapped[int] = mapped_column(
+        ForeignKey("roadmaps.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(primary_key=True)
+    path: Mapped[str] = mapped_column(Text, primary_key=True)  # "frontend/react/hooks"
+
+    entity: Mapped[str] = mapped_column(String(20))
+    entity_id: Mapped[int]
+    body: Mapped[str] = mapped_column(Text)  # serialized JSON
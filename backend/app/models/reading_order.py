@@ -0,0 +1,27 @@
+from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ReadingOrder(Base):
+    """
+    Precomputed reading sequence of a technology: every active topic,
+    sub-topic and lesson, depth-first, numbered 0..n-1 without gaps.
+    Rebuilt per technology after catalog writes (see navigation_service).
+    """
+    __tablename__ = "reading_order"
+    __table_args__ = (
+        Index("ix_reading_order_technology_seq", "technology_id", "seq", unique=True),
+    )
+
+    entity: Mapped[str] = mapped_column(String(20), primary_key=True)
+    entity_id: Mapped[int] = mapped_column(primary_key=True)
+
+    technology_id: Mapped[int] = mapped_column(
+        ForeignKey("technologies.id", ondelete="CASCADE")
+    )
+    seq: Mapped[int]
+
+    # Enough to link to the neighbours without loading them
+    slug: Mapped[str] = mapped_column(Text)
+    title: Mapped[str] = mapped_column(Text)
@@ -0,0 +1,65 @@
+from sqlalchemy import JSON, Float, Index, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class RelatedContent(Base):
+    """
+    Precomputed neighbours of a topic / sub-topic / lesson: its most
+    similar active pages by TF-IDF cosine, best first (see
+    related_service). Slug and title are copied in so a page's list is
+    read with one primary-key range scan.
+    """
+    __tablename__ = "related_content"
+    __table_args__ = (
+        # Rows pointing at a page, recomputed when that page changes
+        Index("ix_related_content_target", "related_entity", "related_id"),
+    )
+
+    entity: Mapped[str] = mapped_column(String(20), primary_key=True)
+    entity_id: Mapped[int] = mapped_column(primary_key=True)
+    rank: Mapped[int] = mapped_column(primary_key=True)  # 0 = most similar
+
+    related_entity: Mapped[str] = mapped_column(String(20))
+    related_id: Mapped[int]
+    slug: Mapped[str] = mapped_column(Text)
+    title: Mapped[str] = mapped_column(Text)
+    score: Mapped[float] = mapped_column(Float)
+
+
+class RelatedModel(Base):
+    """
+    Term weights the page vectors in related_vectors are scored with,
+    written by each related.rebuild (a new generation) and shared by all
+    workers. `seq` counts the refreshes since; a worker whose copy is
+    older reads only the vectors written after it.
+    """
+    __tablename__ = "related_model"
+
+    generation: Mapped[str] = mapped_column(String(32), primary_key=True)
+    seq: Mapped[int] = mapped_column(default=0)
+    terms: Mapped[list[str]] = mapped_column(JSON)  # column order of the vectors
+    idf: Mapped[bytes] = mapped_column(LargeBinary)  # float64 per term
+
+
+class RelatedVector(Base):
+    """
+    TF-IDF vector of one page in the current model, as sparse column
+    indices and weights. A page gone since keeps its row, with no slug
+    or title and an empty vector.
+    """
+    __tablename__ = "related_vectors"
+    __table_args__ = (
+        # Rows written after a given refresh
+        Index("ix_related_vectors_seq", "generation", "seq"),
+    )
+
+    entity: Mapped[str] = mapped_column(String(20), primary_key=True)
+    entity_id: Mapped[int] = mapped_column(primary_key=True)
+
+    generation: Mapped[str] = mapped_column(String(32))
+    seq: Mapped[int]
+    indices: Mapped[bytes] = mapped_column(LargeBinary)  # int32
+    data: Mapped[bytes] = mapped_column(LargeBinary)  # float64
+    slug: Mapped[str | None] = mapped_column(Text)
+    title: Mapped[str | None] = mapped_column(Text)
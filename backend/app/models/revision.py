@@ -0,0 +1,30 @@
+from sqlalchemy import JSON, DateTime, Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class Revision(Base):
+    """
+    One saved state of a topic / sub-topic / lesson page. Every
+    REVISION_SNAPSHOT_INTERVAL-th revision (the first included) stores
+    the whole document; the others store the JSON Patch from the revision
+    before, so rebuilding any revision replays at most interval - 1 diffs.
+    """
+    __tablename__ = "revisions"
+    __table_args__ = (
+        Index("ix_revisions_owner_number", "owner_type", "owner_id", "number", unique=True),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    owner_type: Mapped[str] = mapped_column(String(20))
+    owner_id: Mapped[int]
+    number: Mapped[int]  # 1, 2, ... per owner
+
+    is_snapshot: Mapped[bool]
+    data: Mapped[dict | list] = mapped_column(JSON)  # document, or patch operations
+    changed: Mapped[list[str]] = mapped_column(JSON)  # top-level fields touched
+
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
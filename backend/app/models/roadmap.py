@@ -1,9 +1,9 @@
 from sqlalchemy import String, Text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
-from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin
+from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin
 
-class Roadmap(Base, TimestampMixin, OrderableMixin, ActiveMixin):
+class Roadmap(Base, TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin):
     __tablename__ = "roadmaps"
 
     id: Mapped[int] = mapped_column(primary_key=True)
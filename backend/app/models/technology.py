@@ -1,13 +1,13 @@
 from sqlalchemy import String, Text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
-from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin
+from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin
 
-class Technology(Base, TimestampMixin, OrderableMixin, ActiveMixin):
+class Technology(Base, TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin):
     __tablename__ = "technologies"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    roadmap_id: Mapped[int] = mapped_column(ForeignKey("roadmaps.id", ondelete="CASCADE"))
+    roadmap_id: Mapped[int] = mapped_column(ForeignKey("roadmaps.id", ondelete="CASCADE"), index=True)
 
     slug: Mapped[str] = mapped_column(String(150), index=True)
     slug_icon: Mapped[str | None] = mapped_column(String(255))
@@ -18,5 +18,6 @@ class Technology(Base, TimestampMixin, OrderableMixin, ActiveMixin):
         ForeignKey("seo_metadata.id", ondelete="SET NULL")
     )
 
+    seo = relationship("SeoMetadata")
     roadmap = relationship("Roadmap", back_populates="technologies")
     modules = relationship("Module", back_populates="technology")
@@ -1,28 +1,35 @@
-from sqlalchemy import String, Text, ForeignKey, JSON
+from sqlalchemy import String, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
-from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin
+from app.db.types import LTree
+from app.models.base_mixins import TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin
 from app.models.sub_topic import SubTopic
 
 
-class Topic(Base, TimestampMixin, OrderableMixin, ActiveMixin):
+class Topic(Base, TimestampMixin, OrderableMixin, ActiveMixin, CascadeMixin):
     __tablename__ = "topics"
+    __table_args__ = (
+        Index("ix_topics_path", "path", postgresql_using="gist"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
 
     # Relations
     roadmap_id: Mapped[int] = mapped_column(
-        ForeignKey("roadmaps.id", ondelete="CASCADE")
+        ForeignKey("roadmaps.id", ondelete="CASCADE"), index=True
     )
     technology_id: Mapped[int] = mapped_column(
-        ForeignKey("technologies.id", ondelete="CASCADE")
+        ForeignKey("technologies.id", ondelete="CASCADE"), index=True
     )
     module_id: Mapped[int] = mapped_column(
-        ForeignKey("modules.id", ondelete="CASCADE")
+        ForeignKey("modules.id", ondelete="CASCADE"), index=True
     )
 
+    # Ancestor ids, top-down ("roadmap.technology.module")
+    path: Mapped[str | None] = mapped_column(LTree)
+
     # Basic info
     slug: Mapped[str] = mapped_column(Text, index=True)
     title: Mapped[str] = mapped_column(Text)
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class Suggestion(BaseModel):
+    entity: str
+    id: int
+    title: str
+    slug: str
+    path: str  # slugs from the roadmap down, as /resolve takes them
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import List
+
+from app.schemas.topic import ContentBlock
+
+
+class ContentBlockPage(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    items: List[ContentBlock]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Literal, Optional
+from datetime import datetime
+
+
+# ---------- RFC 6902 operation ----------
+class PatchOperation(BaseModel):
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    # JSON pointer starting with the section: "/content/3/text", "/examples/-"
+    path: str = Field(..., example="/content/3/text")
+    value: Optional[Any] = None
+    from_: Optional[str] = Field(None, alias="from")
+
+
+# ---------- Response ----------
+class JsonPatchResult(BaseModel):
+    id: int
+    updated_at: datetime
+    # Only the sections the patch touched, as stored
+    sections: Dict[str, Any]
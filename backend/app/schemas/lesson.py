@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from app.utils.images import srcset
+
 
 # ---------- Block Schema (shared across Topic/SubTopic/Lesson) ----------
 class ContentBlock(BaseModel):
@@ -57,6 +59,7 @@ class LessonCreate(LessonBase):
 
 # ---------- Update ----------
 class LessonUpdate(BaseModel):
+    sub_topic_id: Optional[int] = None  # moves it, with everything below
     slug: Optional[str] = None
     title: Optional[str] = None
     description: Optional[str] = None
@@ -79,7 +82,6 @@ class LessonUpdate(BaseModel):
 
     seo_id: Optional[int] = None
     order_index: Optional[int] = None
-    is_active: Optional[bool] = None
 
 
 # ---------- Response ----------
@@ -88,5 +90,15 @@ class LessonResponse(LessonBase):
     created_at: datetime
     updated_at: datetime
 
+    @computed_field
+    @property
+    def image_banner_srcset(self) -> Optional[Dict[str, str]]:
+        return srcset(self.image_banner_url)
+
+    @computed_field
+    @property
+    def images_srcset(self) -> Optional[List[Optional[Dict[str, str]]]]:
+        return [srcset(url) for url in self.images] if self.images else None
+
     class Config:
         from_attributes = True
\ No newline at end of file
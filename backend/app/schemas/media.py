@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, computed_field
+
+from app.utils.images import srcset
+
+
+class MediaVariant(BaseModel):
+    format: str
+    width: int
+    height: int
+    url: str
+    size_bytes: int
+
+
+class MediaAssetResponse(BaseModel):
+    id: int
+    url: str
+    content_type: str
+    width: int
+    height: int
+    size_bytes: int
+    variants: List[MediaVariant]
+    created_at: datetime
+
+    @computed_field
+    @property
+    def srcset(self) -> Optional[Dict[str, str]]:
+        return srcset(self.url)
+
+    class Config:
+        from_attributes = True
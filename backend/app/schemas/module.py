@@ -29,7 +29,6 @@ class ModuleUpdate(BaseModel):
     description: Optional[str] = None
     seo_id: Optional[int] = None
     order_index: Optional[int] = None
-    is_active: Optional[bool] = None
 
 
 # ---------- Response ----------
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class NavigationItem(BaseModel):
+    entity: str
+    entity_id: int
+    slug: str
+    title: str
+
+    class Config:
+        from_attributes = True
+
+
+class NavigationResponse(BaseModel):
+    entity: str
+    entity_id: int
+    technology_id: int
+    position: int  # 1-based
+    total: int
+    prev: Optional[NavigationItem] = None
+    next: Optional[NavigationItem] = None
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProgressEvent(BaseModel):
+    percent: Optional[int] = Field(None, ge=0, le=100)  # how far they have read
+    completed: bool = False
+
+
+class LessonProgressResponse(BaseModel):
+    lesson_id: int
+    percent: int = 0
+    completed: bool = False
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ModuleProgress(BaseModel):
+    module_id: int
+    total: int
+    completed: int
+    percent: float
+
+
+class TechnologyProgress(BaseModel):
+    technology_id: int
+    total: int
+    completed: int
+    percent: float
+    modules: List[ModuleProgress]
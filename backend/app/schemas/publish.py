@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PublishedRoadmapResponse(BaseModel):
+    roadmap_id: int
+    version: int
+    slug: str
+    title: str
+    published_at: datetime
+    published_by: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PublishResult(PublishedRoadmapResponse):
+    pages: int  # pages in the new version
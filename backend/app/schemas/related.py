@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+
+
+class RelatedItem(BaseModel):
+    entity: str = Field(validation_alias="related_entity")
+    id: int = Field(validation_alias="related_id")
+    slug: str
+    title: str
+    score: float  # cosine similarity, 0-1
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class ReorderRequest(BaseModel):
+    parent_id: int
+    # New order of all active children, first item gets order_index 0
+    ids: List[int] = Field(..., min_length=1, example=[12, 7, 9])
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import Dict
+
+
+class ResolveResponse(BaseModel):
+    entity: str  # deepest level of the path
+    id: int
+    # Every level of the path, top-down: {"roadmap": 1, "technology": 4, ...}
+    ids: Dict[str, int]
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class RevisionSummary(BaseModel):
+    number: int
+    is_snapshot: bool
+    changed: List[str]  # top-level fields that differ from the revision before
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class RevisionDetail(RevisionSummary):
+    document: Dict[str, Any]  # the page's content as of this revision
@@ -42,7 +42,6 @@ class RoadmapUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     order_index: Optional[int] = None
-    is_active: Optional[bool] = None
     # Allow nested SEO data update
     seo: Optional[SeoMetadataCreate] = None 
 
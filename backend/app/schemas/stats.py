@@ -0,0 +1,21 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class ActiveCount(BaseModel):
+    active: int = 0
+    inactive: int = 0
+
+
+class ParentCount(ActiveCount):
+    parent_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class CatalogStats(BaseModel):
+    totals: Dict[str, ActiveCount]  # per entity
+    # Per entity, counts under each parent: "technology" -> per roadmap, ...
+    children: Dict[str, List[ParentCount]]
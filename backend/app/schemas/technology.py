@@ -15,6 +15,9 @@ class SeoSchema(BaseModel):
     og_image_url: Optional[str] = None
     twitter_card: Optional[str] = None
 
+    class Config:
+        from_attributes = True
+
 # ---------- Base ----------
 class TechnologyBase(BaseModel):
     roadmap_id: int
@@ -41,7 +44,6 @@ class TechnologyUpdate(BaseModel):
     description: Optional[str] = None
     seo_id: Optional[int] = None
     order_index: Optional[int] = None
-    is_active: Optional[bool] = None
     seo: Optional[SeoSchema] = None
 
 
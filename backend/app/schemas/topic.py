@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from app.utils.images import srcset
+
 
 # ---------- Block Schema (rich content) ----------
 class ContentBlock(BaseModel):
@@ -55,6 +57,7 @@ class TopicCreate(TopicBase):
 
 # ---------- Update ----------
 class TopicUpdate(BaseModel):
+    module_id: Optional[int] = None  # moves it, with everything below
     slug: Optional[str] = None
     title: Optional[str] = None
     description: Optional[str] = None
@@ -77,7 +80,6 @@ class TopicUpdate(BaseModel):
 
     seo_id: Optional[int] = None
     order_index: Optional[int] = None
-    is_active: Optional[bool] = None
 
 
 from app.schemas.sub_topic import SubTopicResponse
@@ -90,5 +92,15 @@ class TopicResponse(TopicBase):
     updated_at: datetime
     sub_topics: List[SubTopicResponse] = Field(default_factory=list)
 
+    @computed_field
+    @property
+    def image_banner_srcset(self) -> Optional[Dict[str, str]]:
+        return srcset(self.image_banner_url)
+
+    @computed_field
+    @property
+    def images_srcset(self) -> Optional[List[Optional[Dict[str, str]]]]:
+        return [srcset(url) for url in self.images] if self.images else None
+
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class PopularItem(BaseModel):
+    entity: str
+    id: int
+    slug: str
+    title: str
+    views: int  # over the requested days
@@ -0,0 +1,339 @@
+import bisect
+import heapq
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+
+from sqlalchemy import null, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.crud_tree import DEPTH, LEVELS
+from app.db.events import Change, on_commit
+from app.db.session import SessionLocal
+
+logger = logging.getLogger("app.autocomplete")
+
+MODELS = dict(LEVELS)
+PARENT = {name: parent for (parent, _), (name, _) in zip(LEVELS, LEVELS[1:])}
+
+WORD = re.compile(r"[^\W_]+")
+
+# Prefixes matching more keys than this keep a ranked list of their best
+# items, maintained on updates; shorter ranges are ranked per query.
+SCAN_LIMIT = 256
+MAX_RESULTS = 25
+
+LAST_CHAR = "\U0010ffff"
+
+
+def normalize(text: str) -> str:
+    """Casefolded words without accents, single-spaced: "Café-Übersicht" -> "cafe ubersicht"."""
+    text = text.casefold()
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return " ".join(WORD.findall(text))
+
+
+def _keys(title: str, slug: str) -> dict[str, int]:
+    # Every word of the title / slug starts a key, so "hooks" finds
+    # "React hooks"; the value is the word position (0: from the start).
+    keys: dict[str, int] = {}
+    for text in (title, slug):
+        words = normalize(text).split()
+        for pos in range(len(words)):
+            keys.setdefault(" ".join(words[pos:]), pos)
+    return keys
+
+
+def _refs(entity: str, id_: int, title: str, slug: str):
+    # (key, ref); a ref sorts by rank: title starts first, then shorter
+    # titles, then higher levels
+    depth = DEPTH[entity]
+    return [(key, (pos, len(title), depth, entity, id_)) for key, pos in _keys(title, slug).items()]
+
+
+def _range(keys: list[str], prefix: str, lo: int = 0) -> tuple[int, int]:
+    lo = bisect.bisect_left(keys, prefix, lo)
+    return lo, bisect.bisect_left(keys, prefix + LAST_CHAR, lo)
+
+
+def _prefixes(key: str):
+    return (key[:n] for n in range(1, len(key) + 1))
+
+
+def _best(refs, limit: int) -> list[tuple]:
+    # `refs` in rank order: the first `limit` distinct items
+    seen, result = set(), []
+    for ref in refs:
+        if ref[3:] not in seen:
+            seen.add(ref[3:])
+            result.append(ref)
+            if len(result) == limit:
+                break
+    return result
+
+
+def _rank(refs: list[tuple], lo: int, hi: int, limit: int) -> list[tuple]:
+    if hi - lo > 4 * limit:
+        # An item has a key per word, so a few more refs than results
+        # nearly always holds `limit` distinct items
+        best = _best(heapq.nsmallest(2 * limit, refs[lo:hi]), limit)
+        if len(best) == limit:
+            return best
+    return _best(sorted(refs[lo:hi]), limit)
+
+
+@dataclass(frozen=True)
+class _State:
+    keys: list[str]  # sorted
+    refs: list[tuple]  # per key: (word position, title length, depth, entity, id)
+    items: dict[tuple[str, int], tuple[str, str, int | None]]  # -> (title, slug, parent id)
+    top: dict[str, list[tuple]]  # prefixes matching over SCAN_LIMIT keys -> best refs
+
+
+class PrefixIndex:
+    """
+    Title and slug prefixes of every active catalog row, as one sorted
+    array searched with bisect. A query ranks the (at most SCAN_LIMIT)
+    keys starting with it, or reads the list kept for prefixes matching
+    more. Updates build a new state and swap it in, so readers never lock.
+    """
+
+    def __init__(self, state: _State):
+        self._state = state
+        self._write_lock = threading.Lock()
+
+    # ---------- building ----------
+    @staticmethod
+    def _load(db: Session, entity: str, ids: set[int] | None = None):
+        model = MODELS[entity]
+        parent = getattr(model, f"{PARENT[entity]}_id") if entity in PARENT else null()
+        q = select(model.id, model.title, model.slug, parent).where(model.is_active.is_(True))
+        if ids is not None:
+            q = q.where(model.id.in_(ids))
+        return db.execute(q).all()
+
+    @staticmethod
+    def _top(keys: list[str], refs: list[tuple]) -> dict[str, list[tuple]]:
+        # Breadth-first over prefixes: one only matches many keys if the
+        # prefix one character shorter does
+        top, frontier = {}, {key[0] for key in keys}
+        while frontier:
+            longer = set()
+            for prefix in frontier:
+                lo, hi = _range(keys, prefix)
+                if hi - lo <= SCAN_LIMIT:
+                    continue
+                top[prefix] = _rank(refs, lo, hi, MAX_RESULTS)
+                size, i = len(prefix) + 1, lo
+                while i < hi:
+                    if len(keys[i]) < size:
+                        i += 1
+                        continue
+                    child = keys[i][:size]
+                    longer.add(child)
+                    i = _range(keys, child, i)[1]
+            frontier = longer
+        return top
+
+    @classmethod
+    def build(cls, db: Session) -> "PrefixIndex":
+        # One query per level
+        entries, items = [], {}
+        for entity in MODELS:
+            for id_, title, slug, parent_id in cls._load(db, entity):
+                items[(entity, id_)] = (title, slug, parent_id)
+                entries.extend(_refs(entity, id_, title, slug))
+        entries.sort()
+        keys = [key for key, _ in entries]
+        refs = [ref for _, ref in entries]
+        return cls(_State(keys, refs, items, cls._top(keys, refs)))
+
+    def apply(self, db: Session, changed: dict[str, set[int]]) -> None:
+        """Re-read just these rows (one query per level) and swap them in."""
+        with self._write_lock:
+            state = self._state
+            keys, refs, items, top = list(state.keys), list(state.refs), dict(state.items), dict(state.top)
+            touched: set[str] = set()
+            stale: set[str] = set()  # ranked lists that held a changed item
+            added: dict[str, list[tuple]] = defaultdict(list)
+
+            for entity, ids in changed.items():
+                fresh = {row[0]: row for row in self._load(db, entity, ids)}
+                for id_ in ids:
+                    old = items.pop((entity, id_), None)
+                    if old is not None:
+                        for key, ref in _refs(entity, id_, old[0], old[1]):
+                            # Only among this key's entries; not found is a no-op
+                            lo = bisect.bisect_left(keys, key)
+                            hi = bisect.bisect_right(keys, key, lo)
+                            i = next((i for i in range(lo, hi) if refs[i] == ref), None)
+                            if i is not None:
+                                del keys[i], refs[i]
+                            for prefix in _prefixes(key):
+                                touched.add(prefix)
+                                if prefix in top and any(r[3:] == (entity, id_) for r in top[prefix]):
+                                    stale.add(prefix)
+                    if id_ in fresh:
+                        _, title, slug, parent_id = fresh[id_]
+                        items[(entity, id_)] = (title, slug, parent_id)
+                        for key, ref in _refs(entity, id_, title, slug):
+                            i = bisect.bisect_right(keys, key)
+                            keys.insert(i, key)
+                            refs.insert(i, ref)
+                            for prefix in _prefixes(key):
+                                touched.add(prefix)
+                                added[prefix].append(ref)
+
+            for prefix in touched:
+                lo, hi = _range(keys, prefix)
+                if hi - lo <= SCAN_LIMIT:
+                    top.pop(prefix, None)
+                elif prefix in stale or prefix not in top:
+                    top[prefix] = _rank(refs, lo, hi, MAX_RESULTS)
+                elif prefix in added:
+                    top[prefix] = _best(sorted(top[prefix] + added[prefix]), MAX_RESULTS)
+            self._state = _State(keys, refs, items, top)
+
+    # ---------- querying ----------
+    @staticmethod
+    def _path(items, entity: str, id_: int) -> str | None:
+        slugs = []
+        while True:
+            item = items.get((entity, id_))
+            if item is None:
+                return None  # under a row that is no longer active
+            slugs.append(item[1])
+            if entity not in PARENT:
+                return "/".join(reversed(slugs))
+            entity, id_ = PARENT[entity], item[2]
+
+    def search(self, q: str, limit: int) -> list[dict]:
+        prefix = normalize(q)
+        if not prefix:
+            return []
+        state = self._state
+        hits = state.top.get(prefix)
+        if hits is None:
+            lo, hi = _range(state.keys, prefix)
+            hits = _best(sorted(state.refs[lo:hi]), MAX_RESULTS)
+
+        results = self._results(state, hits, limit)
+        if len(results) < limit and len(hits) == MAX_RESULTS:
+            # Items under an inactive row took places: rank the whole range
+            lo, hi = _range(state.keys, prefix)
+            results = self._results(state, _best(sorted(state.refs[lo:hi]), hi - lo), limit)
+        return results
+
+    def _results(self, state: _State, hits: list[tuple], limit: int) -> list[dict]:
+        results = []
+        for *_, entity, id_ in hits:
+            path = self._path(state.items, entity, id_)
+            if path is not None:
+                title, slug, _ = state.items[(entity, id_)]
+                results.append({"entity": entity, "id": id_, "title": title, "slug": slug, "path": path})
+                if len(results) == limit:
+                    break
+        return results
+
+
+# ======================================================
+# Per-process instance
+# ======================================================
+
+_index: PrefixIndex | None = None
+_built_at = 0.0
+_lock = threading.Lock()  # writers: first build, applying changes, swapping a rebuild in
+_rebuilding = threading.Lock()
+_pending: dict[str, set[int]] = defaultdict(set)
+_since: dict[str, set[int]] | None = None  # commits during a rebuild
+_pending_lock = threading.Lock()
+
+
+def _take() -> dict[str, set[int]]:
+    with _pending_lock:
+        changed = dict(_pending)
+        _pending.clear()
+    return changed
+
+
+def get_index(db: Session) -> PrefixIndex:
+    """
+    The current index: this worker's own catalog commits are applied
+    row by row before the next query; other workers' writes are picked
+    up by a rebuild in a background thread once it is older than
+    CACHE_TTL_SECONDS, the old index serving until the new one is
+    swapped in. Only the first build keeps a request waiting.
+    """
+    global _index, _built_at
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _take()
+                _index, _built_at = PrefixIndex.build(db), time.monotonic()
+    # Held by another thread: it is applying them, or about to swap
+    if _pending and _lock.acquire(blocking=False):
+        try:
+            changed = _take()
+            if changed:
+                _index.apply(db, changed)
+        finally:
+            _lock.release()
+    if time.monotonic() - _built_at >= settings.CACHE_TTL_SECONDS:
+        schedule_rebuild()
+    return _index
+
+
+def schedule_rebuild() -> None:
+    """Rebuild in a background thread; one at a time."""
+    if _rebuilding.acquire(blocking=False):
+        threading.Thread(target=_rebuild, name="autocomplete-rebuild", daemon=True).start()
+
+
+def _rebuild() -> None:
+    global _index, _built_at, _since
+    try:
+        with _pending_lock:
+            _since = defaultdict(set)
+        with SessionLocal() as db:
+            index = PrefixIndex.build(db)
+            with _lock:
+                with _pending_lock:
+                    changed, _since = _since, None
+                # Committed while it was being built (re-reading is harmless)
+                if changed:
+                    index.apply(db, changed)
+                _index = index
+    except Exception:
+        logger.exception("Autocomplete index rebuild failed")
+    finally:
+        with _pending_lock:
+            _since = None
+        # Also after a failure: retried once the index is stale again
+        _built_at = time.monotonic()
+        _rebuilding.release()
+
+
+def reset_index() -> None:
+    global _index
+    with _lock:
+        _index = None
+
+
+@on_commit
+def track_changes(changes: list[Change]) -> None:
+    with _pending_lock:
+        for change in changes:
+            if change.entity in MODELS:
+                _pending[change.entity].add(change.id)
+                if _since is not None:
+                    _since[change.entity].add(change.id)
+
+
+def autocomplete(db: Session, q: str, limit: int) -> list[dict]:
+    return get_index(db).search(q, limit)
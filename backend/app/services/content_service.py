@@ -0,0 +1,58 @@
+import logging
+
+from sqlalchemy import null, select, update
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.crud.base import CRUDBase
+from app.crud.crud_content_block import crud_content_block
+from app.schemas.content_block import ContentBlockPage
+
+logger = logging.getLogger("app.content")
+
+
+def get_blocks(
+    db: Session, crud: CRUDBase, owner_id: int, offset: int, limit: int, label: str
+) -> ContentBlockPage:
+    """A page of an owner's content blocks, from whichever storage holds them."""
+    total = crud_content_block.count(db, crud.entity, owner_id)
+    if total:
+        items = crud_content_block.get_page(db, crud.entity, owner_id, offset, limit)
+    else:
+        # Not migrated (or written with CONTENT_STORAGE=json): slice the column
+        row = crud.get_fields(db, owner_id, ["content"])
+        if row is None:
+            raise HTTPException(404, f"{label} not found")
+        content = row.content or []
+        total, items = len(content), content[offset:offset + limit]
+
+    return ContentBlockPage(total=total, offset=offset, limit=limit, items=items)
+
+
+def migrate_to_blocks(db: Session, crud: CRUDBase, batch_size: int = 100) -> int:
+    """
+    Move `content` of every row still holding it in the JSON column into
+    content_blocks, one committed batch at a time. Safe to re-run.
+    """
+    model, moved = crud.model, 0
+    while True:
+        rows = db.execute(
+            select(model.id, model.content)
+            .where(model.content.is_not(None))
+            .order_by(model.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return moved
+        for row in rows:
+            if row.content:  # a JSON 'null' is just cleared below
+                crud_content_block.replace(db, crud.entity, row.id, row.content)
+        db.execute(
+            update(model)
+            .where(model.id.in_([row.id for row in rows]))
+            .values(content=null()),  # SQL NULL, not JSON 'null'
+            execution_options={"synchronize_session": False},
+        )
+        db.commit()
+        moved += len(rows)
+        logger.info("Moved content of %d %s rows to content_blocks", moved, crud.entity)
@@ -0,0 +1,140 @@
+import copy
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import JSON, null
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.crud.crud_content_block import BLOCK_OWNERS, crud_content_block
+from app.schemas.json_patch import JsonPatchResult, PatchOperation
+from app.services.revision_service import record_revision
+from app.utils.json_patch import (
+    JsonPatchError,
+    JsonPatchTargetError,
+    JsonPatchTestFailed,
+    apply_patch,
+    parse_pointer,
+)
+
+
+def json_sections(crud: CRUDBase, update_schema: type[BaseModel]) -> set[str]:
+    """JSON columns of the model that its update schema lets clients write."""
+    return {
+        name for name, col in crud.model.__table__.columns.items()
+        if isinstance(col.type, JSON)
+    } & update_schema.model_fields.keys()
+
+
+@lru_cache
+def _item_adapter(update_schema: type[BaseModel], section: str) -> TypeAdapter:
+    # Optional[List[ContentBlock]] -> ContentBlock
+    annotation = update_schema.model_fields[section].annotation
+    (list_type,) = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    (item_type,) = typing.get_args(list_type)
+    return TypeAdapter(item_type)
+
+
+def _validate_items(update_schema, section: str, items: list) -> list:
+    adapter = _item_adapter(update_schema, section)
+    result = []
+    for index, item in enumerate(items):
+        try:
+            # Stored like create() stores them: without unset keys
+            item = adapter.dump_python(
+                adapter.validate_python(item), mode="json", exclude_none=True
+            )
+        except ValidationError as e:
+            raise HTTPException(422, [
+                {**error, "loc": [section, index, *error["loc"]]}
+                for error in e.errors(include_url=False, include_context=False)
+            ])
+        result.append(item)
+    return result
+
+
+def patch_sections(
+    db: Session,
+    crud: CRUDBase,
+    update_schema: type[BaseModel],
+    entity_id: int,
+    operations: list[PatchOperation],
+    label: str,
+) -> JsonPatchResult:
+    """
+    Apply a JSON Patch to the JSON sections (content, examples, ...) of
+    one row. Only the sections the patch names (as `path` or `from`) are
+    read and written, and every item of those is validated: a move or copy
+    can carry anything from one section, or one item, into another.
+    """
+    allowed = json_sections(crud, update_schema)
+    ops = [op.model_dump(by_alias=True, exclude_unset=True) for op in operations]
+
+    sections = set()
+    for op in ops:
+        for pointer in (op["path"], op.get("from")):
+            if pointer is None:
+                continue
+            try:
+                tokens = parse_pointer(pointer)
+            except JsonPatchError as e:
+                raise HTTPException(400, str(e))
+            if not tokens or tokens[0] not in allowed:
+                raise HTTPException(
+                    400, f"Path {pointer!r} must start with one of: {', '.join(sorted(allowed))}"
+                )
+            sections.add(tokens[0])
+
+    # Locked until the write commits, so concurrent patches queue up
+    # instead of overwriting each other.
+    row = crud.get_fields(db, entity_id, [*sorted(sections), "updated_at"], for_update=bool(sections))
+    if row is None:
+        raise HTTPException(404, f"{label} not found")
+
+    doc = {section: list(getattr(row, section) or []) for section in sections}
+    in_blocks = (
+        "content" in sections
+        and crud.entity in BLOCK_OWNERS
+        and settings.CONTENT_STORAGE == "blocks"
+    )
+    if in_blocks:
+        # Not-yet-migrated rows still have it in the column
+        doc["content"] = crud_content_block.get_all(db, crud.entity, entity_id) or doc["content"]
+    before = copy.deepcopy(doc)  # for the revision; the patch edits items in place
+    try:
+        apply_patch(doc, ops)
+    except JsonPatchTestFailed as e:
+        raise HTTPException(409, str(e))
+    except JsonPatchTargetError as e:
+        raise HTTPException(422, str(e))
+    except JsonPatchError as e:
+        raise HTTPException(400, str(e))
+
+    values = {}
+    for section, items in doc.items():
+        if not isinstance(items, list):
+            raise HTTPException(422, f"{section} must be a list")
+        values[section] = _validate_items(update_schema, section, items)
+    after = dict(values)
+    if after == before:
+        # Empty patch, only tests, or values set to what they were: no
+        # write and no revision
+        db.rollback()
+        return JsonPatchResult(id=entity_id, updated_at=row.updated_at, sections=after)
+
+    blocks = None
+    if in_blocks:
+        blocks = values["content"]
+        crud_content_block.replace(db, crud.entity, entity_id, blocks)
+        values["content"] = null()
+
+    written = crud.update_fields(db, entity_id, values, commit=False)
+    record_revision(db, crud, entity_id, before, after)
+    db.commit()
+    sections = {section: getattr(written, section) for section in values}
+    if blocks is not None:
+        sections["content"] = blocks
+    return JsonPatchResult(id=entity_id, updated_at=written.updated_at, sections=sections)
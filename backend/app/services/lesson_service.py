@@ -2,9 +2,24 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.crud.crud_lesson import crud_lesson
+from app.crud.crud_sub_topic import crud_sub_topic
+from app.crud.crud_tree import crud_tree
+from app.services.revision_service import create_versioned, update_versioned
 from app.schemas.lesson import LessonCreate, LessonUpdate
+from app.core.tracing import traced
 
 
+# Full reads: content that lives in content_blocks is put back on the rows
+def list_lessons_by_sub_topic(db: Session, sub_topic_id: int):
+    return crud_lesson.load_blocks(db, crud_lesson.get_by_sub_topic(db, sub_topic_id))
+
+
+def get_lesson_by_slug(db: Session, sub_topic_id: int, slug: str):
+    lesson = crud_lesson.get_by_slug(db, sub_topic_id, slug)
+    return crud_lesson.load_blocks(db, [lesson])[0] if lesson else None
+
+
+@traced("lesson")
 def create_lesson(db: Session, payload: LessonCreate):
     existing = crud_lesson.get_by_slug(
         db, payload.sub_topic_id, payload.slug
@@ -15,22 +30,41 @@ def create_lesson(db: Session, payload: LessonCreate):
             "Lesson with this slug already exists in this sub-topic",
         )
 
-    return crud_lesson.create(db, payload)
+    return create_versioned(db, crud_lesson, payload)
 
 
+@traced("lesson")
 def update_lesson(
     db: Session, lesson_id: int, payload: LessonUpdate
 ):
     lesson = crud_lesson.get(db, lesson_id)
     if not lesson:
         raise HTTPException(404, "Lesson not found")
+    if payload.sub_topic_id and not crud_sub_topic.get(db, payload.sub_topic_id):
+        raise HTTPException(404, "SubTopic not found")
 
-    return crud_lesson.update(db, lesson, payload)
+    return update_versioned(db, crud_lesson, lesson, payload)
 
 
+@traced("lesson")
 def delete_lesson(db: Session, lesson_id: int):
     lesson = crud_lesson.get(db, lesson_id)
     if not lesson:
         raise HTTPException(404, "Lesson not found")
 
-    crud_lesson.soft_delete(db, lesson)
+    crud_tree.deactivate(db, "lesson", lesson.id)
+
+
+@traced("lesson")
+def restore_lesson(db: Session, lesson_id: int):
+    lesson = crud_lesson.get(db, lesson_id)
+    if not lesson:
+        raise HTTPException(404, "Lesson not found")
+    if lesson.is_active:
+        raise HTTPException(400, "Lesson is not deleted")
+
+    parent = crud_tree.inactive_parent(db, "lesson", lesson)
+    if parent:
+        raise HTTPException(400, f"Restore the parent {parent} first")
+
+    crud_tree.restore(db, "lesson", lesson.id)
@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.storage import media_storage
+from app.crud.crud_media import crud_media
+from app.models.media_asset import MediaAsset
+from app.utils.images import (
+    CONTENT_TYPES,
+    ImageError,
+    encode_variant,
+    media_url,
+    open_image,
+    original_key,
+    variant_formats,
+    variant_key,
+    variant_widths,
+)
+
+logger = logging.getLogger("app.media")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _encoder_pool() -> ProcessPoolExecutor:
+    # Encoding AVIF is CPU-bound: separate processes, started on first
+    # upload. Locked so concurrent first uploads start just one pool.
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=settings.MEDIA_WORKERS)
+    return _pool
+
+
+def upload_image(db: Session, data: bytes, user_id: int | None = None) -> MediaAsset:
+    """
+    Store an image and its resized variants (every MEDIA_VARIANT_WIDTHS
+    width below the original, plus the original width, in each of
+    MEDIA_FORMATS). The same file uploaded twice is stored once.
+    """
+    if len(data) > settings.MEDIA_MAX_UPLOAD_BYTES:
+        raise HTTPException(413, "Image is too large")
+
+    sha256 = hashlib.sha256(data).hexdigest()
+    existing = crud_media.get_by_sha(db, sha256)
+    if existing:
+        return existing
+
+    try:
+        image = open_image(data)
+    except ImageError as e:
+        raise HTTPException(400, str(e))
+    width, height = image.size
+
+    storage = media_storage()
+    key = original_key(sha256, width, height, image.format)
+    storage.save(key, data, CONTENT_TYPES[image.format])
+
+    # One job per width, each encoding every format
+    formats = variant_formats()
+    widths = variant_widths(width)
+    variants = []
+    jobs = _encoder_pool().map(encode_variant, [data] * len(widths), widths, [formats] * len(widths))
+    for variant_width, encoded in zip(widths, jobs):
+        variant_height = max(1, round(height * variant_width / width))
+        for fmt, body in encoded.items():
+            variant = variant_key(key, variant_width, fmt)
+            storage.save(variant, body, f"image/{fmt}")
+            variants.append({
+                "format": fmt,
+                "width": variant_width,
+                "height": variant_height,
+                "url": media_url(variant),
+                "size_bytes": len(body),
+            })
+
+    try:
+        asset = crud_media.create(db, {
+            "sha256": sha256,
+            "url": media_url(key),
+            "content_type": CONTENT_TYPES[image.format],
+            "width": width,
+            "height": height,
+            "size_bytes": len(data),
+            "variants": variants,
+            "uploaded_by": user_id,
+        })
+    except IntegrityError:
+        # Uploaded concurrently; the files written were identical
+        db.rollback()
+        return crud_media.get_by_sha(db, sha256)
+
+    logger.info("Stored media %s (%dx%d) with %d variants", asset.id, width, height, len(variants))
+    return asset
+
+
+def get_asset(db: Session, asset_id: int) -> MediaAsset:
+    asset = crud_media.get(db, asset_id)
+    if not asset:
+        raise HTTPException(404, "Media not found")
+    return asset
@@ -2,9 +2,13 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.crud.crud_module import crud_module
+from app.crud.crud_technology import crud_technology
+from app.crud.crud_tree import crud_tree
 from app.schemas.module import ModuleCreate, ModuleUpdate
+from app.core.tracing import traced
 
 
+@traced("module")
 def create_module(db: Session, payload: ModuleCreate):
     existing = crud_module.get_by_slug(
         db, payload.technology_id, payload.slug
@@ -18,19 +22,38 @@ def create_module(db: Session, payload: ModuleCreate):
     return crud_module.create(db, payload)
 
 
+@traced("module")
 def update_module(
     db: Session, module_id: int, payload: ModuleUpdate
 ):
     module = crud_module.get(db, module_id)
     if not module:
         raise HTTPException(404, "Module not found")
+    if payload.technology_id and not crud_technology.get(db, payload.technology_id):
+        raise HTTPException(404, "Technology not found")
 
     return crud_module.update(db, module, payload)
 
 
+@traced("module")
 def delete_module(db: Session, module_id: int):
     module = crud_module.get(db, module_id)
     if not module:
         raise HTTPException(404, "Module not found")
 
-    crud_module.soft_delete(db, module)
+    crud_tree.deactivate(db, "module", module.id)
+
+
+@traced("module")
+def restore_module(db: Session, module_id: int):
+    module = crud_module.get(db, module_id)
+    if not module:
+        raise HTTPException(404, "Module not found")
+    if module.is_active:
+        raise HTTPException(400, "Module is not deleted")
+
+    parent = crud_tree.inactive_parent(db, "module", module)
+    if parent:
+        raise HTTPException(400, f"Restore the parent {parent} first")
+
+    crud_tree.restore(db, "module", module.id)
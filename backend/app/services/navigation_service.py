@@ -0,0 +1,150 @@
+from collections import defaultdict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.crud.crud_reading_order import crud_reading_order
+from app.models import Lesson, Module, ReadingOrder, SubTopic, Technology, Topic
+from app.schemas.navigation import NavigationItem, NavigationResponse
+
+# Entities that appear in the reading order.
+NAV_MODELS = {
+    "topic": Topic,
+    "sub_topic": SubTopic,
+    "lesson": Lesson,
+}
+
+# Columns the sequence is built from: placement, order, on / off, and
+# the slug and title copied into it. Edits of anything else (content,
+# SEO, media) leave it as it is.
+SEQUENCE_FIELDS = frozenset({
+    "roadmap_id", "technology_id", "module_id", "topic_id", "sub_topic_id",
+    "order_index", "is_active", "slug", "title",
+})
+
+
+# ======================================================
+# Building the sequence
+# ======================================================
+
+def _active(db: Session, model, technology_id: int, *columns):
+    return db.execute(
+        select(model.id, *columns)
+        .where(model.technology_id == technology_id, model.is_active.is_(True))
+        .order_by(model.order_index, model.id)
+    ).all()
+
+
+def build_sequence(db: Session, technology_id: int) -> list[dict]:
+    """
+    Depth-first walk (module -> topic -> sub-topic -> lesson) over the
+    active rows of one technology; one query per level. Children of an
+    inactive parent are left out with it.
+    """
+    topics, sub_topics, lessons = defaultdict(list), defaultdict(list), defaultdict(list)
+    for row in _active(db, Topic, technology_id, Topic.module_id, Topic.slug, Topic.title):
+        topics[row.module_id].append(row)
+    for row in _active(db, SubTopic, technology_id, SubTopic.topic_id, SubTopic.slug, SubTopic.title):
+        sub_topics[row.topic_id].append(row)
+    for row in _active(db, Lesson, technology_id, Lesson.sub_topic_id, Lesson.slug, Lesson.title):
+        lessons[row.sub_topic_id].append(row)
+
+    sequence = []
+
+    def add(entity, row):
+        sequence.append({
+            "entity": entity,
+            "entity_id": row.id,
+            "technology_id": technology_id,
+            "seq": len(sequence),
+            "slug": row.slug,
+            "title": row.title,
+        })
+
+    for module in _active(db, Module, technology_id):
+        for topic in topics[module.id]:
+            add("topic", topic)
+            for sub_topic in sub_topics[topic.id]:
+                add("sub_topic", sub_topic)
+                for lesson in lessons[sub_topic.id]:
+                    add("lesson", lesson)
+    return sequence
+
+
+def technologies_for(db: Session, entity: str, ids: list[int]) -> set[int]:
+    """Technologies whose sequence a write to these rows may have changed."""
+    if entity == "technology":
+        return set(ids)
+    if entity == "roadmap":
+        return set(db.scalars(select(Technology.id).where(Technology.roadmap_id.in_(ids))))
+
+    model = {"module": Module, **NAV_MODELS}.get(entity)
+    if model is None:
+        return set()
+    found = set(db.scalars(select(model.technology_id).where(model.id.in_(ids))))
+    # A row moved to another technology must also leave its old sequence.
+    found.update(db.scalars(
+        select(ReadingOrder.technology_id)
+        .where(ReadingOrder.entity == entity, ReadingOrder.entity_id.in_(ids))
+    ))
+    return found
+
+
+def rebuild(db: Session, technology_ids) -> None:
+    """
+    One transaction per technology. Rebuilds of the same technology (two
+    queued jobs, two Celery workers) take turns on its lock, so the second
+    reads what the first committed instead of racing it on the unique seq.
+    """
+    for technology_id in sorted(technology_ids):
+        crud_reading_order.lock(db, technology_id)
+        crud_reading_order.replace(db, technology_id, build_sequence(db, technology_id))
+        db.commit()
+
+
+# ======================================================
+# Reads
+# ======================================================
+
+def get_navigation(db: Session, entity: str, entity_id: int) -> NavigationResponse:
+    model = NAV_MODELS.get(entity)
+    if model is None:
+        raise HTTPException(404, "Unknown entity")
+
+    row = crud_reading_order.get(db, entity, entity_id)
+    if row is not None:
+        neighbours = crud_reading_order.get_neighbours(db, row.technology_id, row.seq)
+        total = crud_reading_order.count(db, row.technology_id)
+        return _response(entity, entity_id, row.technology_id, row.seq, total,
+                         neighbours.get(row.seq - 1), neighbours.get(row.seq + 1))
+
+    # Not stored yet (the rebuild job is still queued): work the sequence
+    # out without writing it, which is left to the job
+    obj = db.get(model, entity_id)
+    if obj is None or not obj.is_active:
+        raise HTTPException(404, "Page not found")
+    sequence = build_sequence(db, obj.technology_id)
+    seq = next(
+        (item["seq"] for item in sequence if item["entity"] == entity and item["entity_id"] == entity_id),
+        None,
+    )
+    if seq is None:
+        # Active itself, but under an inactive parent
+        raise HTTPException(404, "Page not found")
+    prev = sequence[seq - 1] if seq > 0 else None
+    next_ = sequence[seq + 1] if seq + 1 < len(sequence) else None
+    return _response(entity, entity_id, obj.technology_id, seq, len(sequence), prev, next_)
+
+
+def _response(entity, entity_id, technology_id, seq, total, prev, next_) -> NavigationResponse:
+    # prev / next_: ReadingOrder rows or build_sequence items, or None
+    return NavigationResponse(
+        entity=entity,
+        entity_id=entity_id,
+        technology_id=technology_id,
+        position=seq + 1,
+        total=total,
+        prev=NavigationItem.model_validate(prev) if prev else None,
+        next=NavigationItem.model_validate(next_) if next_ else None,
+    )
@@ -0,0 +1,176 @@
+import logging
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.crud_progress import crud_progress
+from app.db.session import SessionLocal
+from app.models import Lesson
+from app.schemas.progress import (
+    LessonProgressResponse,
+    ModuleProgress,
+    ProgressEvent,
+    TechnologyProgress,
+)
+
+logger = logging.getLogger("app.progress")
+
+
+class ProgressBuffer:
+    """
+    Write-behind buffer for progress events, per worker.
+
+    Events for the same (user, lesson) are merged in memory and written
+    every PROGRESS_FLUSH_SECONDS (or once PROGRESS_BUFFER_SIZE entries are
+    pending) as one bulk upsert. A crash loses at most one interval.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._pending: dict[tuple[int, int], dict] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_scheduled = False  # a flush thread started and not yet run
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _merge(self, new: dict) -> None:
+        # Caller holds self._lock
+        entry = self._pending.setdefault((new["user_id"], new["lesson_id"]), new)
+        if entry is not new:
+            entry["percent"] = max(entry["percent"], new["percent"])
+            if new["completed"] and not entry["completed"]:
+                entry["completed"], entry["completed_at"] = True, new["completed_at"]
+
+    def add(self, user_id: int, lesson_id: int, event: ProgressEvent) -> None:
+        entry = {
+            "user_id": user_id,
+            "lesson_id": lesson_id,
+            "percent": 100 if event.completed else event.percent or 0,
+            "completed": event.completed,
+            "completed_at": datetime.now(timezone.utc) if event.completed else None,
+        }
+        with self._lock:
+            self._merge(entry)
+            start = len(self._pending) >= settings.PROGRESS_BUFFER_SIZE and not self._flush_scheduled
+            if start:
+                self._flush_scheduled = True
+        if start:
+            threading.Thread(target=self.flush, daemon=True).start()
+
+    def pending(self, user_id: int) -> dict[int, dict]:
+        """This worker's unwritten entries for one user, by lesson id."""
+        with self._lock:
+            return {
+                lesson_id: dict(entry)
+                for (uid, lesson_id), entry in self._pending.items()
+                if uid == user_id
+            }
+
+    def _take(self, user_id: int | None) -> list[dict]:
+        with self._lock:
+            if user_id is None:
+                # Events from here on may schedule the next one
+                self._flush_scheduled = False
+            keys = [key for key in self._pending if user_id is None or key[0] == user_id]
+            return [self._pending.pop(key) for key in keys]
+
+    def flush(self, user_id: int | None = None) -> int:
+        """Write the pending entries (or just one user's); returns rows written."""
+        with self._flush_lock:
+            rows = self._take(user_id)
+            if not rows:
+                return 0
+            try:
+                with self.session_factory() as db:
+                    # Events for lessons deleted meanwhile would fail the batch
+                    known = set(db.scalars(
+                        select(Lesson.id).where(Lesson.id.in_({row["lesson_id"] for row in rows}))
+                    ))
+                    rows = [row for row in rows if row["lesson_id"] in known]
+                    crud_progress.upsert_many(db, rows)
+                    db.commit()
+            except Exception:
+                # Kept for the next attempt, merged with anything newer
+                with self._lock:
+                    for row in rows:
+                        self._merge(row)
+                raise
+            return len(rows)
+
+    # ---------- background flushing ----------
+    def _run(self) -> None:
+        while not self._stop.wait(settings.PROGRESS_FLUSH_SECONDS):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Progress flush failed")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="progress-flush", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher and write what is left."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+progress_buffer = ProgressBuffer()
+
+
+# ======================================================
+# Reads (stored rows, then this worker's pending events)
+# ======================================================
+
+def record_progress(user_id: int, lesson_id: int, event: ProgressEvent) -> None:
+    progress_buffer.add(user_id, lesson_id, event)
+
+
+def get_lesson_progress(db: Session, user_id: int, lesson_id: int) -> LessonProgressResponse:
+    stored = crud_progress.get(db, user_id, lesson_id)
+    result = (
+        LessonProgressResponse.model_validate(stored)
+        if stored else LessonProgressResponse(lesson_id=lesson_id)
+    )
+    pending = progress_buffer.pending(user_id).get(lesson_id)
+    if pending:
+        result.percent = max(result.percent, pending["percent"])
+        if pending["completed"] and not result.completed:
+            result.completed, result.completed_at = True, pending["completed_at"]
+    return result
+
+
+def _percent(done: int, total: int) -> float:
+    return round(100 * done / total, 1) if total else 0.0
+
+
+def get_technology_progress(db: Session, user_id: int, technology_id: int) -> TechnologyProgress:
+    # Counting completed lessons needs them all in the table
+    progress_buffer.flush(user_id)
+    modules = [
+        ModuleProgress(
+            module_id=row.module_id,
+            total=row.total,
+            completed=row.completed,
+            percent=_percent(row.completed, row.total),
+        )
+        for row in crud_progress.by_module(db, user_id, technology_id)
+    ]
+    total = sum(m.total for m in modules)
+    completed = sum(m.completed for m in modules)
+    return TechnologyProgress(
+        technology_id=technology_id,
+        total=total,
+        completed=completed,
+        percent=_percent(completed, total),
+        modules=modules,
+    )
@@ -0,0 +1,224 @@
+import json
+from collections import defaultdict
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.cache import published_cache, snapshot_cache
+from app.core.config import settings
+from app.crud.crud_content_block import BLOCK_OWNERS, crud_content_block
+from app.crud.crud_published import crud_published
+from app.crud.crud_related import crud_related
+from app.crud.crud_roadmap import crud_roadmap
+from app.crud.crud_tree import LEVELS, crud_tree
+from app.schemas.content_block import ContentBlockPage
+from app.schemas.lesson import LessonBase
+from app.schemas.module import ModuleBase
+from app.schemas.publish import PublishedRoadmapResponse, PublishResult
+from app.schemas.roadmap import RoadmapBase
+from app.schemas.sub_topic import SubTopicBase
+from app.schemas.technology import TechnologyBase
+from app.schemas.topic import TopicBase
+from app.services.view_service import record_view
+from app.utils.images import srcset
+
+# What a published page shows of each level (no nested children: those
+# are listed as links and published as pages of their own).
+PAGE_SCHEMAS = {
+    "roadmap": RoadmapBase,
+    "technology": TechnologyBase,
+    "module": ModuleBase,
+    "topic": TopicBase,
+    "sub_topic": SubTopicBase,
+    "lesson": LessonBase,
+}
+CHILD = {name: child for (name, _), (child, _) in zip(LEVELS, LEVELS[1:])}
+
+
+# ======================================================
+# Building a version
+# ======================================================
+
+def _link(entity: str, obj) -> dict:
+    return {"entity": entity, "id": obj.id, "slug": obj.slug, "title": obj.title}
+
+
+def build_pages(db: Session, roadmap, version: int) -> list[dict]:
+    """
+    Every active page of the roadmap as `published_pages` rows, bodies
+    serialized once here. One query per level (plus one per level for
+    content blocks, and one for related pages); rows under an inactive
+    parent are left out with it. Related pages are kept if they are part
+    of this version, with their path.
+    """
+    levels = crud_tree.subtree(db, "roadmap", roadmap)
+    children = defaultdict(list)
+    for (parent, _), (name, _) in zip(LEVELS, LEVELS[1:]):
+        for obj in levels[name]:
+            children[(parent, getattr(obj, f"{parent}_id"))].append(obj)
+
+    blocks = {}
+    if settings.CONTENT_STORAGE == "blocks":
+        for name in BLOCK_OWNERS:
+            ids = [obj.id for obj in levels[name]]
+            blocks[name] = crud_content_block.get_for_owners(db, name, ids) if ids else {}
+
+    # Paths first: related links point across the tree
+    nodes, paths = [], {}
+
+    def walk(entity: str, obj, path: str, breadcrumbs: list[dict]) -> None:
+        nodes.append((entity, obj, path, breadcrumbs))
+        paths[(entity, obj.id)] = path
+        for kid in children[(entity, obj.id)]:
+            walk(CHILD[entity], kid, f"{path}/{kid.slug}", [*breadcrumbs, _link(entity, obj)])
+
+    walk("roadmap", roadmap, roadmap.slug, [])
+    related = crud_related.get_many(db, {
+        (entity, obj.id) for entity, obj, _, _ in nodes if entity in BLOCK_OWNERS
+    })
+
+    pages = []
+    for entity, obj, path, breadcrumbs in nodes:
+        item = PAGE_SCHEMAS[entity].model_validate(obj, from_attributes=True)
+        item = {"id": obj.id, **item.model_dump(mode="json", exclude={"is_active"})}
+        if obj.id in blocks.get(entity, {}):
+            item["content"] = blocks[entity][obj.id]
+        if "image_banner_url" in item:
+            item["image_banner_srcset"] = srcset(item["image_banner_url"])
+        body = {
+            "entity": entity,
+            "version": version,
+            "breadcrumbs": breadcrumbs,
+            "item": item,
+            "children": [_link(CHILD[entity], kid) for kid in children[(entity, obj.id)]],
+        }
+        if entity in BLOCK_OWNERS:
+            body["related"] = [
+                {"entity": row.related_entity, "id": row.related_id, "slug": row.slug,
+                 "title": row.title, "score": row.score,
+                 "path": paths[(row.related_entity, row.related_id)]}
+                for row in related[(entity, obj.id)]
+                if (row.related_entity, row.related_id) in paths
+            ]
+        pages.append({
+            "roadmap_id": roadmap.id,
+            "version": version,
+            "path": path,
+            "entity": entity,
+            "entity_id": obj.id,
+            "body": json.dumps(body, separators=(",", ":")),
+        })
+    return pages
+
+
+def publish_roadmap(db: Session, roadmap_id: int, user_id: int | None = None) -> PublishResult:
+    """
+    Freeze the roadmap's current draft as a new version and make it the
+    live one. Earlier versions stay readable until pruned.
+    """
+    # Locked until commit: concurrent publishes of one roadmap queue up
+    row = crud_roadmap.get_fields(db, roadmap_id, ["is_active"], for_update=True)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    if not row.is_active:
+        raise HTTPException(status_code=400, detail="Cannot publish a deleted roadmap")
+
+    roadmap = crud_roadmap.get(db, roadmap_id)
+    live = crud_published.get(db, roadmap_id)
+    version = live.version + 1 if live else 1
+
+    pages = build_pages(db, roadmap, version)
+    crud_published.add_pages(db, pages)
+    live = crud_published.set_live(db, roadmap_id, {
+        "version": version,
+        "slug": roadmap.slug,
+        "title": roadmap.title,
+        "published_at": func.now(),
+        "published_by": user_id,
+    })
+    crud_published.prune(db, roadmap_id, version - settings.PUBLISHED_VERSIONS_KEPT)
+    db.commit()
+
+    # Page bodies are keyed by version; only the pointers go stale
+    published_cache.invalidate()
+    _rewarm()
+    return PublishResult(
+        **PublishedRoadmapResponse.model_validate(live).model_dump(), pages=len(pages)
+    )
+
+
+def unpublish_roadmap(db: Session, roadmap_id: int) -> None:
+    if crud_published.get(db, roadmap_id) is None:
+        raise HTTPException(status_code=404, detail="Roadmap is not published")
+    crud_published.remove(db, roadmap_id)
+    db.commit()
+    published_cache.invalidate()
+    _rewarm()
+
+
+def _rewarm() -> None:
+    # Shared by every worker with Redis: refill the entry points once,
+    # off the request (a memory cache refills on each worker's next miss)
+    if settings.CACHE_BACKEND == "redis":
+        from app.worker.tasks import warm_cache
+
+        warm_cache.delay()
+
+
+# ======================================================
+# Public reads (published versions only)
+# ======================================================
+
+def list_published(db: Session):
+    return published_cache.get_or_set("roadmaps", lambda: [
+        PublishedRoadmapResponse.model_validate(r).model_dump(mode="json")
+        for r in crud_published.get_all(db)
+    ])
+
+
+def live_version(db: Session, slug: str) -> dict | None:
+    def load():
+        live = crud_published.get_by_slug(db, slug)
+        if live:
+            return {"roadmap_id": live.roadmap_id, "version": live.version}
+
+    return published_cache.get_or_set(f"slug:{slug}", load)
+
+
+def _live_page(db: Session, path: str) -> tuple[int, int, list]:
+    # (roadmap id, version, [entity, entity_id, body]) of the live page at `path`
+    slugs = [part for part in path.split("/") if part]
+    live = live_version(db, slugs[0]) if slugs else None
+    if live is None:
+        raise HTTPException(404, "Page not found")
+
+    roadmap_id, version, path = live["roadmap_id"], live["version"], "/".join(slugs)
+
+    def load():
+        page = crud_published.get_page(db, roadmap_id, version, path)
+        return list(page) if page else None
+
+    page = snapshot_cache.get_or_set(f"page:{roadmap_id}:{version}:{path}", load)
+    if page is None:
+        raise HTTPException(404, "Page not found")
+    return roadmap_id, version, page
+
+
+def get_published_page(db: Session, path: str) -> tuple[str, str]:
+    """
+    Body of the live page at `path` ("frontend/react/hooks") and its
+    ETag, counted as a view. Nothing here reads the draft tables.
+    """
+    roadmap_id, version, (entity, entity_id, body) = _live_page(db, path)
+    record_view(entity, entity_id)
+    return body, f'"{roadmap_id}.{version}"'
+
+
+def get_published_blocks(db: Session, path: str, offset: int, limit: int) -> ContentBlockPage:
+    """A page of the content blocks of the live page at `path`, for loading long pages in parts."""
+    _, _, (_, _, body) = _live_page(db, path)
+    content = json.loads(body)["item"].get("content") or []
+    return ContentBlockPage(
+        total=len(content), offset=offset, limit=limit, items=content[offset:offset + limit]
+    )
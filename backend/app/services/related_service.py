@@ -0,0 +1,344 @@
+import threading
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.crud.crud_content_block import BLOCK_OWNERS, crud_content_block
+from app.crud.crud_related import crud_related
+from app.crud.crud_tree import LEVELS
+from app.schemas.related import RelatedItem
+
+# Pages that get (and are) related content
+MODELS = {name: model for name, model in LEVELS if name in BLOCK_OWNERS}
+
+TITLE_WEIGHT = 3  # a title word counts as much as three in the body
+
+# Block fields holding markup or addresses rather than prose
+SKIP_KEYS = {"type", "language", "url", "src", "href", "image", "variant"}
+
+
+# ======================================================
+# Corpus
+# ======================================================
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in SKIP_KEYS:
+                yield from _strings(item)
+
+
+def _document(title: str, description: str | None, content) -> Counter:
+    from app.utils.tfidf import tokenize
+
+    terms = Counter(tokenize(title))
+    for term in terms:
+        terms[term] *= TITLE_WEIGHT
+    terms.update(tokenize(description or ""))
+    for text in _strings(content or []):
+        terms.update(tokenize(text))
+    return terms
+
+
+def load_corpus(
+    db: Session, entity: str | None = None, ids: list[int] | None = None
+) -> tuple[list[tuple[str, int]], list[Counter], list[dict]]:
+    """
+    Every active page (or just these of one entity) as (entity, id) keys,
+    term counts of its title, description and content blocks, and the
+    link fields copied into related_content. Two queries per level.
+    """
+    keys, docs, links = [], [], []
+    for name, model in MODELS.items():
+        if entity is not None and name != entity:
+            continue
+        q = (
+            select(model.id, model.slug, model.title, model.description, model.content)
+            .where(model.is_active.is_(True))
+            .order_by(model.id)
+        )
+        if ids is not None:
+            q = q.where(model.id.in_(ids))
+        rows = db.execute(q).all()
+        blocks = (
+            crud_content_block.get_for_owners(db, name, ids)
+            if settings.CONTENT_STORAGE == "blocks" else {}
+        )
+        for row in rows:
+            keys.append((name, row.id))
+            docs.append(_document(row.title, row.description, blocks.get(row.id) or row.content))
+            links.append({"related_entity": name, "related_id": row.id,
+                          "slug": row.slug, "title": row.title})
+    return keys, docs, links
+
+
+# ======================================================
+# Model (related_model, related_vectors)
+# ======================================================
+
+@dataclass
+class _Model:
+    """
+    What rebuild_all scored with, kept for refresh: a page per matrix
+    row (its links None once it is gone, its row then all zeros), and
+    the vocabulary and idf its rows are weighted by. Stored in the
+    database so every worker scores against the same one; `generation`
+    and `seq` say which rebuild and refresh this copy is as of.
+    """
+    generation: str
+    seq: int
+    keys: list[tuple[str, int]]
+    links: list[dict | None]
+    vocabulary: dict[str, int]
+    idf: object  # np.ndarray
+    matrix: object  # sparse.csr_matrix
+
+    @classmethod
+    def fit(cls, db: Session) -> "_Model":
+        from app.utils.tfidf import fit
+
+        keys, docs, links = load_corpus(db)
+        matrix, vocabulary, idf = fit(docs)
+        return cls(uuid.uuid4().hex, 0, keys, links, vocabulary, idf, matrix)
+
+    @classmethod
+    def load(cls, db: Session, head) -> "_Model":
+        import numpy as np
+        from scipy import sparse
+
+        vocabulary = {term: col for col, term in enumerate(head.terms)}
+        idf = np.frombuffer(head.idf, dtype=np.float64)
+        model = cls(head.generation, head.seq, [], [], vocabulary, idf,
+                    sparse.csr_matrix((0, len(vocabulary))))
+        rows = crud_related.vectors(db, head.generation)
+        model.keys = [(row.entity, row.entity_id) for row in rows]
+        model.links = [_link(row) for row in rows]
+        model.matrix = _matrix(rows, len(vocabulary))
+        return model
+
+    def catch_up(self, db: Session, head) -> None:
+        """Apply the vectors other workers' refreshes wrote since this copy."""
+        from app.utils.tfidf import replace_rows
+
+        rows = crud_related.vectors(db, self.generation, after=self.seq)
+        index = {key: row for row, key in enumerate(self.keys)}
+        placed = []
+        for row in rows:
+            key = (row.entity, row.entity_id)
+            if key not in index:
+                index[key] = len(self.keys)
+                self.keys.append(key)
+                self.links.append(None)
+            placed.append(index[key])
+            self.links[index[key]] = _link(row)
+        if placed:
+            self.matrix = replace_rows(self.matrix, placed, _matrix(rows, len(self.vocabulary)))
+        self.seq = head.seq
+
+    def vector_rows(self, rows) -> list[dict]:
+        """related_vectors rows of these matrix rows."""
+        import numpy as np
+
+        result = []
+        for row in rows:
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            entity, entity_id = self.keys[row]
+            link = self.links[row] or {}
+            result.append({
+                "entity": entity, "entity_id": entity_id,
+                "indices": self.matrix.indices[start:end].astype(np.int32).tobytes(),
+                "data": self.matrix.data[start:end].astype(np.float64).tobytes(),
+                "slug": link.get("slug"), "title": link.get("title"),
+            })
+        return result
+
+    def store(self, db: Session) -> None:
+        """Write as a new generation, replacing the stored model. Caller commits."""
+        import numpy as np
+
+        terms = sorted(self.vocabulary, key=self.vocabulary.__getitem__)
+        crud_related.replace_model(
+            db,
+            {"generation": self.generation, "seq": self.seq, "terms": terms,
+             "idf": np.asarray(self.idf, dtype=np.float64).tobytes()},
+            [{**row, "generation": self.generation, "seq": self.seq}
+             for row in self.vector_rows(range(len(self.keys)))],
+        )
+
+
+def _link(row) -> dict | None:
+    if row.slug is None:
+        return None
+    return {"related_entity": row.entity, "related_id": row.entity_id,
+            "slug": row.slug, "title": row.title}
+
+
+def _matrix(rows, columns: int):
+    import numpy as np
+    from scipy import sparse
+
+    indices = [np.frombuffer(row.indices, dtype=np.int32) for row in rows]
+    data = [np.frombuffer(row.data, dtype=np.float64) for row in rows]
+    indptr = np.concatenate([[0], np.cumsum([len(part) for part in indices], dtype=np.int64)])
+    return sparse.csr_matrix(
+        (np.concatenate(data or [np.zeros(0)]), np.concatenate(indices or [np.zeros(0, np.int32)]), indptr),
+        shape=(len(rows), columns),
+    )
+
+
+# This process's copy of the stored model, caught up under crud_related.lock
+_model: _Model | None = None
+_model_lock = threading.Lock()
+
+
+def _checkout(db: Session) -> _Model | None:
+    """
+    The stored model, current as of the last commit: this process's copy
+    if it is of the stored generation (plus the vectors written since),
+    else read in full. None before the first rebuild. Until _checkin the
+    copy is not kept, so a refresh that fails leaves none half-applied.
+    """
+    global _model
+    model, _model = _model, None
+    head = crud_related.head(db)
+    if head is None:
+        return None
+    if model is None or model.generation != head.generation:
+        return _Model.load(db, head)
+    if model.seq < head.seq:
+        model.catch_up(db, head)
+    return model
+
+
+def _checkin(model: _Model) -> None:
+    global _model
+    _model = model
+
+
+def reset_model() -> None:
+    """Drop this process's copy (tests, after the tables are cleared)."""
+    global _model
+    with _model_lock:
+        _model = None
+
+
+def _neighbour_rows(keys, links, matrix, rows) -> list[dict]:
+    from app.utils.tfidf import top_k
+
+    result = []
+    for row, neighbours in top_k(
+        matrix, rows, settings.RELATED_TOP_K, settings.RELATED_MIN_SCORE,
+        settings.RELATED_BATCH_CELLS,
+    ):
+        entity, entity_id = keys[row]
+        # Pages gone since the model was built have links None
+        kept = [(other, score) for other, score in neighbours if links[other] is not None]
+        result.extend(
+            {"entity": entity, "entity_id": entity_id, "rank": rank,
+             **links[other], "score": round(score, 4)}
+            for rank, (other, score) in enumerate(kept)
+        )
+    return result
+
+
+# ======================================================
+# Building (Celery: related.rebuild, and the search indexer)
+# ======================================================
+
+def rebuild_all(db: Session) -> int:
+    """
+    Neighbours of every page from scratch; returns the rows stored. Also
+    stores the model later edits are scored against, as a new generation.
+    """
+    with _model_lock:
+        crud_related.lock(db)
+        model = _Model.fit(db)
+        rows = _neighbour_rows(model.keys, model.links, model.matrix, range(len(model.keys)))
+        crud_related.replace(db, None, rows)
+        model.store(db)
+        db.commit()
+        _checkin(model)
+    return len(rows)
+
+
+def refresh(db: Session, entity: str, ids: list[int]) -> int:
+    """
+    Recompute after these pages changed, without reloading the catalog:
+    only they are read and vectorised, on the vocabulary and idf of the
+    last rebuild_all (words new since then count from the next one), and
+    swapped into its matrix; only their vectors are written back.
+    Rescored are the changed pages, pages listing one of them (its score
+    or title moved), and pages it now beats their lowest neighbour on;
+    each costs one row of the similarity matrix. Returns pages rescored.
+    """
+    from app.utils.tfidf import most_similar_to, replace_rows, transform
+
+    if entity not in MODELS:
+        return 0
+    changed = {(entity, entity_id) for entity_id in ids}
+
+    with _model_lock:
+        crud_related.lock(db)
+        model = _checkout(db)
+        if model is None:
+            # Before the first rebuild: one full load, stored for the next
+            model = _Model.fit(db)
+            model.store(db)
+        index = {key: row for row, key in enumerate(model.keys)}
+
+        keys, docs, links = load_corpus(db, entity, ids)
+        fresh = dict(zip(keys, zip(docs, links)))
+        for key in sorted(changed):
+            if key not in index and key in fresh:
+                index[key] = len(model.keys)
+                model.keys.append(key)
+                model.links.append(None)
+        placed = sorted(index[key] for key in changed if key in index)
+        # Changed pages that are gone (deleted, deactivated) get an empty row
+        docs = [fresh.get(model.keys[row], (Counter(), None)) for row in placed]
+        model.matrix = replace_rows(
+            model.matrix, placed, transform([doc for doc, _ in docs], model.vocabulary, model.idf)
+        )
+        for row, (_, link) in zip(placed, docs):
+            model.links[row] = link
+
+        live = [index[key] for key in changed if key in fresh]
+        targets = {index[key] for key in changed | crud_related.pointing_at(db, changed) if key in index}
+        best = most_similar_to(model.matrix, live)
+        limits = crud_related.thresholds(db)
+        for key, row in index.items():
+            count, lowest = limits.get(key, (0, settings.RELATED_MIN_SCORE))
+            floor = lowest if count >= settings.RELATED_TOP_K else settings.RELATED_MIN_SCORE
+            if best[row] >= floor:
+                targets.add(row)
+        targets = sorted(row for row in targets if model.links[row] is not None)
+
+        rows = _neighbour_rows(model.keys, model.links, model.matrix, targets)
+        # Changed pages that are gone lose their rows
+        crud_related.replace(db, changed | {model.keys[row] for row in targets}, rows)
+        model.seq = crud_related.replace_vectors(db, crud_related.head(db), model.vector_rows(placed))
+        db.commit()
+        _checkin(model)
+    return len(targets)
+
+
+# ======================================================
+# Reads
+# ======================================================
+
+def get_related(db: Session, crud: CRUDBase, entity_id: int, label: str) -> list[RelatedItem]:
+    rows = crud_related.get(db, crud.entity, entity_id)
+    if not rows and crud.get(db, entity_id) is None:
+        raise HTTPException(404, f"{label} not found")
+    return [RelatedItem.model_validate(row) for row in rows]
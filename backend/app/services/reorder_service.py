@@ -0,0 +1,33 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.crud.base import CRUDBase
+from app.schemas.reorder import ReorderRequest
+
+
+def reorder_children(db: Session, crud: CRUDBase, payload: ReorderRequest) -> int:
+    if len(set(payload.ids)) != len(payload.ids):
+        raise HTTPException(400, "Duplicate ids in reorder list")
+
+    # The list is the new order of all of them, not a part of it
+    children = crud.child_ids(db, payload.parent_id)
+    if set(payload.ids) != children:
+        raise HTTPException(422, {
+            "msg": f"ids must be exactly the active children of {crud.parent_key} {payload.parent_id}",
+            "missing": sorted(children - set(payload.ids)),
+            "foreign": sorted(set(payload.ids) - children),
+        })
+
+    updated = crud.reorder(db, payload.parent_id, payload.ids, commit=False)
+    # A child moved away since it was read
+    if len(updated) != len(payload.ids):
+        db.rollback()
+        foreign = sorted(set(payload.ids) - updated)
+        raise HTTPException(
+            400,
+            f"Ids {foreign} do not belong to {crud.parent_key} {payload.parent_id}",
+        )
+
+    # One commit -> the post-commit hooks (cache invalidation, jobs) run once.
+    db.commit()
+    return len(updated)
@@ -0,0 +1,256 @@
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import null, select
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.crud.crud_tree import DEPTH, LEVELS, crud_tree
+from app.db.events import Change, on_commit
+from app.db.session import SessionLocal
+from app.schemas.resolve import ResolveResponse
+
+logger = logging.getLogger("app.resolver")
+
+# Nodes are `(id, children)` with children keyed by slug; leaves all share
+# this dict, so a lesson costs one tuple plus its slug.
+_LEAF: dict = {}
+
+# Columns that place a row in the trie; other edits leave it as it is.
+TRIE_FIELDS = frozenset({"slug", "is_active", *(f"{name}_id" for name, _ in LEVELS[:-1])})
+
+
+def _drop(index: dict, depth: int, children: dict) -> None:
+    # Forget a detached subtree
+    name = LEVELS[depth][0]
+    for id_, below in children.values():
+        index.pop((name, id_), None)
+        if below:
+            _drop(index, depth + 1, below)
+
+
+class SlugTrie:
+    """
+    Every active catalog row by slug path: roadmap -> technology -> ...
+    -> lesson. Readers never lock: `apply` copies the branches it changes
+    and swaps in the new root.
+    """
+
+    def __init__(self, root: dict, index: dict):
+        self.root = root
+        # (entity, id) -> (parent (entity, id) or None, slug); writers only
+        self._index = index
+
+    @staticmethod
+    def _rows(db: Session, depth: int, ids: set[int] | None = None):
+        model = LEVELS[depth][1]
+        parent_col = getattr(model, f"{LEVELS[depth - 1][0]}_id") if depth else null()
+        q = select(model.id, model.slug, parent_col).where(model.is_active.is_(True))
+        if ids is not None:
+            q = q.where(model.id.in_(ids))
+        return db.execute(q).all()
+
+    @classmethod
+    def build(cls, db: Session) -> "SlugTrie":
+        # One query per level; rows under an inactive parent find no
+        # parent node and are dropped with it.
+        root, index = {}, {}
+        parents = {None: root}
+        for depth, (name, _) in enumerate(LEVELS):
+            last = depth == len(LEVELS) - 1
+            level = {}
+            for id_, slug, parent_id in cls._rows(db, depth):
+                siblings = parents.get(parent_id)
+                if siblings is None:
+                    continue
+                children = _LEAF if last else {}
+                siblings[sys.intern(slug)] = (id_, children)
+                index[(name, id_)] = ((LEVELS[depth - 1][0], parent_id) if depth else None, slug)
+                level[id_] = children
+            parents = level
+        return cls(root, index)
+
+    def apply(self, db: Session, changed: dict[str, set[int]]) -> None:
+        """
+        Re-read just these rows (one query per level) and swap in a root
+        sharing every untouched branch. A moved or renamed row keeps its
+        subtree; one no longer active drops out with it. Caller serializes.
+        """
+        fresh = {
+            name: {row[0]: row for row in self._rows(db, depth, changed[name])}
+            for depth, (name, _) in enumerate(LEVELS) if changed.get(name)
+        }
+
+        index = self._index
+        root = dict(self.root)
+        copied = {id(root)}
+
+        def children_of(key) -> dict:
+            # Writable children of a node, copying the path down to it
+            if key is None:
+                return root
+            parent, slug = index[key]
+            siblings = children_of(parent)
+            id_, children = siblings[slug]
+            if id(children) not in copied:
+                children = dict(children)
+                copied.add(id(children))
+                siblings[slug] = (id_, children)
+            return children
+
+        # Top-down, so a restored parent is back before its children
+        for depth, (name, _) in enumerate(LEVELS):
+            if name not in fresh:
+                continue
+            last = depth == len(LEVELS) - 1
+            detached = {}
+            for id_ in changed[name]:
+                if (name, id_) in index:
+                    parent, slug = index.pop((name, id_))
+                    siblings = children_of(parent)
+                    detached[id_] = siblings.pop(slug)[1]
+            for id_ in changed[name]:
+                row = fresh[name].get(id_)
+                children = detached.pop(id_, None)
+                parent = (LEVELS[depth - 1][0], row[2]) if depth and row else None
+                if row is None or (depth and parent not in index):
+                    if children:
+                        _drop(index, depth + 1, children)
+                    continue
+                if children is None:
+                    children = _LEAF if last else {}
+                siblings = children_of(parent)
+                taken = siblings.get(row[1])
+                if taken is not None:
+                    # Slug of a row whose own change is not here yet
+                    index.pop((name, taken[0]), None)
+                    if taken[1]:
+                        _drop(index, depth + 1, taken[1])
+                siblings[sys.intern(row[1])] = (id_, children)
+                index[(name, id_)] = (parent, row[1])
+        self.root = root
+
+    def lookup(self, slugs: list[str]) -> list[int] | None:
+        ids, children = [], self.root
+        for slug in slugs:
+            node = children.get(slug)
+            if node is None:
+                return None
+            ids.append(node[0])
+            children = node[1]
+        return ids
+
+
+# ======================================================
+# Per-process instance
+# ======================================================
+
+_trie: SlugTrie | None = None
+_built_at = 0.0
+_lock = threading.Lock()  # writers: first build, applying changes, swapping a rebuild in
+_rebuilding = threading.Lock()
+_pending: dict[str, set[int]] = defaultdict(set)
+_since: dict[str, set[int]] | None = None  # commits during a rebuild
+_pending_lock = threading.Lock()
+
+
+def _take() -> dict[str, set[int]]:
+    with _pending_lock:
+        changed = dict(_pending)
+        _pending.clear()
+    return changed
+
+
+def get_trie(db: Session) -> SlugTrie:
+    """
+    The current trie. This worker's own catalog commits are applied to it
+    row by row before the next lookup; other workers' writes are picked up
+    by a rebuild in a background thread once it is older than
+    CACHE_TTL_SECONDS, the old trie serving until the new one is swapped
+    in. Only the first build keeps a request waiting.
+    """
+    global _trie, _built_at
+    if _trie is None:
+        with _lock:
+            if _trie is None:
+                _take()
+                _trie, _built_at = SlugTrie.build(db), time.monotonic()
+    # Held by another thread: it is applying them, or about to swap
+    if _pending and _lock.acquire(blocking=False):
+        try:
+            changed = _take()
+            if changed:
+                _trie.apply(db, changed)
+        finally:
+            _lock.release()
+    if time.monotonic() - _built_at >= settings.CACHE_TTL_SECONDS:
+        schedule_rebuild()
+    return _trie
+
+
+def schedule_rebuild() -> None:
+    """Rebuild in a background thread; one at a time."""
+    if _rebuilding.acquire(blocking=False):
+        threading.Thread(target=_rebuild, name="trie-rebuild", daemon=True).start()
+
+
+def _rebuild() -> None:
+    global _trie, _built_at, _since
+    try:
+        with _pending_lock:
+            _since = defaultdict(set)
+        with SessionLocal() as db:
+            trie = SlugTrie.build(db)
+            with _lock:
+                with _pending_lock:
+                    changed, _since = _since, None
+                # Committed while it was being built (re-reading is harmless)
+                trie.apply(db, changed)
+                _trie = trie
+    except Exception:
+        logger.exception("Slug trie rebuild failed")
+    finally:
+        with _pending_lock:
+            _since = None
+        # Also after a failure: retried once the trie is stale again
+        _built_at = time.monotonic()
+        _rebuilding.release()
+
+
+def reset_trie() -> None:
+    global _trie
+    with _lock:
+        _trie = None
+
+
+@on_commit
+def track_changes(changes: list[Change]) -> None:
+    with _pending_lock:
+        for change in changes:
+            if change.entity in DEPTH and change.touches(TRIE_FIELDS):
+                _pending[change.entity].add(change.id)
+                if _since is not None:
+                    _since[change.entity].add(change.id)
+
+
+def resolve_path(db: Session, path: str) -> ResolveResponse:
+    """`path` is the slugs from the roadmap down: "frontend/javascript/..."."""
+    slugs = [part for part in path.split("/") if part]
+    if not slugs:
+        raise HTTPException(404, "Page not found")
+
+    ids = get_trie(db).lookup(slugs)
+    if ids is None:
+        # Possibly written by another worker since this trie was built
+        ids = crud_tree.resolve(db, slugs)
+        if ids is None:
+            raise HTTPException(404, "Page not found")
+        schedule_rebuild()
+
+    chain = {name: id_ for (name, _), id_ in zip(LEVELS, ids)}
+    entity = LEVELS[len(ids) - 1][0]
+    return ResolveResponse(entity=entity, id=ids[-1], ids=chain)
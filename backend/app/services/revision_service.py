@@ -0,0 +1,140 @@
+import copy
+
+from pydantic import BaseModel
+from sqlalchemy import JSON, Text
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.crud.crud_content_block import BLOCK_OWNERS, crud_content_block
+from app.crud.crud_revision import crud_revision
+from app.schemas.revision import RevisionDetail, RevisionSummary
+from app.utils.json_patch import apply_patch, make_patch, parse_pointer
+
+
+def versioned_fields(crud: CRUDBase) -> list[str]:
+    """The page itself: text and JSON columns, not its placement (slug, path)."""
+    return [
+        name for name, col in crud.model.__table__.columns.items()
+        if isinstance(col.type, (Text, JSON)) and name not in ("slug", "path")
+    ]
+
+
+def read_doc(
+    db: Session, crud: CRUDBase, owner_id: int, fields: list[str], for_update: bool = False
+) -> dict | None:
+    """These fields of one row as stored now (content from content_blocks if it lives there)."""
+    row = crud.get_fields(db, owner_id, fields, for_update=for_update)
+    if row is None:
+        return None
+    doc = {field: getattr(row, field) for field in fields}
+    if "content" in doc and crud.entity in BLOCK_OWNERS and settings.CONTENT_STORAGE == "blocks":
+        doc["content"] = crud_content_block.get_all(db, crud.entity, owner_id) or doc["content"]
+    return doc
+
+
+def record_revision(
+    db: Session, crud: CRUDBase, owner_id: int, before: dict | None, after: dict
+) -> int | None:
+    """
+    Add a revision for a write the caller is about to commit. `before`
+    and `after` hold the same fields (just the ones written is enough);
+    `before` is None for a new row, whose `after` must be the whole page.
+    Returns the new revision number, None if nothing changed.
+    """
+    ops = make_patch(before or {}, after)
+    if not ops:
+        return None
+    fields = versioned_fields(crud)
+
+    last = crud_revision.last_number(db, crud.entity, owner_id)
+    if last == 0 and before is not None:
+        # First edit of a page written before history was kept: its
+        # previous state becomes revision 1, so it can be rolled back to.
+        previous = {**read_doc(db, crud, owner_id, fields), **before}
+        crud_revision.add(db, crud.entity, owner_id, 1, True, previous, sorted(previous))
+        last = 1
+
+    number = last + 1
+    changed = sorted({parse_pointer(op["path"])[0] for op in ops})
+    if (number - 1) % settings.REVISION_SNAPSHOT_INTERVAL == 0:
+        crud_revision.add(db, crud.entity, owner_id, number, True,
+                          read_doc(db, crud, owner_id, fields), changed)
+    else:
+        crud_revision.add(db, crud.entity, owner_id, number, False, ops, changed)
+    return number
+
+
+# ======================================================
+# Writes that keep history
+# ======================================================
+
+def create_versioned(db: Session, crud: CRUDBase, payload: BaseModel):
+    obj = crud.create(db, payload, commit=False)
+    record_revision(db, crud, obj.id, None, read_doc(db, crud, obj.id, versioned_fields(crud)))
+    db.commit()
+    return obj
+
+
+def update_versioned(db: Session, crud: CRUDBase, obj, payload: BaseModel | dict):
+    values = payload if isinstance(payload, dict) else payload.model_dump(exclude_unset=True)
+    fields = [field for field in versioned_fields(crud) if field in values]
+    # Locked until commit, so concurrent saves get consecutive numbers
+    before = read_doc(db, crud, obj.id, fields, for_update=True)
+    obj = crud.update(db, obj, payload, commit=False)
+    if fields:
+        record_revision(db, crud, obj.id, before, read_doc(db, crud, obj.id, fields))
+    db.commit()
+    return obj
+
+
+# ======================================================
+# History
+# ======================================================
+
+def _owner(db: Session, crud: CRUDBase, owner_id: int, label: str):
+    obj = crud.get(db, owner_id)
+    if obj is None:
+        raise HTTPException(404, f"{label} not found")
+    return obj
+
+
+def list_revisions(
+    db: Session, crud: CRUDBase, owner_id: int, offset: int, limit: int, label: str
+) -> list[RevisionSummary]:
+    rows = crud_revision.get_many(db, crud.entity, owner_id, offset, limit)
+    if not rows and offset == 0:
+        _owner(db, crud, owner_id, label)
+    return [RevisionSummary.model_validate(row) for row in rows]
+
+
+def get_revision(
+    db: Session, crud: CRUDBase, owner_id: int, number: int, label: str
+) -> RevisionDetail:
+    """Revision `number` rebuilt: its nearest snapshot plus the diffs after it."""
+    chain = crud_revision.get_chain(db, crud.entity, owner_id, number)
+    if not chain:
+        _owner(db, crud, owner_id, label)
+        raise HTTPException(404, "Revision not found")
+
+    doc = copy.deepcopy(chain[0].data)
+    for revision in chain[1:]:
+        apply_patch(doc, revision.data)
+    last = chain[-1]
+    return RevisionDetail(
+        number=last.number,
+        is_snapshot=last.is_snapshot,
+        changed=last.changed,
+        created_at=last.created_at,
+        document=doc,
+    )
+
+
+def restore_revision(db: Session, crud: CRUDBase, owner_id: int, number: int, label: str):
+    """Write revision `number` back as the current page (itself a new revision)."""
+    obj = _owner(db, crud, owner_id, label)
+    document = get_revision(db, crud, owner_id, number, label).document
+    # Fields added since that revision are left as they are
+    values = {field: document[field] for field in versioned_fields(crud) if field in document}
+    return update_versioned(db, crud, obj, values)
@@ -1,35 +1,56 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException
-from app.models.roadmap import Roadmap
-from app.models.seo_metadata import SeoMetadata # Assuming this is where your model is
-from app.schemas.roadmap import RoadmapCreate, RoadmapUpdate
+from app.schemas.roadmap import RoadmapCreate, RoadmapUpdate, RoadmapResponse
+from app.crud.crud_roadmap import crud_roadmap
+from app.crud.crud_tree import crud_tree
+from app.crud.crud_seo import crud_seo
+from app.core.cache import catalog_cache
+from app.core.tracing import traced
 
+
+def list_roadmaps(db: Session):
+    return catalog_cache.get_or_set("roadmaps", lambda: [
+        RoadmapResponse.model_validate(r).model_dump(mode="json")
+        for r in crud_roadmap.get_all(db)
+    ])
+
+
+def get_roadmap_by_slug(db: Session, slug: str):
+    def load():
+        roadmap = crud_roadmap.get_by_slug(db, slug)
+        if roadmap:
+            return RoadmapResponse.model_validate(roadmap).model_dump(mode="json")
+
+    return catalog_cache.get_or_set(f"roadmap:{slug}", load)
+
+
+@traced("roadmap")
 def create_roadmap(db: Session, payload: RoadmapCreate):
     # 1. Check for duplicate slug
-    existing = db.query(Roadmap).filter(Roadmap.slug == payload.slug).first()
+    existing = crud_roadmap.get_by_slug(db, payload.slug)
     if existing:
         raise HTTPException(status_code=400, detail="Roadmap with this slug already exists")
 
     # 2. Extract SEO data
     roadmap_data = payload.model_dump(exclude={"seo"})
-    seo_data = payload.seo
 
-    # 3. Create Roadmap Instance
-    new_roadmap = Roadmap(**roadmap_data)
+    # 3. Create the SEO record first so the roadmap row can point at it
+    seo = None
+    if payload.seo:
+        seo = crud_seo.create(db, payload.seo, commit=False)
+        roadmap_data["seo_id"] = seo.id
 
-    # 4. Handle SEO Relationship
-    if seo_data:
-        # Create new SEO record and assign it to the relationship
-        new_seo = SeoMetadata(**seo_data.model_dump())
-        new_roadmap.seo = new_seo
+    # 4. Create Roadmap (one transaction for both rows)
+    roadmap = crud_roadmap.create(db, roadmap_data)
+    # The response embeds `seo`; hand it over instead of lazy-loading it.
+    set_committed_value(roadmap, "seo", seo)
+    return roadmap
 
-    db.add(new_roadmap)
-    db.commit()
-    db.refresh(new_roadmap)
-    return new_roadmap
 
+@traced("roadmap")
 def update_roadmap(db: Session, roadmap_id: int, payload: RoadmapUpdate):
-    roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+    roadmap = crud_roadmap.get(db, roadmap_id)
     if not roadmap:
         raise HTTPException(status_code=404, detail="Roadmap not found")
 
@@ -37,30 +58,36 @@ def update_roadmap(db: Session, roadmap_id: int, payload: RoadmapUpdate):
     update_data = payload.model_dump(exclude_unset=True)
     seo_data = update_data.pop("seo", None) # Remove 'seo' from main update dict
 
-    # 2. Update basic Roadmap fields
-    for key, value in update_data.items():
-        setattr(roadmap, key, value)
-
-    # 3. Update or Create SEO data
+    # 2. Update or Create SEO data
     if seo_data is not None:
-        if roadmap.seo:
+        if roadmap.seo_id:
             # Update existing SEO record
-            for k, v in seo_data.items():
-                setattr(roadmap.seo, k, v)
+            crud_seo.update(db, roadmap.seo, seo_data, commit=False)
         else:
             # Create new SEO record if it didn't exist
-            new_seo = SeoMetadata(**seo_data)
-            roadmap.seo = new_seo
+            update_data["seo_id"] = crud_seo.create(db, seo_data, commit=False).id
 
+    # 3. Update basic Roadmap fields
+    roadmap = crud_roadmap.update(db, roadmap, update_data, commit=False)
     db.commit()
-    db.refresh(roadmap)
     return roadmap
 
 
+@traced("roadmap")
 def delete_roadmap(db: Session, roadmap_id: int):
-    roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+    roadmap = crud_roadmap.get(db, roadmap_id)
     if not roadmap:
         raise HTTPException(status_code=404, detail="Roadmap not found")
 
-    roadmap.is_active = False
-    db.commit()
+    crud_tree.deactivate(db, "roadmap", roadmap.id)
+
+
+@traced("roadmap")
+def restore_roadmap(db: Session, roadmap_id: int):
+    roadmap = crud_roadmap.get(db, roadmap_id)
+    if not roadmap:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    if roadmap.is_active:
+        raise HTTPException(status_code=400, detail="Roadmap is not deleted")
+
+    crud_tree.restore(db, "roadmap", roadmap.id)
@@ -1,14 +1,35 @@
+import html
+from datetime import date
+from xml.sax.saxutils import escape
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
+from app.core.cache import prerender_cache
+from app.core.config import settings
 from app.crud.crud_seo import crud_seo
+from app.models import Lesson, Module, Roadmap, SeoMetadata, SubTopic, Technology, Topic
 from app.schemas.seo import SeoCreate, SeoUpdate
+from app.core.tracing import traced
+
+# Page entities in URL order: /roadmap/{roadmap}/{technology}/.../{lesson}
+PAGE_MODELS = {
+    "roadmap": Roadmap,
+    "technology": Technology,
+    "module": Module,
+    "topic": Topic,
+    "sub_topic": SubTopic,
+    "lesson": Lesson,
+}
 
 
+@traced("seo")
 def create_seo(db: Session, payload: SeoCreate):
     return crud_seo.create(db, payload)
 
 
+@traced("seo")
 def update_seo(db: Session, seo_id: int, payload: SeoUpdate):
     seo = crud_seo.get(db, seo_id)
     if not seo:
@@ -17,9 +38,146 @@ def update_seo(db: Session, seo_id: int, payload: SeoUpdate):
     return crud_seo.update(db, seo, payload)
 
 
+@traced("seo")
 def delete_seo(db: Session, seo_id: int):
     seo = crud_seo.get(db, seo_id)
     if not seo:
         raise HTTPException(404, "SEO metadata not found")
 
     crud_seo.delete(db, seo)
+
+
+# ======================================================
+# Pre-rendered <head> for crawlers / link previews
+# ======================================================
+
+def render_head(db: Session, entity: str, entity_id: int) -> str | None:
+    model = PAGE_MODELS.get(entity)
+    if model is None:
+        raise HTTPException(404, "Unknown entity")
+
+    obj = db.get(model, entity_id)
+    if not obj or not obj.is_active:
+        return None
+    seo = db.get(SeoMetadata, obj.seo_id) if obj.seo_id else None
+
+    def pick(field: str, fallback):
+        value = getattr(seo, field, None) if seo else None
+        return value or fallback
+
+    title = pick("meta_title", obj.title)
+    description = pick("meta_description", obj.description)
+    tags = [f"<title>{html.escape(title)}</title>"]
+    meta = {
+        "description": description,
+        "robots": pick("robots", None),
+        "keywords": ", ".join(pick("keywords", None) or []) or None,
+        "og:title": pick("og_title", title),
+        "og:description": pick("og_description", description),
+        "og:image": pick("og_image_url", None),
+        "twitter:card": pick("twitter_card", None),
+    }
+    for name, content in meta.items():
+        if content:
+            attr = "property" if name.startswith("og:") else "name"
+            tags.append(f'<meta {attr}="{name}" content="{html.escape(content)}">')
+    canonical = pick("canonical_url", None)
+    if canonical:
+        tags.append(f'<link rel="canonical" href="{html.escape(canonical)}">')
+    return "\n".join(tags)
+
+
+def get_prerendered_head(db: Session, entity: str, entity_id: int) -> str | None:
+    return prerender_cache.get_or_set(
+        f"{entity}:{entity_id}", lambda: render_head(db, entity, entity_id)
+    )
+
+
+# ======================================================
+# Sitemap
+# ======================================================
+
+# Per sitemap file, as the protocol allows (https://www.sitemaps.org)
+SITEMAP_MAX_URLS = 50_000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+
+SITEMAP_INDEX = "sitemap_index.xml"
+
+_URLSET_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_URLSET_CLOSE = "</urlset>\n"
+
+
+def sitemap_urls(db: Session) -> list[str]:
+    """
+    One <url> element per active page; a row is listed only if all its
+    ancestors are active too. One query per level.
+    """
+    paths: dict[int, str] = {}
+    urls: list[str] = []
+    parent_column = None
+
+    for entity, model in PAGE_MODELS.items():
+        columns = [model.id, model.slug, model.updated_at, SeoMetadata.canonical_url]
+        if parent_column is not None:
+            columns.append(getattr(model, parent_column).label("parent_id"))
+        rows = db.execute(
+            select(*columns)
+            .outerjoin(SeoMetadata, SeoMetadata.id == model.seo_id)
+            .where(model.is_active.is_(True))
+        ).all()
+
+        level: dict[int, str] = {}
+        for row in rows:
+            if parent_column is None:
+                base = "/roadmap"
+            elif row.parent_id in paths:
+                base = paths[row.parent_id]
+            else:
+                continue
+            level[row.id] = f"{base}/{row.slug}"
+            loc = escape(row.canonical_url or settings.SITE_URL + level[row.id])
+            lastmod = f"<lastmod>{row.updated_at.date().isoformat()}</lastmod>" if row.updated_at else ""
+            urls.append(f"  <url><loc>{loc}</loc>{lastmod}</url>\n")
+
+        paths = level
+        parent_column = f"{entity}_id"
+    return urls
+
+
+def _chunks(urls: list[str]):
+    # Up to SITEMAP_MAX_URLS urls and SITEMAP_MAX_BYTES (UTF-8) per file
+    limit = SITEMAP_MAX_BYTES - len(_URLSET_OPEN) - len(_URLSET_CLOSE)
+    chunk, size = [], 0
+    for url in urls:
+        length = len(url.encode("utf-8"))
+        if chunk and (len(chunk) == SITEMAP_MAX_URLS or size + length > limit):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(url)
+        size += length
+    yield chunk
+
+
+def build_sitemap(db: Session) -> dict[str, str]:
+    """
+    Sitemap files by name: sitemap-1.xml, sitemap-2.xml, ... and the
+    sitemap_index.xml listing them (served at /seo/sitemap.xml).
+    """
+    files = {
+        f"sitemap-{n}.xml": _URLSET_OPEN + "".join(chunk) + _URLSET_CLOSE
+        for n, chunk in enumerate(_chunks(sitemap_urls(db)), start=1)
+    }
+    today = date.today().isoformat()
+    entries = "".join(
+        f"  <sitemap><loc>{escape(settings.SITEMAP_URL)}/{name}</loc><lastmod>{today}</lastmod></sitemap>\n"
+        for name in files
+    )
+    files[SITEMAP_INDEX] = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        f"{entries}</sitemapindex>\n"
+    )
+    return files
@@ -0,0 +1,80 @@
+from collections import defaultdict
+
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.crud.crud_stats import crud_stats
+from app.crud.crud_tree import LEVELS
+from app.schemas.stats import ActiveCount, CatalogStats, ParentCount
+
+MODELS = dict(LEVELS)
+PARENT = {name: parent for (parent, _), (name, _) in zip(LEVELS, LEVELS[1:])}
+CHILD = {parent: name for name, parent in PARENT.items()}
+
+
+def _count(db: Session, entity: str, parent_ids: set[int] | None = None) -> list[dict]:
+    # One GROUP BY over the parent id column (indexed on every level)
+    model = MODELS[entity]
+    parent = getattr(model, f"{PARENT[entity]}_id") if entity in PARENT else literal(0)
+    q = select(
+        parent.label("parent_id"),
+        func.count(case((model.is_active.is_(True), 1))).label("active"),
+        func.count(case((model.is_active.is_(False), 1))).label("inactive"),
+    ).group_by(parent)
+    if parent_ids is not None and entity in PARENT:
+        q = q.where(parent.in_(parent_ids))
+    return [{"entity": entity, **row._mapping} for row in db.execute(q)]
+
+
+def rebuild_all(db: Session) -> None:
+    """Every rollup from scratch: one GROUP BY per level."""
+    for entity in MODELS:
+        crud_stats.lock(db, entity)
+        crud_stats.replace(db, entity, None, _count(db, entity))
+    db.commit()
+
+
+def refresh(db: Session, changed: dict[str, list[int]]) -> None:
+    """
+    Recount only the parents these writes can have changed: each row's
+    own parent, and each row as the parent of the level below. A moved
+    row's old parent is reported as changed by the move itself.
+    """
+    parents: dict[str, set[int]] = defaultdict(set)
+    for entity, ids in changed.items():
+        if entity not in MODELS:
+            continue
+        if entity in PARENT:
+            model = MODELS[entity]
+            parents[entity].update(db.scalars(
+                select(getattr(model, f"{PARENT[entity]}_id")).where(model.id.in_(ids))
+            ))
+        else:
+            parents[entity].add(0)
+        if entity in CHILD:
+            parents[CHILD[entity]].update(ids)
+
+    # Top-down, the order rebuild_all locks them in
+    for entity in MODELS:
+        if entity in parents:
+            crud_stats.lock(db, entity)
+            crud_stats.replace(db, entity, parents[entity], _count(db, entity, parents[entity]))
+    db.commit()
+
+
+def get_stats(db: Session) -> CatalogStats:
+    rows = crud_stats.get_all(db)
+    if not rows and db.scalar(select(func.count()).select_from(MODELS["roadmap"])):
+        # First call after deploy: fill the rollups once
+        rebuild_all(db)
+        rows = crud_stats.get_all(db)
+
+    totals = {entity: ActiveCount() for entity in MODELS}
+    children: dict[str, list[ParentCount]] = {entity: [] for entity in PARENT}
+    for row in rows:
+        total = totals[row.entity]
+        total.active += row.active
+        total.inactive += row.inactive
+        if row.entity in PARENT:
+            children[row.entity].append(ParentCount.model_validate(row))
+    return CatalogStats(totals=totals, children=children)
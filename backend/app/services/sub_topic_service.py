@@ -2,9 +2,24 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.crud.crud_sub_topic import crud_sub_topic
+from app.crud.crud_topic import crud_topic
+from app.crud.crud_tree import crud_tree
+from app.services.revision_service import create_versioned, update_versioned
 from app.schemas.sub_topic import SubTopicCreate, SubTopicUpdate
+from app.core.tracing import traced
 
 
+# Full reads: content that lives in content_blocks is put back on the rows
+def list_sub_topics_by_topic(db: Session, topic_id: int):
+    return crud_sub_topic.load_blocks(db, crud_sub_topic.get_by_topic(db, topic_id))
+
+
+def get_sub_topic_by_slug(db: Session, topic_id: int, slug: str):
+    sub_topic = crud_sub_topic.get_by_slug(db, topic_id, slug)
+    return crud_sub_topic.load_blocks(db, [sub_topic])[0] if sub_topic else None
+
+
+@traced("sub_topic")
 def create_sub_topic(db: Session, payload: SubTopicCreate):
     existing = crud_sub_topic.get_by_slug(
         db, payload.topic_id, payload.slug
@@ -15,22 +30,41 @@ def create_sub_topic(db: Session, payload: SubTopicCreate):
             "SubTopic with this slug already exists in this topic",
         )
 
-    return crud_sub_topic.create(db, payload)
+    return create_versioned(db, crud_sub_topic, payload)
 
 
+@traced("sub_topic")
 def update_sub_topic(
     db: Session, sub_topic_id: int, payload: SubTopicUpdate
 ):
     sub_topic = crud_sub_topic.get(db, sub_topic_id)
     if not sub_topic:
         raise HTTPException(404, "SubTopic not found")
+    if payload.topic_id and not crud_topic.get(db, payload.topic_id):
+        raise HTTPException(404, "Topic not found")
 
-    return crud_sub_topic.update(db, sub_topic, payload)
+    return update_versioned(db, crud_sub_topic, sub_topic, payload)
 
 
+@traced("sub_topic")
 def delete_sub_topic(db: Session, sub_topic_id: int):
     sub_topic = crud_sub_topic.get(db, sub_topic_id)
     if not sub_topic:
         raise HTTPException(404, "SubTopic not found")
 
-    crud_sub_topic.soft_delete(db, sub_topic)
+    crud_tree.deactivate(db, "sub_topic", sub_topic.id)
+
+
+@traced("sub_topic")
+def restore_sub_topic(db: Session, sub_topic_id: int):
+    sub_topic = crud_sub_topic.get(db, sub_topic_id)
+    if not sub_topic:
+        raise HTTPException(404, "SubTopic not found")
+    if sub_topic.is_active:
+        raise HTTPException(400, "SubTopic is not deleted")
+
+    parent = crud_tree.inactive_parent(db, "sub_topic", sub_topic)
+    if parent:
+        raise HTTPException(400, f"Restore the parent {parent} first")
+
+    crud_tree.restore(db, "sub_topic", sub_topic.id)
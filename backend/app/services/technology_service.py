@@ -1,18 +1,36 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException
 
-from app.models.technology import Technology
-from app.models.seo_metadata import SeoMetadata
-from app.schemas.technology import TechnologyCreate, TechnologyUpdate
+from app.schemas.technology import TechnologyCreate, TechnologyUpdate, TechnologyResponse
+from app.crud.crud_technology import crud_technology
+from app.crud.crud_roadmap import crud_roadmap
+from app.crud.crud_tree import crud_tree
+from app.crud.crud_seo import crud_seo
+from app.core.cache import catalog_cache
+from app.core.tracing import traced
 
 
+def list_technologies_by_roadmap(db: Session, roadmap_id: int):
+    return catalog_cache.get_or_set(f"technologies:{roadmap_id}", lambda: [
+        TechnologyResponse.model_validate(t).model_dump(mode="json")
+        for t in crud_technology.get_by_roadmap(db, roadmap_id)
+    ])
+
+
+def get_technology_by_slug(db: Session, roadmap_id: int, slug: str):
+    def load():
+        tech = crud_technology.get_by_slug(db, roadmap_id, slug)
+        if tech:
+            return TechnologyResponse.model_validate(tech).model_dump(mode="json")
+
+    return catalog_cache.get_or_set(f"technology:{roadmap_id}:{slug}", load)
+
+
+@traced("technology", id_arg="tech_id")
 def create_technology(db: Session, payload: TechnologyCreate):
     # 1. Check for duplicate slug within the specific roadmap
-    existing = db.query(Technology).filter(
-        Technology.roadmap_id == payload.roadmap_id,
-        Technology.slug == payload.slug
-    ).first()
-    
+    existing = crud_technology.get_by_slug(db, payload.roadmap_id, payload.slug)
     if existing:
         raise HTTPException(
             400, "Technology with this slug already exists in roadmap"
@@ -20,53 +38,64 @@ def create_technology(db: Session, payload: TechnologyCreate):
 
     # 2. Extract SEO data
     tech_data = payload.model_dump(exclude={"seo"})
-    seo_data = payload.seo
-
-    # 3. Create Technology Instance
-    new_tech = Technology(**tech_data)
 
-    # 4. Handle SEO Relationship
-    if seo_data:
-        new_seo = SeoMetadata(**seo_data.model_dump())
-        new_tech.seo = new_seo
+    # 3. Create the SEO record first so the technology row can point at it
+    seo = None
+    if payload.seo:
+        seo = crud_seo.create(db, payload.seo, commit=False)
+        tech_data["seo_id"] = seo.id
 
-    db.add(new_tech)
-    db.commit()
-    db.refresh(new_tech)
-    return new_tech
+    # 4. Create Technology (one transaction for both rows)
+    tech = crud_technology.create(db, tech_data)
+    # The response embeds `seo`; hand it over instead of lazy-loading it.
+    set_committed_value(tech, "seo", seo)
+    return tech
 
 
+@traced("technology", id_arg="tech_id")
 def update_technology(db: Session, tech_id: int, payload: TechnologyUpdate):
-    tech = db.query(Technology).filter(Technology.id == tech_id).first()
+    tech = crud_technology.get(db, tech_id)
     if not tech:
         raise HTTPException(404, "Technology not found")
+    if payload.roadmap_id and not crud_roadmap.get(db, payload.roadmap_id):
+        raise HTTPException(404, "Roadmap not found")
 
     # 1. Separate generic fields and SEO fields
     update_data = payload.model_dump(exclude_unset=True)
     seo_data = update_data.pop("seo", None)
 
-    # 2. Update basic Technology fields
-    for key, value in update_data.items():
-        setattr(tech, key, value)
-
-    # 3. Update or Create SEO data
+    # 2. Update or Create SEO data
     if seo_data is not None:
-        if tech.seo:
-            for k, v in seo_data.items():
-                setattr(tech.seo, k, v)
+        if tech.seo_id:
+            crud_seo.update(db, tech.seo, seo_data, commit=False)
         else:
-            new_seo = SeoMetadata(**seo_data)
-            tech.seo = new_seo
+            update_data["seo_id"] = crud_seo.create(db, seo_data, commit=False).id
 
+    # 3. Update basic Technology fields
+    tech = crud_technology.update(db, tech, update_data, commit=False)
     db.commit()
-    db.refresh(tech)
     return tech
 
 
+@traced("technology", id_arg="tech_id")
 def delete_technology(db: Session, tech_id: int):
-    tech = db.query(Technology).filter(Technology.id == tech_id).first()
+    tech = crud_technology.get(db, tech_id)
     if not tech:
         raise HTTPException(404, "Technology not found")
 
-    tech.is_active = False
-    db.commit()
+    crud_tree.deactivate(db, "technology", tech.id)
+
+
+@traced("technology", id_arg="tech_id")
+def restore_technology(db: Session, tech_id: int):
+    tech = crud_technology.get(db, tech_id)
+    if not tech:
+        raise HTTPException(404, "Technology not found")
+    if tech.is_active:
+        raise HTTPException(400, "Technology is not deleted")
+
+    parent = crud_tree.inactive_parent(db, "technology", tech)
+    if parent:
+        raise HTTPException(400, f"Restore the parent {parent} first")
+
+    crud_tree.restore(db, "technology", tech.id)
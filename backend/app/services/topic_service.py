@@ -2,9 +2,30 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.crud.crud_topic import crud_topic
+from app.crud.crud_module import crud_module
+from app.crud.crud_sub_topic import crud_sub_topic
+from app.crud.crud_tree import crud_tree
+from app.services.revision_service import create_versioned, update_versioned
 from app.schemas.topic import TopicCreate, TopicUpdate
+from app.core.tracing import traced
 
 
+# Full reads: content that lives in content_blocks is put back on the rows
+def list_topics_by_module(db: Session, module_id: int):
+    topics = crud_topic.load_blocks(db, crud_topic.get_by_module(db, module_id))
+    crud_sub_topic.load_blocks(db, [sub for topic in topics for sub in topic.sub_topics])
+    return topics
+
+
+def get_topic_by_slug(db: Session, module_id: int, slug: str):
+    topic = crud_topic.get_by_slug(db, module_id, slug)
+    if topic:
+        crud_topic.load_blocks(db, [topic])
+        crud_sub_topic.load_blocks(db, topic.sub_topics)
+    return topic
+
+
+@traced("topic")
 def create_topic(db: Session, payload: TopicCreate):
     existing = crud_topic.get_by_slug(
         db, payload.module_id, payload.slug
@@ -15,22 +36,41 @@ def create_topic(db: Session, payload: TopicCreate):
             "Topic with this slug already exists in this module",
         )
 
-    return crud_topic.create(db, payload)
+    return create_versioned(db, crud_topic, payload)
 
 
+@traced("topic")
 def update_topic(
     db: Session, topic_id: int, payload: TopicUpdate
 ):
     topic = crud_topic.get(db, topic_id)
     if not topic:
         raise HTTPException(404, "Topic not found")
+    if payload.module_id and not crud_module.get(db, payload.module_id):
+        raise HTTPException(404, "Module not found")
 
-    return crud_topic.update(db, topic, payload)
+    return update_versioned(db, crud_topic, topic, payload)
 
 
+@traced("topic")
 def delete_topic(db: Session, topic_id: int):
     topic = crud_topic.get(db, topic_id)
     if not topic:
         raise HTTPException(404, "Topic not found")
 
-    crud_topic.soft_delete(db, topic)
+    crud_tree.deactivate(db, "topic", topic.id)
+
+
+@traced("topic")
+def restore_topic(db: Session, topic_id: int):
+    topic = crud_topic.get(db, topic_id)
+    if not topic:
+        raise HTTPException(404, "Topic not found")
+    if topic.is_active:
+        raise HTTPException(400, "Topic is not deleted")
+
+    parent = crud_tree.inactive_parent(db, "topic", topic)
+    if parent:
+        raise HTTPException(400, f"Restore the parent {parent} first")
+
+    crud_tree.restore(db, "topic", topic.id)
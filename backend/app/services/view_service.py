@@ -0,0 +1,145 @@
+import itertools
+import logging
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.cache import popular_cache
+from app.core.config import settings
+from app.crud.crud_tree import LEVELS
+from app.crud.crud_views import crud_views
+from app.db.session import SessionLocal
+from app.schemas.views import PopularItem
+
+logger = logging.getLogger("app.views")
+
+MODELS = dict(LEVELS)
+
+
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Counter[tuple[str, date, int]] = Counter()
+
+
+class ViewCounter:
+    """
+    Page views counted in memory, per worker, and added to content_views
+    every VIEW_FLUSH_SECONDS as one batched upsert.
+
+    Each thread increments its own shard (assigned on first use), so
+    request threads do not queue on one lock even for the same hot page.
+    A crash loses at most one interval of views.
+    """
+
+    def __init__(self, session_factory=SessionLocal, shards: int | None = None):
+        self.session_factory = session_factory
+        self._shards = [_Shard() for _ in range(shards or settings.VIEW_COUNTER_SHARDS)]
+        self._next_shard = itertools.count()
+        self._local = threading.local()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = self._shards[next(self._next_shard) % len(self._shards)]
+        return shard
+
+    def add(self, entity: str, entity_id: int, views: int = 1) -> None:
+        key = (entity, datetime.now(timezone.utc).date(), entity_id)
+        shard = self._shard()
+        with shard.lock:
+            shard.counts[key] += views
+
+    def pending(self) -> Counter:
+        """This worker's unwritten views, all shards summed."""
+        total = Counter()
+        for shard in self._shards:
+            with shard.lock:
+                total.update(shard.counts)
+        return total
+
+    def _take(self) -> Counter:
+        total = Counter()
+        for shard in self._shards:
+            with shard.lock:
+                counts, shard.counts = shard.counts, Counter()
+            total.update(counts)
+        return total
+
+    def flush(self) -> int:
+        """Write the pending views; returns the number of counters touched."""
+        with self._flush_lock:
+            counts = self._take()
+            if not counts:
+                return 0
+            rows = [
+                {"entity": entity, "day": day, "entity_id": entity_id, "views": views}
+                for (entity, day, entity_id), views in counts.items()
+            ]
+            try:
+                with self.session_factory() as db:
+                    crud_views.add_many(db, rows)
+                    db.commit()
+            except Exception:
+                # Counted again on the next attempt
+                shard = self._shards[0]
+                with shard.lock:
+                    shard.counts.update(counts)
+                raise
+            return len(rows)
+
+    # ---------- background flushing ----------
+    def _run(self) -> None:
+        while not self._stop.wait(settings.VIEW_FLUSH_SECONDS):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("View counter flush failed")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="view-flush", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher and write what is left."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+view_counter = ViewCounter()
+
+
+def record_view(entity: str, entity_id: int) -> None:
+    view_counter.add(entity, entity_id)
+
+
+# ======================================================
+# Popularity (counters table only; this worker's pending views aside)
+# ======================================================
+
+def get_popular(db: Session, entity: str, days: int, limit: int) -> list[dict]:
+    model = MODELS.get(entity)
+    if model is None:
+        raise HTTPException(400, f"Unknown entity: {entity}")
+
+    def load():
+        since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        return [
+            PopularItem(entity=entity, id=obj.id, slug=obj.slug, title=obj.title, views=views)
+            .model_dump()
+            for obj, views in crud_views.top(db, entity, model, since, limit)
+        ]
+
+    # The table only moves once per flush interval anyway
+    return popular_cache.get_or_set(f"{entity}:{days}:{limit}", load)
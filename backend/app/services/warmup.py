@@ -0,0 +1,79 @@
+import logging
+import time
+import typing
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.orm import Session, configure_mappers
+
+import app.models  # noqa: F401  (register every mapper before configuring)
+from app.db.session import SessionLocal
+from app.services.autocomplete_service import get_index
+from app.services.resolver_service import get_trie
+from app.services.publish_service import list_published, live_version
+
+logger = logging.getLogger("app.warmup")
+
+
+def _response_models(annotation) -> typing.Iterator[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in typing.get_args(annotation):
+        yield from _response_models(arg)
+
+
+def prepare(app: FastAPI) -> None:
+    """
+    CPU-only work that would otherwise land on the first requests.
+
+    Touches no database, so gunicorn can run it once in the master before
+    forking (preload_app) and every worker inherits the result.
+    """
+    configure_mappers()
+
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.response_model is not None:
+            for model in _response_models(route.response_model):
+                # No-op for complete models; builds ones deferred by forward refs.
+                model.model_rebuild()
+
+    # Cached on the app after the first call.
+    app.openapi()
+
+
+def warm_caches(db: Session) -> int:
+    """
+    Load what every visitor starts from: the published roadmaps and the
+    live version of each. Returns the number of cache entries.
+    """
+    db.execute(text("SELECT 1"))  # opens the first pooled connection
+
+    roadmaps = list_published(db)
+    for roadmap in roadmaps:
+        live_version(db, roadmap["slug"])
+    return 1 + len(roadmaps)
+
+
+def warm_up(app: FastAPI) -> None:
+    """
+    Called from the lifespan handler, i.e. before the worker reports ready.
+    A failure is logged and the worker starts cold rather than not at all.
+    """
+    start = time.perf_counter()
+    try:
+        prepare(app)
+        with SessionLocal() as db:
+            entries = warm_caches(db)
+            get_trie(db)  # per-process, so not part of warm_caches
+            get_index(db)
+    except Exception:
+        logger.exception("Warmup failed; starting with cold caches")
+        return
+
+    logger.info(
+        "Warmup done: %d cache entries in %.0f ms",
+        entries,
+        (time.perf_counter() - start) * 1000,
+    )
@@ -0,0 +1,146 @@
+import os
+import tempfile
+
+# Settings are read at import time, so point the app at a throwaway
+# SQLite database before anything from `app` is imported.
+_db_dir = tempfile.mkdtemp(prefix="eduwise-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/test.db")
+os.environ.setdefault("APP_NAME", "EduWise")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+os.environ.setdefault("CELERY_TASK_ALWAYS_EAGER", "true")
+os.environ.setdefault("CELERY_BROKER_URL", "memory://")
+os.environ.setdefault("SITEMAP_DIR", f"{_db_dir}/sitemaps")
+os.environ.setdefault("SITEMAP_DEBOUNCE_SECONDS", "0")
+os.environ.setdefault("MEDIA_ROOT", f"{_db_dir}/media")
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.models  # noqa: F401  (register all tables)
+from app.core.cache import (
+    catalog_cache,
+    popular_cache,
+    prerender_cache,
+    published_cache,
+    snapshot_cache,
+)
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.core.security import create_access_token
+from app.core.tracing import setup_tracing, shutdown_tracing
+from app.main import app as fastapi_app
+from app.models import Permission, User, UserRole
+from app.services.autocomplete_service import reset_index
+from app.services.related_service import reset_model
+from app.services.resolver_service import reset_trie
+from app.tests.query_budget import count_queries
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+        catalog_cache.invalidate()
+        prerender_cache.invalidate()
+        published_cache.invalidate()
+        snapshot_cache.invalidate()
+        popular_cache.invalidate()
+        reset_trie()
+        reset_index()
+        reset_model()
+
+
+@pytest.fixture
+def client(db):
+    with TestClient(fastapi_app) as c:
+        yield c
+
+
+@pytest.fixture
+def editor(db):
+    """
+    Headers of a user allowed to read the draft catalog and publish it.
+
+    Usage:
+    def test_draft(client, editor):
+        client.get("/api/v1/roadmaps/", headers=editor)
+    """
+    permissions = [Permission(name=name) for name in ("update_roadmap", "publish_roadmap")]
+    role = UserRole(name="editor", permissions=permissions)
+    user = User(email="editor@example.com", username="editor", hashed_password="-", role=role)
+    db.add(user)
+    db.commit()
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+@pytest.fixture
+def catalog(client):
+    """
+    One active row per level, created through the API.
+
+    Usage:
+    def test_topic(client, catalog):
+        client.get(f"/api/v1/topics/{catalog['topic']}/related")
+    """
+    ids = {}
+
+    def create(path, entity, **fields):
+        parents = {f"{name}_id": ids[name] for name in ids}
+        response = client.post(f"/api/v1/{path}/", json={**parents, **fields})
+        assert response.status_code == 200, response.text
+        ids[entity] = response.json()["id"]
+
+    create("roadmaps", "roadmap", slug="frontend", title="Frontend")
+    create("technologies", "technology", slug="react", title="React")
+    create("modules", "module", slug="basics", title="Basics")
+    text = [{"type": "paragraph", "text": "Components render state into markup"}]
+    create("topics", "topic", slug="components", title="Components", content=text)
+    create("sub-topics", "sub_topic", slug="props", title="Props", content=text)
+    create("lessons", "lesson", slug="passing-props", title="Passing props", content=text)
+    return ids
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Usage:
+    def test_list_topics(client, query_budget):
+        with query_budget(2):
+            client.get("/api/v1/topics/module/1")
+    """
+    def _budget(budget: int | None = None, max_repeats: int | None = 2):
+        return count_queries(engine, budget=budget, max_repeats=max_repeats)
+
+    return _budget
+
+
+@pytest.fixture
+def span_exporter():
+    """
+    Enables tracing with an in-memory exporter for one test.
+
+    Usage:
+    def test_update_topic_is_traced(client, span_exporter):
+        client.put("/api/v1/topics/1", json={...})
+        names = [s.name for s in span_exporter.get_finished_spans()]
+    """
+    exporter = setup_tracing("memory")
+    yield exporter
+    shutdown_tracing()
@@ -0,0 +1,95 @@
+import re
+from collections import defaultdict
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class NPlusOneDetected(AssertionError):
+    pass
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryLog:
+    """
+    Statements executed inside a `count_queries()` block.
+    """
+
+    def __init__(self):
+        self.statements: list[tuple[str, object]] = []
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, max_repeats: int) -> dict[str, int]:
+        """
+        Same SQL text executed more than `max_repeats` times with different
+        parameters - the shape of a lazy load inside a loop.
+        """
+        params_by_sql: dict[str, set[str]] = defaultdict(set)
+        for sql, params in self.statements:
+            params_by_sql[sql].add(repr(params))
+        return {
+            sql: len(params)
+            for sql, params in params_by_sql.items()
+            if len(params) > max_repeats
+        }
+
+    def format(self) -> str:
+        return "\n".join(
+            f"  {i}. {sql}  -- {params!r}"
+            for i, (sql, params) in enumerate(self.statements, 1)
+        )
+
+
+@contextmanager
+def count_queries(
+    engine: Engine,
+    budget: int | None = None,
+    max_repeats: int | None = 2,
+):
+    """
+    Usage:
+    with count_queries(engine, budget=2) as log:
+        client.get("/api/v1/topics/module/1")
+
+    Fails with QueryBudgetExceeded when more than `budget` statements run and
+    with NPlusOneDetected when one statement repeats with more than
+    `max_repeats` parameter sets. Pass None to disable either check.
+    """
+    log = QueryLog()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        log.statements.append((_WHITESPACE.sub(" ", statement).strip(), parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield log
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    if budget is not None and log.count > budget:
+        raise QueryBudgetExceeded(
+            f"Expected at most {budget} queries, got {log.count}:\n{log.format()}"
+        )
+
+    if max_repeats is not None:
+        repeated = log.repeated(max_repeats)
+        if repeated:
+            details = "\n".join(
+                f"  x{n}: {sql}" for sql, n in repeated.items()
+            )
+            raise NPlusOneDetected(
+                f"Possible N+1: statements repeated with different parameters:\n{details}"
+            )
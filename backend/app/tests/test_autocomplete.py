@@ -0,0 +1,36 @@
+from app.services import autocomplete_service
+from app.services.autocomplete_service import PrefixIndex
+
+
+def test_apply_skips_refs_it_does_not_hold(db, catalog):
+    index = PrefixIndex.build(db)
+    lesson = ("lesson", catalog["lesson"])
+    # Out of step with the keys, e.g. written twice
+    index._state.items[lesson] = ("Zebra crossing", "zebra", catalog["sub_topic"])
+
+    index.apply(db, {"lesson": {catalog["lesson"]}})
+    assert [hit["id"] for hit in index.search("passing", 5)] == [catalog["lesson"]]
+
+
+def test_search_fills_places_taken_by_orphans(client, db, catalog, monkeypatch):
+    client.post("/api/v1/technologies/", json={"roadmap_id": catalog["roadmap"], "slug": "preact", "title": "Preact"})
+    index = PrefixIndex.build(db)
+    # "Props" ranks first, but now sits under an inactive module
+    del index._state.items[("module", catalog["module"])]
+    monkeypatch.setattr(autocomplete_service, "MAX_RESULTS", 1)
+
+    assert [hit["slug"] for hit in index.search("p", 1)] == ["preact"]
+
+
+def test_stale_index_is_rebuilt_in_the_background(db, catalog):
+    index = autocomplete_service.get_index(db)
+    autocomplete_service._built_at = 0.0
+
+    # Served at once, even while a writer holds the lock; the rebuild
+    # is swapped in when done
+    with autocomplete_service._lock:
+        assert autocomplete_service.get_index(db) is index
+    with autocomplete_service._rebuilding:
+        pass
+    assert autocomplete_service._index is not index
+    assert [hit["slug"] for hit in autocomplete_service._index.search("passing", 5)] == ["passing-props"]
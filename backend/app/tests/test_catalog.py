@@ -0,0 +1,36 @@
+from app.models import Lesson, Technology
+
+
+def test_update_cannot_deactivate(client, db, catalog):
+    # Deactivation cascades; it goes through DELETE / restore only
+    response = client.put(f"/api/v1/technologies/{catalog['technology']}", json={"is_active": False})
+    assert response.status_code == 200
+    assert db.get(Technology, catalog["technology"]).is_active
+
+    client.delete(f"/api/v1/technologies/{catalog['technology']}")
+    db.expire_all()
+    assert not db.get(Lesson, catalog["lesson"]).is_active
+
+
+def test_reorder_sets_the_order_in_one_go(client, editor, catalog):
+    parents = {f"{key}_id": catalog[key] for key in ("roadmap", "technology", "module")}
+    ids = [catalog["topic"]] + [
+        client.post("/api/v1/topics/", json={**parents, "slug": f"topic-{i}", "title": f"Topic {i}"}).json()["id"]
+        for i in range(2)
+    ]
+    listed = f"/api/v1/topics/module/{catalog['module']}"
+
+    response = client.patch("/api/v1/topics/reorder", json={"parent_id": catalog["module"], "ids": ids[::-1]}, headers=editor)
+    assert response.json()["count"] == 3
+    assert [t["id"] for t in client.get(listed, headers=editor).json()] == ids[::-1]
+
+    # Anything but exactly the module's topics rejects the whole list
+    for sent, missing, foreign in (
+        (ids[:2], [ids[2]], []),
+        ([*ids, 999], [], [999]),
+        ([ids[0], ids[1], 999], [ids[2]], [999]),
+    ):
+        response = client.patch("/api/v1/topics/reorder", json={"parent_id": catalog["module"], "ids": sent}, headers=editor)
+        assert response.status_code == 422
+        assert (response.json()["detail"]["missing"], response.json()["detail"]["foreign"]) == (missing, foreign)
+    assert [t["id"] for t in client.get(listed, headers=editor).json()] == ids[::-1]
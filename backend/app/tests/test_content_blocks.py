@@ -0,0 +1,26 @@
+from app.core.config import settings
+from app.models import Topic
+from app.worker.tasks import migrate_content_blocks
+
+TEXT = [{"type": "paragraph", "text": "Components render state into markup"}]
+
+
+def _content(page: dict) -> list[dict]:
+    return [{k: v for k, v in block.items() if v is not None} for block in page["content"] or []]
+
+
+def test_full_reads_assemble_migrated_content(client, db, catalog, editor, monkeypatch):
+    monkeypatch.setattr(settings, "CONTENT_STORAGE", "blocks")
+    assert migrate_content_blocks() == 3
+    assert db.get(Topic, catalog["topic"]).content is None
+
+    topic = client.get(f"/api/v1/topics/module/{catalog['module']}/components", headers=editor).json()
+    assert _content(topic) == TEXT
+    assert _content(topic["sub_topics"][0]) == TEXT
+    assert _content(client.get(f"/api/v1/topics/module/{catalog['module']}", headers=editor).json()[0]) == TEXT
+    assert _content(client.get(f"/api/v1/sub-topics/topic/{catalog['topic']}/props", headers=editor).json()) == TEXT
+    assert _content(client.get(f"/api/v1/lessons/sub-topic/{catalog['sub_topic']}", headers=editor).json()[0]) == TEXT
+
+    # An update that leaves content alone still returns it
+    response = client.put(f"/api/v1/lessons/{catalog['lesson']}", json={"title": "Props in depth"})
+    assert _content(response.json()) == TEXT
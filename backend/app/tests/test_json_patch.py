@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.models.revision import Revision
+
+
+def _revisions(db, topic_id: int) -> int:
+    return db.scalar(select(func.count()).where(Revision.owner_type == "topic", Revision.owner_id == topic_id))
+
+
+def test_patch_edits_one_block_and_records_a_revision(client, editor, db, catalog):
+    url = f"/api/v1/topics/{catalog['topic']}"
+    response = client.patch(url, json=[
+        {"op": "test", "path": "/content/0/type", "value": "paragraph"},
+        {"op": "add", "path": "/content/-", "value": {"type": "code", "code": "<App />"}},
+    ], headers=editor)
+    assert response.status_code == 200, response.text
+    assert response.json()["sections"]["content"][1] == {"type": "code", "code": "<App />"}
+    assert _revisions(db, catalog["topic"]) == 2  # created, patched
+
+
+def test_empty_patch_writes_nothing(client, editor, db, catalog):
+    url = f"/api/v1/topics/{catalog['topic']}"
+    before = client.patch(url, json=[], headers=editor).json()
+    assert client.patch(url, json=[{"op": "test", "path": "/content/0/type", "value": "paragraph"}], headers=editor).status_code == 200
+    assert client.patch(url, json=[], headers=editor).json()["updated_at"] == before["updated_at"]
+    assert _revisions(db, catalog["topic"]) == 1
+
+
+@pytest.mark.parametrize("operation, status", [
+    ({"op": "replace", "path": "/slug", "value": "x"}, 400),  # not a JSON section
+    ({"op": "remove", "path": "/content/5"}, 400),
+    ({"op": "test", "path": "/content/0/type", "value": "code"}, 409),
+    ({"op": "replace", "path": "/content/0", "value": {"text": "no type"}}, 422),
+    ({"op": "add", "path": "/content/0/-", "value": "x"}, 422),  # "-" on an object
+])
+def test_rejected_patch_changes_nothing(client, editor, db, catalog, operation, status):
+    response = client.patch(f"/api/v1/topics/{catalog['topic']}", json=[operation], headers=editor)
+    assert response.status_code == status, response.text
+    assert _revisions(db, catalog["topic"]) == 1
+
+
+@pytest.mark.parametrize("setup, operation", [
+    # An example is any dict, a related topic a string: neither is a block
+    ({"op": "add", "path": "/examples/-", "value": {"foo": 1}},
+     {"op": "move", "from": "/examples/0", "path": "/content/-"}),
+    ({"op": "add", "path": "/related_topics/-", "value": "x"},
+     {"op": "copy", "from": "/related_topics/0", "path": "/content/-"}),
+    # The source block is left without a type
+    ({"op": "add", "path": "/content/-", "value": {"type": "code", "code": "<App />"}},
+     {"op": "move", "from": "/content/0/type", "path": "/content/1/type"}),
+])
+def test_moved_and_copied_values_are_validated(client, editor, db, catalog, setup, operation):
+    url = f"/api/v1/topics/{catalog['topic']}"
+    assert client.patch(url, json=[setup], headers=editor).status_code == 200
+    response = client.patch(url, json=[operation], headers=editor)
+    assert response.status_code == 422, response.text
+    assert _revisions(db, catalog["topic"]) == 2
+    assert client.get(f"/api/v1/topics/module/{catalog['module']}/components", headers=editor).status_code == 200
@@ -0,0 +1,73 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.models import MediaAsset
+from app.services import media_service
+
+
+def _png(size=(100, 50), mode="RGB", **save) -> bytes:
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format="PNG", **save)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def upload(client, editor, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_VARIANT_WIDTHS", [40])
+
+    def _upload(data: bytes):
+        return client.post("/api/v1/media/", headers=editor, files={"file": ("image.png", data, "image/png")})
+
+    return _upload
+
+
+def _path(url: str) -> str:
+    return os.path.join(settings.MEDIA_ROOT, url.removeprefix(settings.MEDIA_URL).lstrip("/"))
+
+
+def test_upload_stores_the_original_and_its_variants(upload):
+    data = _png()
+    asset = upload(data).json()
+    assert (asset["width"], asset["height"], asset["size_bytes"]) == (100, 50, len(data))
+    assert asset["content_type"] == "image/png"
+
+    formats = media_service.variant_formats()
+    variants = {(v["format"], v["width"]): v for v in asset["variants"]}
+    assert set(variants) == {(fmt, w) for fmt in formats for w in (40, 100)}
+    assert variants[("webp", 40)]["height"] == 20
+    for variant in asset["variants"]:
+        assert os.path.getsize(_path(variant["url"])) == variant["size_bytes"]
+    assert os.path.exists(_path(asset["url"]))
+
+
+def test_same_bytes_are_stored_once(upload, db):
+    first = upload(_png()).json()
+    assert upload(_png()).json()["id"] == first["id"]
+    assert db.query(MediaAsset).count() == 1
+
+
+def test_non_images_are_rejected(upload):
+    assert upload(b"%PDF-1.4 not an image").status_code == 400
+
+
+def test_transparent_palette_images_keep_their_alpha(upload):
+    asset = upload(_png(mode="P", transparency=0)).json()
+    webp = next(v for v in asset["variants"] if v["format"] == "webp")
+    with Image.open(_path(webp["url"])) as image:
+        assert image.mode == "RGBA"
+
+
+def test_pages_and_seo_describe_uploaded_images(client, editor, catalog, upload):
+    url = upload(_png()).json()["url"]
+    base = url.rsplit(".", 1)[0]
+
+    for path in (f"topics/{catalog['topic']}", f"lessons/{catalog['lesson']}"):
+        page = client.put(f"/api/v1/{path}", json={"image_banner_url": url}).json()
+        assert page["image_banner_srcset"]["image/webp"] == f"{base}-40w.webp 40w, {base}-100w.webp 100w"
+
+    seo = client.post("/api/v1/seo/", json={"og_image_url": url}).json()
+    assert (seo["og_image_width"], seo["og_image_height"]) == (100, 50)
@@ -0,0 +1,30 @@
+from sqlalchemy import delete, func, select
+
+from app.models import ReadingOrder
+from app.worker import tasks
+
+
+def test_miss_is_computed_without_writing(client, db, catalog):
+    db.execute(delete(ReadingOrder))
+    db.commit()
+
+    response = client.get(f"/api/v1/navigation/sub_topic/{catalog['sub_topic']}")
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["position"], body["total"]) == (2, 3)
+    assert body["prev"]["slug"] == "components"
+    assert body["next"]["slug"] == "passing-props"
+    assert db.scalar(select(func.count()).select_from(ReadingOrder)) == 0
+
+
+def test_rebuild_only_on_placement_changes(client, editor, catalog, monkeypatch):
+    queued = []
+    monkeypatch.setattr(tasks.rebuild_reading_order, "delay", queued.append)
+    topic = f"/api/v1/topics/{catalog['topic']}"
+
+    client.put(topic, json={"content": [{"type": "paragraph", "text": "Edited"}]})
+    assert queued == []
+
+    client.put(topic, json={"title": "Components in depth"})
+    client.patch("/api/v1/topics/reorder", json={"parent_id": catalog["module"], "ids": [catalog["topic"]]}, headers=editor)
+    assert queued == [{"topic": [catalog["topic"]]}] * 2
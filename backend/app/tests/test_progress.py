@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.models import LessonProgress, User, UserRole
+from app.schemas.progress import ProgressEvent
+from app.services import progress_service
+from app.services.progress_service import ProgressBuffer
+
+
+def test_flush_upserts_the_best_of_stored_and_pending(db, catalog):
+    user = User(email="learner@example.com", username="learner", hashed_password="-", role=UserRole(name="learner"))
+    db.add(user)
+    db.commit()
+    buffer, lesson = ProgressBuffer(), catalog["lesson"]
+
+    buffer.add(user.id, lesson, ProgressEvent(percent=40))
+    buffer.add(user.id, lesson, ProgressEvent(percent=20))
+    buffer.add(user.id, 999, ProgressEvent(percent=10))  # no such lesson: dropped
+    assert buffer.flush() == 1
+    row = db.get(LessonProgress, (user.id, lesson))
+    assert (row.percent, row.completed) == (40, False)
+
+    buffer.add(user.id, lesson, ProgressEvent(completed=True))
+    buffer.flush()
+    db.refresh(row)
+    completed_at = row.completed_at
+    assert (row.percent, row.completed) == (100, True)
+
+    # A later, lower event does not undo it
+    buffer.add(user.id, lesson, ProgressEvent(percent=30))
+    buffer.flush()
+    db.refresh(row)
+    assert (row.percent, row.completed, row.completed_at) == (100, True, completed_at)
+    assert buffer.flush() == 0
+
+
+def test_a_full_buffer_starts_one_flush_at_a_time(db, catalog, monkeypatch):
+    monkeypatch.setattr(settings, "PROGRESS_BUFFER_SIZE", 1)
+    user = User(email="learner@example.com", username="learner", hashed_password="-", role=UserRole(name="learner"))
+    db.add(user)
+    db.commit()
+    buffer, started = ProgressBuffer(), []
+    # Flush threads are recorded, not run, so the test decides when they do
+    thread = lambda target, daemon: SimpleNamespace(start=lambda: started.append(target))
+    monkeypatch.setattr(progress_service, "threading", SimpleNamespace(Thread=thread))
+
+    for percent in (10, 20, 30):
+        buffer.add(user.id, catalog["lesson"], ProgressEvent(percent=percent))
+    assert len(started) == 1
+
+    assert started[0]() == 1
+    assert db.get(LessonProgress, (user.id, catalog["lesson"])).percent == 30
+
+    # Once it ran, the next full buffer starts another
+    buffer.add(user.id, catalog["lesson"], ProgressEvent(percent=40))
+    assert len(started) == 2
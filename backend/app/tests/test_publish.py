@@ -0,0 +1,76 @@
+import pytest
+
+PAGE = "/api/v1/published/frontend/react/basics/components"
+
+
+@pytest.mark.parametrize("url", [
+    "/api/v1/roadmaps/",
+    "/api/v1/roadmaps/frontend",
+    "/api/v1/technologies/roadmap/{roadmap}",
+    "/api/v1/topics/module/{module}/components",
+    "/api/v1/lessons/{lesson}/revisions",
+])
+def test_draft_reads_need_an_editor(client, catalog, editor, url):
+    url = url.format(**catalog)
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=editor).status_code == 200
+
+
+def test_visitors_read_the_published_snapshot(client, catalog, editor):
+    assert client.get(PAGE).status_code == 404  # not published yet
+
+    published = client.post(f"/api/v1/roadmaps/{catalog['roadmap']}/publish", headers=editor).json()
+    assert (published["version"], published["pages"]) == (1, 6)
+    assert [r["slug"] for r in client.get("/api/v1/published").json()] == ["frontend"]
+
+    page = client.get(PAGE)
+    assert page.json()["item"]["title"] == "Components"
+    assert [link["slug"] for link in page.json()["children"]] == ["props"]
+    assert client.get(PAGE, headers={"If-None-Match": page.headers["etag"]}).status_code == 304
+
+    # Draft edits stay private until the next publish
+    client.put(f"/api/v1/topics/{catalog['topic']}", json={"title": "Components (draft)"})
+    assert client.get(PAGE).json()["item"]["title"] == "Components"
+
+    client.post(f"/api/v1/roadmaps/{catalog['roadmap']}/publish", headers=editor)
+    page = client.get(PAGE)
+    assert page.json()["item"]["title"] == "Components (draft)"
+    assert page.headers["etag"] == f'"{catalog["roadmap"]}.2"'
+
+    client.delete(f"/api/v1/roadmaps/{catalog['roadmap']}/publish", headers=editor)
+    assert client.get(PAGE).status_code == 404
+
+
+@pytest.mark.parametrize("method, url, body, status", [
+    ("patch", "/api/v1/topics/reorder", {"parent_id": 1, "ids": [1]}, 200),
+    ("patch", "/api/v1/lessons/{lesson}", [], 200),
+    ("post", "/api/v1/modules/{module}/restore", None, 400),  # not deleted
+    ("post", "/api/v1/sub-topics/{sub_topic}/revisions/1/restore", None, 200),
+])
+def test_draft_writes_need_an_editor(client, catalog, editor, method, url, body, status):
+    url = url.format(**catalog)
+    kwargs = {} if body is None else {"json": body}
+    assert getattr(client, method)(url, **kwargs).status_code == 401
+    assert getattr(client, method)(url, headers=editor, **kwargs).status_code == status
+
+
+def test_visitors_get_blocks_and_related_from_the_snapshot(client, catalog, editor):
+    from app.worker.tasks import rebuild_related_content
+
+    client.patch(f"/api/v1/topics/{catalog['topic']}", headers=editor, json=[
+        {"op": "add", "path": "/content/-", "value": {"type": "paragraph", "text": f"Part {i}"}}
+        for i in range(4)
+    ])
+    rebuild_related_content()
+    client.post(f"/api/v1/roadmaps/{catalog['roadmap']}/publish", headers=editor)
+
+    blocks = client.get(f"{PAGE}/blocks", params={"offset": 1, "limit": 2}).json()
+    assert blocks["total"] == 5
+    assert [block["text"] for block in blocks["items"]] == ["Part 0", "Part 1"]
+
+    related = client.get(PAGE).json()["related"]
+    assert {item["path"] for item in related} == {
+        "frontend/react/basics/components/props",
+        "frontend/react/basics/components/props/passing-props",
+    }
+    assert client.get("/api/v1/published/frontend/nope/blocks").status_code == 404
@@ -0,0 +1,52 @@
+import pytest
+
+from app.core.cache import catalog_cache, published_cache, snapshot_cache
+from app.services.autocomplete_service import reset_index
+from app.services.resolver_service import reset_trie
+
+# (path, queries at most on a cold cache, draft read); the draft
+# permission check costs its own queries
+ENDPOINTS = [
+    ("/api/v1/modules/technology/{technology}", 4, True),
+    ("/api/v1/topics/module/{module}", 5, True),
+    ("/api/v1/topics/module/{module}/components", 5, True),
+    ("/api/v1/sub-topics/topic/{topic}", 4, True),
+    ("/api/v1/lessons/sub-topic/{sub_topic}", 4, True),
+    ("/api/v1/navigation/lesson/{lesson}", 3, False),
+    ("/api/v1/resolve?path=frontend/react/basics/components/props", 6, False),
+    ("/api/v1/published", 1, False),
+    ("/api/v1/published/frontend/react/basics/components", 2, False),
+    ("/api/v1/autocomplete?q=pro", 6, False),
+    ("/api/v1/popular", 1, False),
+]
+
+
+@pytest.fixture
+def wide_catalog(client, editor, catalog):
+    # Several children per parent, so a per-row query shows up as repeats
+    def create(path, **fields):
+        parents = {f"{key}_id": catalog[key] for key in ("roadmap", "technology", "module")}
+        response = client.post(f"/api/v1/{path}/", json={**parents, **fields})
+        assert response.status_code == 200, response.text
+        return response.json()["id"]
+
+    for i in range(3):
+        topic = create("topics", slug=f"topic-{i}", title=f"Topic {i}")
+        create("sub-topics", topic_id=topic, slug=f"sub-{i}", title=f"Sub {i}")
+        create("lessons", topic_id=catalog["topic"], sub_topic_id=catalog["sub_topic"],
+               slug=f"lesson-{i}", title=f"Lesson {i}")
+    client.post(f"/api/v1/roadmaps/{catalog['roadmap']}/publish", headers=editor)
+    return catalog
+
+
+@pytest.mark.parametrize("path, budget, draft", ENDPOINTS)
+def test_hot_endpoints_stay_within_budget(client, editor, wide_catalog, query_budget, path, budget, draft):
+    url = path.format(**wide_catalog)
+    for cache in (catalog_cache, published_cache, snapshot_cache):
+        cache.invalidate()
+    reset_trie()
+    reset_index()
+
+    with query_budget(budget):
+        response = client.get(url, headers=editor if draft else None)
+    assert response.status_code == 200, response.text
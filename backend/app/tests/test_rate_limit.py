@@ -0,0 +1,107 @@
+import asyncio
+import ipaddress
+import time
+
+import fakeredis
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.rate_limit import (
+    DEFAULT_POLICIES,
+    MemoryBackend,
+    RateLimitMiddleware,
+    RateLimitPolicy,
+    RedisBackend,
+    _client_ip,
+)
+
+LOGIN = next(p for p in DEFAULT_POLICIES if p.name == "login")
+
+
+def _client(backend, policies=None) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/v1/auth/login")
+    def login(ok: bool = False):
+        if not ok:
+            raise HTTPException(401, "Invalid credentials")
+        return {"access_token": "t"}
+
+    @app.get("/api/v1/items")
+    def items():
+        return []
+
+    app.add_middleware(RateLimitMiddleware, policies=policies, backend=backend)
+    return TestClient(app)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return MemoryBackend()
+    return RedisBackend(fakeredis.FakeAsyncRedis())
+
+
+def test_empty_bucket_returns_429(backend):
+    policy = RateLimitPolicy("read", "/api/v1/", capacity=3, refill_per_second=0.001)
+    with _client(backend, [policy]) as client:
+        assert [client.get("/api/v1/items").status_code for _ in range(3)] == [200] * 3
+        response = client.get("/api/v1/items")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1000"
+
+
+def test_login_only_charges_failures(backend):
+    # One event loop for the whole test (the Redis client is bound to it)
+    with _client(backend) as client:
+        for _ in range(10):
+            assert client.post("/api/v1/auth/login?ok=true").status_code == 200
+        for _ in range(LOGIN.capacity):
+            assert client.post("/api/v1/auth/login").status_code == 401
+        # Out of attempts: even the right password is refused for now
+        assert client.post("/api/v1/auth/login?ok=true").status_code == 429
+
+
+def test_memory_backend_evicts_idle_buckets_behind_longer_lived_ones():
+    backend = MemoryBackend()
+    short = RateLimitPolicy("short", "/", capacity=1, refill_per_second=1.0)  # idle after 1 s
+    long = RateLimitPolicy("long", "/", capacity=100, refill_per_second=0.01)  # idle after 10000 s
+
+    async def fill():
+        await backend.consume("long:a", long)
+        for i in range(5):
+            await backend.consume(f"short:{i}", short)
+
+    asyncio.run(fill())
+    assert len(backend) == 6
+
+    backend._evict(time.monotonic() + 2)
+    assert len(backend) == 1
+
+
+def test_memory_backend_caps_keys():
+    backend = MemoryBackend(max_keys=3)
+    policy = RateLimitPolicy("read", "/", capacity=10, refill_per_second=0.001)
+
+    async def fill():
+        for i in range(5):
+            await backend.consume(f"read:{i}", policy)
+
+    asyncio.run(fill())
+    assert len(backend) == 3
+
+
+def _scope(peer: str, forwarded: str) -> dict:
+    return {"client": (peer, 1234), "headers": [(b"x-forwarded-for", forwarded.encode())]}
+
+
+def test_forwarded_for_needs_a_trusted_peer(monkeypatch):
+    assert _client_ip(_scope("10.0.0.5", "3.3.3.3")) == "10.0.0.5"
+
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", [ipaddress.ip_network("10.0.0.0/8")])
+    # Right-most hop that is not a proxy; a spoofed left part is ignored
+    assert _client_ip(_scope("10.0.0.5", "6.6.6.6, 3.3.3.3, 10.0.0.7")) == "3.3.3.3"
+    # Anyone else sending the header is limited by their own address
+    assert _client_ip(_scope("8.8.8.8", "3.3.3.3")) == "8.8.8.8"
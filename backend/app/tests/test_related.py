@@ -0,0 +1,54 @@
+import copy
+
+from sqlalchemy import select
+
+from app.crud.crud_related import crud_related
+from app.models import RelatedVector
+from app.services import related_service
+from app.worker import tasks
+
+
+def _related(client, editor, path):
+    return [(item["entity"], item["id"]) for item in client.get(f"{path}/related", headers=editor).json()]
+
+
+def test_refresh_reads_only_the_changed_pages(client, db, editor, catalog, monkeypatch):
+    tasks.rebuild_related_content()
+    assert crud_related.head(db).seq == 0
+    topic = f"/api/v1/topics/{catalog['topic']}"
+    assert ("lesson", catalog["lesson"]) in _related(client, editor, topic)
+
+    loads = []
+    load_corpus = related_service.load_corpus
+    monkeypatch.setattr(related_service, "load_corpus", lambda db, *args: loads.append(args) or load_corpus(db, *args))
+
+    client.put(f"/api/v1/lessons/{catalog['lesson']}", json={"content": [{"type": "paragraph", "text": "Deploying servers"}]})
+    assert loads == [("lesson", [catalog["lesson"]])]
+    # Only the changed page's vector is written back
+    written = db.execute(select(RelatedVector.entity, RelatedVector.entity_id).where(RelatedVector.seq == 1)).all()
+    assert written == [("lesson", catalog["lesson"])]
+    assert ("lesson", catalog["lesson"]) not in _related(client, editor, topic)
+    assert ("sub_topic", catalog["sub_topic"]) in _related(client, editor, topic)
+
+    client.put(f"/api/v1/lessons/{catalog['lesson']}", json={"content": [{"type": "paragraph", "text": "Passing state into components"}]})
+    assert ("lesson", catalog["lesson"]) in _related(client, editor, topic)
+
+    client.delete(f"/api/v1/lessons/{catalog['lesson']}")
+    assert ("lesson", catalog["lesson"]) not in _related(client, editor, topic)
+
+
+def test_a_stale_copy_catches_up_with_other_workers(client, db, catalog):
+    tasks.rebuild_related_content()
+    # What another worker still holds while this one refreshes
+    stale = copy.deepcopy(related_service._model)
+
+    client.put(f"/api/v1/lessons/{catalog['lesson']}", json={"content": [{"type": "paragraph", "text": "Deploying servers"}]})
+    related_service._model = stale
+    client.put(f"/api/v1/topics/{catalog['topic']}", json={"title": "Components and props"})
+
+    model = related_service._model
+    stored = related_service._Model.load(db, crud_related.head(db))
+    assert model.seq == stored.seq == 2
+    order = [model.keys.index(key) for key in stored.keys]
+    assert [model.links[row] for row in order] == stored.links
+    assert (model.matrix[order] != stored.matrix).nnz == 0
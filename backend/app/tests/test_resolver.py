@@ -0,0 +1,45 @@
+from app.crud.crud_tree import crud_tree
+from app.services import resolver_service
+
+PATH = "frontend/react/basics/components/props/passing-props"
+
+
+def _resolve(client, path):
+    return client.get("/api/v1/resolve", params={"path": path})
+
+
+def test_writes_are_applied_to_the_trie(client, editor, catalog, monkeypatch):
+    assert _resolve(client, PATH).json()["id"] == catalog["lesson"]
+    trie = resolver_service._trie
+    # From here on every answer must come from the trie
+    monkeypatch.setattr(crud_tree, "resolve", lambda db, slugs: None)
+
+    client.put(f"/api/v1/topics/{catalog['topic']}", json={"content": [{"type": "paragraph", "text": "x"}]})
+    root = trie.root
+    _resolve(client, PATH)
+    assert trie.root is root  # content edits leave it alone
+
+    client.put(f"/api/v1/topics/{catalog['topic']}", json={"slug": "parts"})
+    assert _resolve(client, PATH).status_code == 404
+    renamed = _resolve(client, PATH.replace("components", "parts"))
+    assert renamed.json()["ids"]["lesson"] == catalog["lesson"]
+
+    client.delete(f"/api/v1/modules/{catalog['module']}")
+    assert _resolve(client, "frontend/react/basics/parts").status_code == 404
+    client.post(f"/api/v1/modules/{catalog['module']}/restore", headers=editor)
+    assert _resolve(client, PATH.replace("components", "parts")).json()["id"] == catalog["lesson"]
+    assert resolver_service._trie is trie
+
+
+def test_stale_trie_is_rebuilt_in_the_background(db, catalog):
+    trie = resolver_service.get_trie(db)
+    resolver_service._built_at = 0.0
+
+    # Served at once, even while a writer holds the lock; the rebuild
+    # is swapped in when done
+    with resolver_service._lock:
+        assert resolver_service.get_trie(db) is trie
+    with resolver_service._rebuilding:
+        pass
+    assert resolver_service._trie is not trie
+    assert resolver_service._trie.lookup(PATH.split("/"))[-1] == catalog["lesson"]
@@ -0,0 +1,23 @@
+from app.core.config import settings
+
+
+def test_revisions_are_rebuilt_and_restored(client, editor, catalog, monkeypatch):
+    monkeypatch.setattr(settings, "REVISION_SNAPSHOT_INTERVAL", 3)
+    topic = f"/api/v1/topics/{catalog['topic']}"
+    for i in range(1, 5):
+        client.put(topic, json={"description": f"v{i}"})
+
+    history = client.get(f"{topic}/revisions", headers=editor).json()
+    # 1: created, 2-5: the edits; a snapshot every third
+    assert [(r["number"], r["is_snapshot"]) for r in history] == [
+        (5, False), (4, True), (3, False), (2, False), (1, True),
+    ]
+    # Rebuilt from revision 1 plus two diffs, and from the snapshot at 4
+    assert client.get(f"{topic}/revisions/3", headers=editor).json()["document"]["description"] == "v2"
+    assert client.get(f"{topic}/revisions/5", headers=editor).json()["document"]["description"] == "v4"
+
+    restored = client.post(f"{topic}/revisions/2/restore", headers=editor)
+    assert restored.json()["description"] == "v1"
+    latest = client.get(f"{topic}/revisions", headers=editor).json()[0]
+    assert (latest["number"], latest["changed"]) == (6, ["description"])
+    assert client.get(f"{topic}/revisions/7", headers=editor).status_code == 404
@@ -0,0 +1,46 @@
+import re
+
+from app.core.cache import scheduled_jobs
+from app.services import seo_service
+from app.worker import tasks
+
+
+def _locs(xml: str) -> list[str]:
+    return re.findall(r"<loc>([^<]+)</loc>", xml)
+
+
+def test_sitemap_is_split_into_files_listed_by_the_index(client, catalog, monkeypatch):
+    monkeypatch.setattr(seo_service, "SITEMAP_MAX_URLS", 4)
+    assert tasks.regenerate_sitemap() == ["sitemap-1.xml", "sitemap-2.xml", "sitemap_index.xml"]
+
+    index = client.get("/api/v1/seo/sitemap.xml")
+    assert index.status_code == 200
+    assert [loc.rsplit("/", 1)[1] for loc in _locs(index.text)] == ["sitemap-1.xml", "sitemap-2.xml"]
+    pages = _locs(client.get("/api/v1/seo/sitemap-1.xml").text) + _locs(client.get("/api/v1/seo/sitemap-2.xml").text)
+    assert len(pages) == 6
+    assert pages[-1].endswith("/roadmap/frontend/react/basics/components/props/passing-props")
+
+    # Fewer pages: the chunk no longer listed is removed
+    client.delete(f"/api/v1/modules/{catalog['module']}")
+    assert tasks.regenerate_sitemap() == ["sitemap-1.xml", "sitemap_index.xml"]
+    assert client.get("/api/v1/seo/sitemap-2.xml").status_code == 404
+
+
+def test_sitemap_files_stay_under_the_size_limit(db, catalog, monkeypatch):
+    monkeypatch.setattr(seo_service, "SITEMAP_MAX_BYTES", 400)
+    files = seo_service.build_sitemap(db)
+    chunks = [xml for name, xml in files.items() if name != seo_service.SITEMAP_INDEX]
+    assert len(chunks) > 1
+    assert all(len(xml.encode()) <= 400 for xml in chunks)
+    assert sum(len(_locs(xml)) for xml in chunks) == 6
+
+
+def test_writes_in_one_window_share_a_regeneration(monkeypatch):
+    queued = []
+    monkeypatch.setattr(scheduled_jobs, "ttl", 60)
+    monkeypatch.setattr(tasks.regenerate_sitemap, "apply_async", lambda **kw: queued.append(kw))
+
+    for _ in range(3):
+        tasks.debounced(tasks.regenerate_sitemap, "sitemap")
+    assert queued == [{"countdown": 60}]
+    scheduled_jobs.delete("sitemap")
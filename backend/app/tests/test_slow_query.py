@@ -0,0 +1,32 @@
+import threading
+
+from app.db.session import engine
+from app.db.slow_query import SlowQueryLog
+
+
+def test_explain_queue_is_bounded_and_deduplicated(monkeypatch):
+    log = SlowQueryLog(max_pending=2)
+    release, explained = threading.Event(), []
+
+    def capture(engine, entry, statement, parameters):
+        release.wait(5)
+        explained.append(statement)
+
+    monkeypatch.setattr(log, "_capture", capture)
+    for statement in ["SELECT 1", "SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1"]:
+        log.record(engine, statement, (), 1.0, False)
+    assert log._pending == {"SELECT 1", "SELECT 2"}  # the repeats and SELECT 3 were dropped
+
+    release.set()
+    log._executor.shutdown(wait=True)
+    assert explained == ["SELECT 1", "SELECT 2"]
+    assert log._pending == set()
+    assert len(log.list()) == 5
+
+
+def test_plan_is_cached_per_statement():
+    log = SlowQueryLog()
+    log.record(engine, "SELECT 1", (), 1.0, False)
+    log._executor.shutdown(wait=True)
+
+    assert log.record(engine, "SELECT 1", (), 1.0, False)["plan"] is not None
@@ -0,0 +1,47 @@
+from app.crud.crud_stats import crud_stats
+from app.core.security import create_access_token
+from app.models import Permission, User, UserRole
+from app.services import stats_service
+
+
+def _rollups(db) -> dict:
+    db.expire_all()
+    return {(r.entity, r.parent_id): (r.active, r.inactive) for r in crud_stats.get_all(db)}
+
+
+def test_rollups_follow_create_move_and_deactivate(client, db, catalog):
+    module, topic = catalog["module"], catalog["topic"]
+    assert _rollups(db)[("topic", module)] == (1, 0)
+
+    other = client.post("/api/v1/modules/", json={
+        "roadmap_id": catalog["roadmap"], "technology_id": catalog["technology"],
+        "slug": "advanced", "title": "Advanced",
+    }).json()["id"]
+    assert _rollups(db)[("module", catalog["technology"])] == (2, 0)
+
+    client.put(f"/api/v1/topics/{topic}", json={"module_id": other})
+    rollups = _rollups(db)
+    assert ("topic", module) not in rollups
+    assert rollups[("topic", other)] == (1, 0)
+
+    client.delete(f"/api/v1/modules/{other}")
+    rollups = _rollups(db)
+    assert rollups[("module", catalog["technology"])] == (1, 1)
+    assert rollups[("topic", other)] == (0, 1)
+    assert rollups[("lesson", catalog["sub_topic"])] == (0, 1)
+
+
+def test_admin_stats_match_a_recount(client, db, catalog):
+    client.delete(f"/api/v1/sub-topics/{catalog['sub_topic']}")
+    permission = Permission(name="view_analytics")
+    user = User(email="admin@example.com", username="admin", hashed_password="-",
+                role=UserRole(name="analyst", permissions=[permission]))
+    db.add(user)
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    kept = client.get("/api/v1/admin/stats", headers=headers).json()
+    stats_service.rebuild_all(db)
+    assert client.get("/api/v1/admin/stats", headers=headers).json() == kept
+    assert kept["totals"]["lesson"] == {"active": 0, "inactive": 1}
+    assert kept["totals"]["topic"] == {"active": 1, "inactive": 0}
@@ -0,0 +1,13 @@
+def _span(exporter, name):
+    return next(s for s in exporter.get_finished_spans() if s.name == name)
+
+
+def test_restore_technology_records_the_technology_id(client, editor, catalog, span_exporter):
+    tech_id = catalog["technology"]
+    assert client.delete(f"/api/v1/technologies/{tech_id}").status_code == 200
+    assert client.post(f"/api/v1/technologies/{tech_id}/restore", headers=editor).status_code == 200
+
+    span = _span(span_exporter, "restore_technology")
+    assert span.attributes["app.entity.type"] == "technology"
+    assert span.attributes["app.entity.id"] == tech_id
+    assert "app.tech_id" not in span.attributes
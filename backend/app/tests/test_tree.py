@@ -0,0 +1,51 @@
+from app.crud.crud_tree import crud_tree
+from app.models import Lesson, Module, SubTopic, Technology, Topic
+
+
+def _create(client, path, **fields):
+    response = client.post(f"/api/v1/{path}/", json=fields)
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def test_moving_a_module_carries_its_subtree(client, db, catalog):
+    roadmap = _create(client, "roadmaps", slug="backend", title="Backend")
+    technology = _create(client, "technologies", roadmap_id=roadmap, slug="node", title="Node")
+
+    response = client.put(f"/api/v1/modules/{catalog['module']}", json={"technology_id": technology})
+    assert response.status_code == 200, response.text
+
+    db.expire_all()
+    module = db.get(Module, catalog["module"])
+    assert (module.roadmap_id, module.technology_id) == (roadmap, technology)
+    for model, entity in ((Topic, "topic"), (SubTopic, "sub_topic"), (Lesson, "lesson")):
+        row = db.get(model, catalog[entity])
+        assert (row.roadmap_id, row.technology_id) == (roadmap, technology)
+        assert row.path == crud_tree.build_path(entity, row.__dict__)
+    assert db.get(Lesson, catalog["lesson"]).path == (
+        f"{roadmap}.{technology}.{catalog['module']}.{catalog['topic']}.{catalog['sub_topic']}"
+    )
+
+    # Found under the new technology, gone from the old one
+    below = crud_tree.subtree(db, "technology", db.get(Technology, technology))
+    assert {name: [row.id for row in rows] for name, rows in below.items()} == {
+        name: [catalog[name]] for name in ("module", "topic", "sub_topic", "lesson")
+    }
+    old = crud_tree.subtree(db, "technology", db.get(Technology, catalog["technology"]))
+    assert all(rows == [] for rows in old.values())
+
+
+def test_subtree_skips_inactive_rows_unless_asked(client, db, catalog):
+    parents = {f"{key}_id": catalog[key] for key in ("roadmap", "technology", "module", "topic")}
+    other = _create(client, "sub-topics", **parents, slug="state", title="State")
+    client.delete(f"/api/v1/sub-topics/{catalog['sub_topic']}")
+
+    db.expire_all()
+    topic = db.get(Topic, catalog["topic"])
+    active = crud_tree.subtree(db, "topic", topic)
+    assert [row.id for row in active["sub_topic"]] == [other]
+    assert active["lesson"] == []
+
+    everything = crud_tree.subtree(db, "topic", topic, active_only=False)
+    assert {row.id for row in everything["sub_topic"]} == {catalog["sub_topic"], other}
+    assert [row.id for row in everything["lesson"]] == [catalog["lesson"]]
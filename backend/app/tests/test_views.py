@@ -0,0 +1,21 @@
+from sqlalchemy import select
+
+from app.models import ContentView
+from app.services.view_service import ViewCounter
+
+
+def test_flush_adds_to_the_daily_counters(client, db, catalog):
+    counter = ViewCounter(shards=2)
+    for _ in range(3):
+        counter.add("lesson", catalog["lesson"])
+    counter.add("topic", catalog["topic"])
+    assert counter.flush() == 2
+    assert not counter.pending()
+
+    counter.add("lesson", catalog["lesson"], views=2)
+    counter.flush()
+    views = db.scalars(select(ContentView).where(ContentView.entity == "lesson")).all()
+    assert [(v.entity_id, v.views) for v in views] == [(catalog["lesson"], 5)]
+
+    popular = client.get("/api/v1/popular", params={"entity": "lesson"}).json()
+    assert [(p["id"], p["views"]) for p in popular] == [(catalog["lesson"], 5)]
@@ -0,0 +1,122 @@
+import io
+import re
+from functools import lru_cache
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+# Formats accepted for upload, by Pillow's name for them.
+CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+    "AVIF": "image/avif",
+}
+EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "GIF": "gif", "AVIF": "avif"}
+
+# Encoder settings per variant format.
+VARIANT_OPTIONS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+}
+
+# "<sha256>-<width>x<height>.<ext>": the original's size is part of its
+# name, so its variants (and their sizes) follow from the URL alone.
+_ORIGINAL = re.compile(r"/(?P<name>[0-9a-f]{64}-(?P<width>\d+)x(?P<height>\d+))\.\w+$")
+
+
+class ImageError(ValueError):
+    pass
+
+
+def open_image(data: bytes) -> Image.Image:
+    """Decoded, upright (EXIF orientation applied) image, or ImageError."""
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.format not in CONTENT_TYPES:
+            raise ImageError(f"Unsupported image format {image.format}")
+        # Checked on the header, before decoding a possible pixel bomb
+        if image.width * image.height > settings.MEDIA_MAX_PIXELS:
+            raise ImageError("Image has too many pixels")
+        image_format = image.format
+        image = ImageOps.exif_transpose(image)
+        image.format = image_format
+        return image
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ImageError("Not a readable image") from e
+
+
+def variant_widths(width: int) -> list[int]:
+    """Widths rendered for an original this wide (never upscaled)."""
+    return [w for w in settings.MEDIA_VARIANT_WIDTHS if w < width] + [width]
+
+
+@lru_cache
+def variant_formats() -> tuple[str, ...]:
+    # AVIF needs a Pillow built with libavif
+    from PIL import features
+
+    return tuple(f for f in settings.MEDIA_FORMATS if f != "avif" or features.check("avif"))
+
+
+def encode_variant(data: bytes, width: int, formats: tuple[str, ...]) -> dict[str, bytes]:
+    """
+    The image scaled to `width`, encoded once per format. Runs in the
+    media process pool, hence bytes in and out.
+    """
+    image = open_image(data)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or "A" in image.mode else "RGB")
+    if width != image.width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.LANCZOS)
+
+    encoded = {}
+    for fmt in formats:
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt.upper(), **VARIANT_OPTIONS[fmt])
+        encoded[fmt] = buffer.getvalue()
+    return encoded
+
+
+# ======================================================
+# Keys and URLs
+# ======================================================
+
+def original_key(sha256: str, width: int, height: int, image_format: str) -> str:
+    return f"{sha256[:2]}/{sha256}-{width}x{height}.{EXTENSIONS[image_format]}"
+
+
+def variant_key(original: str, width: int, fmt: str) -> str:
+    return f"{original.rsplit('.', 1)[0]}-{width}w.{fmt}"
+
+
+def media_url(key: str) -> str:
+    return f"{settings.MEDIA_URL.rstrip('/')}/{key}"
+
+
+def image_size(url: str | None) -> tuple[int, int] | None:
+    """(width, height) of an uploaded original, from its URL; None for other URLs."""
+    if not url or not url.startswith(settings.MEDIA_URL):
+        return None
+    match = _ORIGINAL.search(url)
+    if match is None:
+        return None
+    return int(match["width"]), int(match["height"])
+
+
+def srcset(url: str | None) -> dict[str, str] | None:
+    """
+    `srcset` per content type ("image/avif", "image/webp") for an
+    uploaded original, for <picture><source type=... srcset=...>.
+    """
+    size = image_size(url)
+    if size is None:
+        return None
+    base = url.rsplit(".", 1)[0]
+    return {
+        f"image/{fmt}": ", ".join(f"{base}-{w}w.{fmt} {w}w" for w in variant_widths(size[0]))
+        for fmt in variant_formats()
+    }
@@ -0,0 +1,167 @@
+import copy
+from typing import Any
+
+
+class JsonPatchError(ValueError):
+    pass
+
+
+class JsonPatchTestFailed(JsonPatchError):
+    pass
+
+
+class JsonPatchTargetError(JsonPatchError):
+    """The path exists but its value has the wrong type for the operation."""
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    """RFC 6901: "/content/3/text" -> ["content", "3", "text"]."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer {pointer!r}")
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise JsonPatchError(f"Invalid array index {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"Array index {index} out of range")
+    return index
+
+
+def _parent(doc: Any, tokens: list[str]) -> tuple[Any, str]:
+    if not tokens:
+        raise JsonPatchError("Cannot modify the document root")
+    target = doc
+    for token in tokens[:-1]:
+        if isinstance(target, list):
+            target = target[_index(target, token)]
+        elif isinstance(target, dict) and token in target:
+            target = target[token]
+        else:
+            raise JsonPatchError(f"Path segment {token!r} not found")
+    return target, tokens[-1]
+
+
+def _get(doc: Any, tokens: list[str]) -> Any:
+    if not tokens:
+        return doc
+    container, token = _parent(doc, tokens)
+    if isinstance(container, list):
+        return container[_index(container, token)]
+    if isinstance(container, dict) and token in container:
+        return container[token]
+    raise JsonPatchError(f"Path {'/' + '/'.join(tokens)!r} not found")
+
+
+def _add(doc: Any, tokens: list[str], value: Any) -> None:
+    container, token = _parent(doc, tokens)
+    if isinstance(container, list):
+        container.insert(_index(container, token, allow_end=True), value)
+    elif isinstance(container, dict) and token != "-":
+        container[token] = value
+    else:
+        # "-" (append) is only meaningful on an array
+        raise JsonPatchTargetError(
+            f"Cannot add {'/' + '/'.join(tokens)!r}: the target is a {type(container).__name__}, not an array"
+        )
+
+
+def _remove(doc: Any, tokens: list[str]) -> Any:
+    container, token = _parent(doc, tokens)
+    if isinstance(container, list):
+        return container.pop(_index(container, token))
+    if isinstance(container, dict) and token in container:
+        return container.pop(token)
+    raise JsonPatchError(f"Path {'/' + '/'.join(tokens)!r} not found")
+
+
+def _member(operation: dict, key: str) -> Any:
+    if key not in operation:
+        raise JsonPatchError(f"{operation['op']!r} operation needs {key!r}")
+    return operation[key]
+
+
+def apply_patch(doc: dict, operations: list[dict]) -> dict:
+    """
+    Apply RFC 6902 operations (add, remove, replace, move, copy, test) to
+    `doc` in place; all or nothing is up to the caller (work on a copy).
+    """
+    for operation in operations:
+        op = operation["op"]
+        tokens = parse_pointer(operation["path"])
+        if op == "add":
+            _add(doc, tokens, copy.deepcopy(_member(operation, "value")))
+        elif op == "remove":
+            _remove(doc, tokens)
+        elif op == "replace":
+            _get(doc, tokens)  # must exist
+            container, token = _parent(doc, tokens)
+            key = _index(container, token) if isinstance(container, list) else token
+            container[key] = copy.deepcopy(_member(operation, "value"))
+        elif op == "move":
+            source = parse_pointer(_member(operation, "from"))
+            if tokens[:len(source)] == source and tokens != source:
+                raise JsonPatchError("Cannot move a value into itself")
+            _add(doc, tokens, _remove(doc, source))
+        elif op == "copy":
+            _add(doc, tokens, copy.deepcopy(_get(doc, parse_pointer(_member(operation, "from")))))
+        elif op == "test":
+            if _get(doc, tokens) != _member(operation, "value"):
+                raise JsonPatchTestFailed(f"Test failed at {operation['path']!r}")
+        else:
+            raise JsonPatchError(f"Unknown operation {op!r}")
+    return doc
+
+
+def _escape(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> list[dict]:
+    """
+    Operations turning `old` into `new`. Dicts are diffed key by key;
+    lists keep their common head and tail, so inserting or deleting one
+    block in a long list costs a single operation.
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [
+            {"op": "remove", "path": f"{path}/{_escape(key)}"}
+            for key in sorted(old.keys() - new.keys())
+        ]
+        for key, value in new.items():
+            pointer = f"{path}/{_escape(key)}"
+            if key in old:
+                ops += make_patch(old[key], value, pointer)
+            else:
+                ops.append({"op": "add", "path": pointer, "value": value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        start, old_end, new_end = 0, len(old), len(new)
+        while start < min(old_end, new_end) and old[start] == new[start]:
+            start += 1
+        while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        common = min(old_end, new_end) - start
+        ops = []
+        for i in range(start, start + common):
+            ops += make_patch(old[i], new[i], f"{path}/{i}")
+        # Surplus old items go from the back so earlier indices stay valid
+        for i in range(old_end - 1, start + common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for i in range(start + common, new_end):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        return ops
+
+    return [{"op": "replace", "path": path, "value": new}]
@@ -0,0 +1,122 @@
+import re
+from collections import Counter
+from typing import Iterable, Iterator
+
+import numpy as np
+from scipy import sparse
+
+# Words of two or more letters / digits, in any script
+TOKEN = re.compile(r"[^\W_]{2,}")
+
+STOPWORDS = frozenset("""
+    about above after again all also an and any are as at be because been before
+    being below between both but by can could did do does doing down during each
+    few for from further had has have having he her here hers him his how if in
+    into is it its itself just me more most my no nor not now of off on once only
+    or other our ours out over own same she should so some such than that the
+    their theirs them then there these they this those through to too under until
+    up use used using very was we were what when where which while who whom why
+    will with would you your yours
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    return [w for w in TOKEN.findall(text.lower()) if w not in STOPWORDS]
+
+
+def _counts(docs: list[Counter], vocabulary: dict[str, int], grow: bool) -> sparse.csr_matrix:
+    # One row of raw term counts per document; with `grow`, new terms
+    # are added to the vocabulary, otherwise left out
+    indptr, indices, counts = [0], [], []
+    for doc in docs:
+        for term, count in doc.items():
+            col = vocabulary.setdefault(term, len(vocabulary)) if grow else vocabulary.get(term)
+            if col is not None:
+                indices.append(col)
+                counts.append(count)
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), indices, indptr),
+        shape=(len(docs), len(vocabulary)),
+    )
+
+
+def _weigh(matrix: sparse.csr_matrix, idf: np.ndarray) -> sparse.csr_matrix:
+    matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return (sparse.diags(1 / norms) @ matrix).tocsr()
+
+
+def fit(docs: list[Counter]) -> tuple[sparse.csr_matrix, dict[str, int], np.ndarray]:
+    """
+    One L2-normalised row per document (term counts in), so the dot
+    product of two rows is their cosine similarity. Sublinear tf
+    (1 + log count), smoothed idf (log((1 + n) / (1 + df)) + 1).
+    Returns the matrix, the vocabulary (term -> column) and the idf.
+    """
+    vocabulary: dict[str, int] = {}
+    matrix = _counts(docs, vocabulary, grow=True)
+    df = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(docs)) / (1 + df)) + 1
+    return _weigh(matrix, idf), vocabulary, idf
+
+
+def transform(docs: list[Counter], vocabulary: dict[str, int], idf: np.ndarray) -> sparse.csr_matrix:
+    """Rows for more documents on the weights of an earlier `fit`; unknown terms are left out."""
+    return _weigh(_counts(docs, vocabulary, grow=False), idf)
+
+
+def replace_rows(matrix: sparse.csr_matrix, rows: list[int], vectors: sparse.csr_matrix) -> sparse.csr_matrix:
+    """`matrix` with these rows set to `vectors`, grown if a row is past its end."""
+    n = max([matrix.shape[0], *(row + 1 for row in rows)])
+    matrix = matrix.copy()
+    matrix.resize((n, matrix.shape[1]))
+    keep = np.ones(n)
+    keep[rows] = 0
+    place = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, np.arange(len(rows)))), shape=(n, len(rows))
+    )
+    return (sparse.diags(keep) @ matrix + place @ vectors).tocsr()
+
+
+def top_k(
+    matrix: sparse.csr_matrix,
+    rows: Iterable[int],
+    k: int,
+    min_score: float,
+    batch_cells: int,
+) -> Iterator[tuple[int, list[tuple[int, float]]]]:
+    """
+    (row, [(other row, cosine), ...]) for each of `rows`: its k most
+    similar other rows scoring at least `min_score`, best first. Scored
+    a batch of rows at a time, one sparse product per batch, the batch
+    sized so its dense score block holds about `batch_cells` values.
+    """
+    n = matrix.shape[0]
+    rows = np.fromiter(rows, dtype=np.int64)
+    k = min(k, n - 1)
+    if k <= 0:
+        for row in rows:
+            yield int(row), []
+        return
+
+    transposed = matrix.T.tocsr()
+    batch = max(1, batch_cells // n)
+    for start in range(0, len(rows), batch):
+        chunk = rows[start:start + batch]
+        scores = (matrix[chunk] @ transposed).toarray()
+        scores[np.arange(len(chunk)), chunk] = -1  # not its own neighbour
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for i, row in enumerate(chunk):
+            ranked = best[i][np.argsort(-scores[i, best[i]], kind="stable")]
+            yield int(row), [
+                (int(col), float(scores[i, col])) for col in ranked if scores[i, col] >= min_score
+            ]
+
+
+def most_similar_to(matrix: sparse.csr_matrix, rows: list[int]) -> np.ndarray:
+    """For every row, its highest cosine with any of `rows` (one sparse product)."""
+    if not rows or not matrix.shape[0]:
+        return np.zeros(matrix.shape[0])
+    return np.asarray((matrix @ matrix[rows].T).max(axis=1).todense()).ravel()
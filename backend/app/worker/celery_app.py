@@ -0,0 +1,32 @@
+"""
+Usage:
+    celery -A app.worker.celery_app worker --loglevel=info
+"""
+from celery import Celery
+
+from app.core.config import settings
+
+celery_app = Celery(
+    "eduwise",
+    broker=settings.CELERY_BROKER_URL,
+    include=["app.worker.tasks"],
+)
+
+celery_app.conf.update(
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    task_eager_propagates=True,
+    task_ignore_result=True,
+    task_serializer="json",
+    accept_content=["json"],
+    # Jobs are idempotent rebuilds: re-run them if a worker dies mid-way.
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    # Publishing happens in the request thread after commit; give up fast
+    # rather than hold the response while the broker is unreachable.
+    task_publish_retry_policy={
+        "max_retries": 2,
+        "interval_start": 0,
+        "interval_step": 0.2,
+        "interval_max": 0.5,
+    },
+)
@@ -0,0 +1,197 @@
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import prerender_cache, scheduled_jobs
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.db.events import Change, on_commit
+from app.services import navigation_service, stats_service
+from app.services.seo_service import PAGE_MODELS, SITEMAP_INDEX, build_sitemap, render_head
+from app.worker.celery_app import celery_app
+
+logger = logging.getLogger("app.worker")
+
+
+# ======================================================
+# Search indexers
+# ======================================================
+
+_indexers: list[Callable[[Session, str, list[int]], None]] = []
+
+
+def search_indexer(fn: Callable[[Session, str, list[int]], None]):
+    """
+    Register `fn(db, entity, ids)`; called by `reindex_search` for every
+    batch of changed rows (deleted / deactivated ones included).
+    """
+    _indexers.append(fn)
+    return fn
+
+
+@search_indexer
+def index_related_content(db: Session, entity: str, ids: list[int]) -> None:
+    # Imported here: numpy / scipy are only needed where this job runs
+    from app.services import related_service
+
+    related_service.refresh(db, entity, ids)
+
+
+# ======================================================
+# Tasks
+# ======================================================
+
+@celery_app.task(name="search.reindex")
+def reindex_search(entity: str, ids: list[int]) -> None:
+    if not _indexers:
+        return
+    with SessionLocal() as db:
+        for indexer in _indexers:
+            indexer(db, entity, ids)
+
+
+@celery_app.task(name="seo.sitemap")
+def regenerate_sitemap() -> list[str]:
+    with SessionLocal() as db:
+        files = build_sitemap(db)
+
+    # Write-then-rename so readers never see a half-written file; the
+    # index goes last, then chunks it no longer lists are removed.
+    directory = settings.SITEMAP_DIR
+    os.makedirs(directory, exist_ok=True)
+    for name in sorted(files, key=lambda name: name == SITEMAP_INDEX):
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".xml")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(files[name])
+        os.replace(tmp, os.path.join(directory, name))
+    for name in os.listdir(directory):
+        if name.startswith("sitemap-") and name not in files:
+            os.remove(os.path.join(directory, name))
+    return sorted(files)
+
+
+@celery_app.task(name="seo.prerender")
+def prerender_html(entity: str, ids: list[int]) -> None:
+    with SessionLocal() as db:
+        if entity == "seo":
+            # Re-render every page that uses the changed metadata.
+            targets = [
+                (name, page_id)
+                for name, model in PAGE_MODELS.items()
+                for page_id in db.scalars(select(model.id).where(model.seo_id.in_(ids)))
+            ]
+        else:
+            targets = [(entity, page_id) for page_id in ids]
+
+        for name, page_id in targets:
+            head = render_head(db, name, page_id)
+            if head is None:
+                prerender_cache.delete(f"{name}:{page_id}")
+            else:
+                prerender_cache.set(f"{name}:{page_id}", head)
+
+
+@celery_app.task(name="navigation.rebuild")
+def rebuild_reading_order(changed: dict[str, list[int]]) -> None:
+    # One job per commit: a cascade touches several levels of the same
+    # technology, which is then rebuilt once.
+    with SessionLocal() as db:
+        technology_ids = set()
+        for entity, ids in changed.items():
+            technology_ids |= navigation_service.technologies_for(db, entity, ids)
+        navigation_service.rebuild(db, technology_ids)
+
+
+@celery_app.task(name="stats.refresh")
+def refresh_catalog_stats(changed: dict[str, list[int]]) -> None:
+    with SessionLocal() as db:
+        stats_service.refresh(db, changed)
+
+
+@celery_app.task(name="cache.warm")
+def warm_cache() -> int:
+    from app.services.warmup import warm_caches
+
+    with SessionLocal() as db:
+        return warm_caches(db)
+
+
+@celery_app.task(name="related.rebuild")
+def rebuild_related_content() -> int:
+    """
+    Every page's neighbours from scratch (edits only rescore the pages
+    they affect). Schedule it nightly, or run it by hand:
+    celery -A app.worker.celery_app call related.rebuild
+    """
+    from app.services import related_service
+
+    with SessionLocal() as db:
+        return related_service.rebuild_all(db)
+
+
+@celery_app.task(name="content.migrate_blocks")
+def migrate_content_blocks() -> int:
+    """
+    One-off, run by hand once CONTENT_STORAGE=blocks is deployed:
+    celery -A app.worker.celery_app call content.migrate_blocks
+    """
+    from app.crud.crud_lesson import crud_lesson
+    from app.crud.crud_sub_topic import crud_sub_topic
+    from app.crud.crud_topic import crud_topic
+    from app.services.content_service import migrate_to_blocks
+
+    with SessionLocal() as db:
+        return sum(
+            migrate_to_blocks(db, crud)
+            for crud in (crud_topic, crud_sub_topic, crud_lesson)
+        )
+
+
+# ======================================================
+# Post-commit wiring
+# ======================================================
+
+def debounced(task, key: str) -> None:
+    """
+    Queue `task` to start once scheduled_jobs' TTL from now, unless a run
+    is already waiting: writes in that window share it. The key expires as
+    the run starts, so a write it may have missed queues the next one.
+    """
+    if scheduled_jobs.ttl <= 0:
+        task.delay()
+    elif scheduled_jobs.add(key, True):
+        task.apply_async(countdown=scheduled_jobs.ttl)
+
+
+@on_commit
+def enqueue_jobs(changes: list[Change]) -> None:
+    """
+    Runs in the request thread right after commit: drop this worker's
+    stale pre-rendered pages, then hand the rebuilds to Celery.
+    """
+    by_entity: dict[str, list[int]] = defaultdict(list)
+    placed: dict[str, list[int]] = defaultdict(list)  # created, moved, reordered, ...
+    for change in changes:
+        by_entity[change.entity].append(change.id)
+        if change.entity != "seo" and change.touches(navigation_service.SEQUENCE_FIELDS):
+            placed[change.entity].append(change.id)
+
+    for entity, ids in by_entity.items():
+        if entity == "seo":
+            prerender_cache.invalidate()
+        else:
+            for page_id in ids:
+                prerender_cache.delete(f"{entity}:{page_id}")
+            reindex_search.delay(entity, ids)
+        prerender_html.delay(entity, ids)
+
+    debounced(regenerate_sitemap, "sitemap")
+    if placed:
+        rebuild_reading_order.delay(dict(placed))
+    if by_entity.keys() - {"seo"}:
+        refresh_catalog_stats.delay(dict(by_entity))
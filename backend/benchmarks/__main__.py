@@ -0,0 +1,130 @@
+"""
+End-to-end API benchmarks.
+
+Usage (from backend/, against a local database):
+    export DATABASE_URL=sqlite:///bench.db        # or a local Postgres
+    python -m benchmarks generate --shape 2x5x5x10x5x5 --create-schema
+    python -m benchmarks run --iterations 200 --concurrency 8
+    python -m benchmarks run --only "topics.*" --only "lessons.*"
+    python -m benchmarks compare benchmarks/results/a.json benchmarks/results/b.json
+
+The full-size tree from the perf plan is `--shape 10x20x15x20x10x5`
+(3M lessons); start smaller.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Benchmarks measure the app, not the limiter.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+# Post-commit jobs are published but never consumed, as with a remote worker.
+os.environ.setdefault("CELERY_BROKER_URL", "memory://")
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def cmd_generate(args) -> None:
+    from app.db.base import Base
+    from app.db.session import engine
+    import app.models  # noqa: F401
+    from benchmarks.generator import TreeGenerator, TreeShape
+
+    shape = TreeShape.parse(args.shape)
+    if args.create_schema:
+        Base.metadata.create_all(bind=engine)
+
+    print(f"Generating {shape.totals()} on {engine.dialect.name}")
+    start = time.perf_counter()
+    generator = TreeGenerator(shape, seed=args.seed, batch_size=args.batch_size, prefix=args.prefix)
+    with engine.begin() as conn:
+        generator.generate(conn, progress=lambda tech_id: print(f"  technology {tech_id} done"))
+    print(f"✅ Done in {time.perf_counter() - start:.1f}s")
+
+
+def cmd_run(args) -> None:
+    from app.db.session import engine
+    from benchmarks.runner import run_benchmarks
+
+    result = asyncio.run(run_benchmarks(
+        engine,
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        only=args.only,
+        base_url=args.base_url,
+        seed=args.seed,
+        warmup=args.warmup,
+    ))
+
+    print(f"{'endpoint':32} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>8} {'q/req':>6} {'err':>4}")
+    for name, stats in result["endpoints"].items():
+        print(
+            f"{name:32} {stats['p50_ms']:9.2f} {stats['p95_ms']:9.2f} {stats['p99_ms']:9.2f} "
+            f"{stats['throughput_rps']:8.1f} {stats['queries_per_request'] or 0:6.1f} {stats['errors']:4}"
+        )
+
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"{result['meta']['git_revision'] or 'nogit'}-{int(time.time())}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"Results written to {output}")
+
+
+def cmd_compare(args) -> None:
+    base = json.loads(Path(args.base).read_text())
+    head = json.loads(Path(args.head).read_text())
+
+    print(f"{base['meta']['git_revision']} → {head['meta']['git_revision']}")
+    print(f"{'endpoint':32} {'p50 Δ%':>8} {'p95 Δ%':>8} {'p99 Δ%':>8} {'q/req':>12}")
+    for name, new in head["endpoints"].items():
+        old = base["endpoints"].get(name)
+        if not old:
+            print(f"{name:32} {'(new)':>8}")
+            continue
+
+        def delta(key):
+            return (new[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+
+        queries = f"{old['queries_per_request']}→{new['queries_per_request']}"
+        print(f"{name:32} {delta('p50_ms'):+8.1f} {delta('p95_ms'):+8.1f} {delta('p99_ms'):+8.1f} {queries:>12}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="insert a synthetic content tree")
+    gen.add_argument("--shape", default="2x5x5x10x5x5",
+                     help="roadmaps x technologies x modules x topics x sub-topics x lessons[:blocks]")
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--batch-size", type=int, default=500)
+    gen.add_argument("--prefix", default="bench", help="roadmap slug prefix")
+    gen.add_argument("--create-schema", action="store_true", help="create tables first (local DBs)")
+    gen.set_defaults(func=cmd_generate)
+
+    run = sub.add_parser("run", help="benchmark every endpoint")
+    run.add_argument("--iterations", type=int, default=200)
+    run.add_argument("--concurrency", type=int, default=8)
+    run.add_argument("--warmup", type=int, default=10)
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--only", action="append", help="glob over scenario names, repeatable")
+    run.add_argument("--base-url", help="benchmark a running server instead of in-process")
+    run.add_argument("--output", help="JSON path (default: benchmarks/results/<rev>-<ts>.json)")
+    run.set_defaults(func=cmd_run)
+
+    cmp_ = sub.add_parser("compare", help="diff two result files")
+    cmp_.add_argument("base")
+    cmp_.add_argument("head")
+    cmp_.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
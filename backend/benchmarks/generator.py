@@ -0,0 +1,318 @@
+"""
+Synthetic content tree for benchmarks.
+
+Builds roadmaps → technologies → modules → topics → sub-topics → lessons
+with realistic ContentBlock payloads, inserted level by level in batched
+`INSERT ... RETURNING id` statements so that even multi-million row trees
+load in minutes.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection
+
+from app.models.lesson import Lesson
+from app.models.module import Module
+from app.models.roadmap import Roadmap
+from app.models.seo_metadata import SeoMetadata
+from app.models.sub_topic import SubTopic
+from app.models.technology import Technology
+from app.models.topic import Topic
+
+
+@dataclass(frozen=True)
+class TreeShape:
+    roadmaps: int = 10
+    technologies: int = 20  # per roadmap
+    modules: int = 15       # per technology
+    topics: int = 20        # per module
+    sub_topics: int = 10    # per topic
+    lessons: int = 5        # per sub-topic
+    blocks: int = 12        # content blocks per topic / sub-topic / lesson
+
+    @classmethod
+    def parse(cls, value: str) -> "TreeShape":
+        """
+        "10x20x15x20x10x5" (optionally "...x5:12" for blocks per item).
+        """
+        levels, _, blocks = value.partition(":")
+        counts = [int(part) for part in levels.lower().split("x")]
+        if len(counts) != 6:
+            raise ValueError("shape needs six levels, e.g. 10x20x15x20x10x5")
+        kwargs = dict(zip(
+            ("roadmaps", "technologies", "modules", "topics", "sub_topics", "lessons"),
+            counts,
+        ))
+        if blocks:
+            kwargs["blocks"] = int(blocks)
+        return cls(**kwargs)
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+    def totals(self) -> dict[str, int]:
+        roadmaps = self.roadmaps
+        technologies = roadmaps * self.technologies
+        modules = technologies * self.modules
+        topics = modules * self.topics
+        sub_topics = topics * self.sub_topics
+        lessons = sub_topics * self.lessons
+        return {
+            "roadmaps": roadmaps,
+            "technologies": technologies,
+            "modules": modules,
+            "topics": topics,
+            "sub_topics": sub_topics,
+            "lessons": lessons,
+        }
+
+
+# ── Content ───────────────────────────────────────────────────────────────────
+
+WORDS = (
+    "element attribute selector closure scope render state effect query index "
+    "cache request response layout grid flex module import export async await "
+    "promise callback event listener component props hook router token schema "
+    "table column transaction commit rollback migration variable function class "
+    "object array string number boolean loop iterator generator stream buffer"
+).split()
+
+LANGUAGES = ("javascript", "python", "html", "css", "sql", "bash")
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random) -> list[dict[str, Any]]:
+    spans = []
+    for _ in range(rng.randint(2, 6)):
+        span: dict[str, Any] = {"value": _sentence(rng, rng.randint(6, 20)) + " "}
+        roll = rng.random()
+        if roll < 0.15:
+            span["bold"] = True
+        elif roll < 0.25:
+            span["highlight"] = True
+        elif roll < 0.3:
+            span["link"] = "https://developer.mozilla.org/"
+        spans.append(span)
+    return spans
+
+
+def _code(rng: random.Random) -> str:
+    lines = []
+    for i in range(rng.randint(6, 30)):
+        indent = "  " * rng.randint(0, 3)
+        lines.append(f"{indent}{rng.choice(WORDS)}_{i} = {rng.choice(WORDS)}({rng.choice(WORDS)});")
+    return "\n".join(lines)
+
+
+def content_block(rng: random.Random) -> dict[str, Any]:
+    kind = rng.choices(
+        ("paragraph", "heading", "callout", "code", "table", "ul"),
+        weights=(40, 12, 10, 18, 8, 12),
+    )[0]
+    if kind == "paragraph":
+        return {"type": "paragraph", "text": _paragraph(rng)}
+    if kind == "heading":
+        return {"type": "heading", "text": _sentence(rng, 4)}
+    if kind == "callout":
+        return {
+            "type": "callout",
+            "variant": rng.choice(("info", "warning", "tip")),
+            "title": _sentence(rng, 3),
+            "text": _sentence(rng, 25),
+        }
+    if kind == "code":
+        return {
+            "type": "code",
+            "language": rng.choice(LANGUAGES),
+            "title": _sentence(rng, 3),
+            "code": _code(rng),
+        }
+    if kind == "table":
+        columns = rng.randint(2, 5)
+        return {
+            "type": "table",
+            "headers": [rng.choice(WORDS).title() for _ in range(columns)],
+            "rows": [
+                [_sentence(rng, rng.randint(1, 6)) for _ in range(columns)]
+                for _ in range(rng.randint(3, 12))
+            ],
+        }
+    return {
+        "type": "ul",
+        "items": [_sentence(rng, rng.randint(4, 12)) for _ in range(rng.randint(3, 8))],
+    }
+
+
+def content(rng: random.Random, blocks: int) -> list[dict[str, Any]]:
+    return [content_block(rng) for _ in range(blocks)]
+
+
+def learning_sections(rng: random.Random, plain: bool = False) -> dict[str, Any]:
+    """
+    Topics and sub-topics store `{"text": ...}` items, lessons plain strings.
+    """
+    def item():
+        text = _sentence(rng)
+        return text if plain else {"text": text}
+
+    return {
+        "examples": [
+            {
+                "title": _sentence(rng, 4),
+                "description": _sentence(rng, 20),
+                "code_snippet": _code(rng),
+            }
+            for _ in range(rng.randint(1, 3))
+        ],
+        "when_to_use": [item() for _ in range(3)],
+        "when_to_avoid": [item() for _ in range(2)],
+        "common_mistakes": [item() for _ in range(3)],
+        "bonus_tips": [item() for _ in range(2)],
+    }
+
+
+# ── Insertion ─────────────────────────────────────────────────────────────────
+
+def _insert_returning_ids(conn: Connection, model, rows: list[dict]) -> list[int]:
+    if not rows:
+        return []
+    result = conn.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True),
+        rows,
+    )
+    return list(result.scalars())
+
+
+def _chunks(rows: list[dict], size: int) -> Iterator[list[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class TreeGenerator:
+    """
+    Usage:
+    with engine.begin() as conn:
+        TreeGenerator(TreeShape.parse("2x3x3x4x3x2"), seed=1).generate(conn)
+    """
+
+    def __init__(self, shape: TreeShape, seed: int = 42, batch_size: int = 500, prefix: str = "bench"):
+        self.shape = shape
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.prefix = prefix
+
+    def _insert(self, conn: Connection, model, rows: list[dict]) -> list[int]:
+        ids: list[int] = []
+        for chunk in _chunks(rows, self.batch_size):
+            ids.extend(_insert_returning_ids(conn, model, chunk))
+        return ids
+
+    def _seo(self, conn: Connection, titles: list[str]) -> list[int]:
+        rows = [
+            {
+                "meta_title": title,
+                "meta_description": _sentence(self.rng, 20),
+                "keywords": [self.rng.choice(WORDS) for _ in range(5)],
+                "og_title": title,
+                "robots": "index,follow",
+                "twitter_card": "summary_large_image",
+            }
+            for title in titles
+        ]
+        return self._insert(conn, SeoMetadata, rows)
+
+    def _rich_row(self, title: str, order: int, plain: bool = False) -> dict[str, Any]:
+        return {
+            "title": title,
+            "description": _sentence(self.rng, 24),
+            "content": content(self.rng, self.shape.blocks),
+            "image_banner_url": f"https://cdn.example.com/{self.prefix}/{order}.png",
+            "order_index": order,
+            "is_active": True,
+            **learning_sections(self.rng, plain),
+        }
+
+    def generate(self, conn: Connection, progress=None) -> dict[str, int]:
+        shape = self.shape
+        prefix = self.prefix
+
+        roadmap_titles = [f"{prefix} roadmap {r}" for r in range(shape.roadmaps)]
+        roadmap_seo = self._seo(conn, roadmap_titles)
+        roadmap_ids = self._insert(conn, Roadmap, [
+            {
+                "slug": f"{prefix}-roadmap-{r}",
+                "title": roadmap_titles[r],
+                "description": _sentence(self.rng, 24),
+                "order_index": r,
+                "is_active": True,
+                "seo_id": roadmap_seo[r],
+            }
+            for r in range(shape.roadmaps)
+        ])
+
+        for roadmap_id in roadmap_ids:
+            tech_ids = self._insert(conn, Technology, [
+                {
+                    "roadmap_id": roadmap_id,
+                    "slug": f"tech-{t}",
+                    "title": f"Technology {t}",
+                    "description": _sentence(self.rng, 24),
+                    "order_index": t,
+                    "is_active": True,
+                }
+                for t in range(shape.technologies)
+            ])
+            for tech_id in tech_ids:
+                self._generate_technology(conn, roadmap_id, tech_id)
+                if progress:
+                    progress(tech_id)
+
+        return shape.totals()
+
+    def _generate_technology(self, conn: Connection, roadmap_id: int, tech_id: int) -> None:
+        shape = self.shape
+        parents = {"roadmap_id": roadmap_id, "technology_id": tech_id}
+
+        module_ids = self._insert(conn, Module, [
+            {**parents, "slug": f"module-{m}", "title": f"Module {m}",
+             "description": _sentence(self.rng, 24), "order_index": m, "is_active": True}
+            for m in range(shape.modules)
+        ])
+
+        topic_rows, topic_modules = [], []
+        for module_id in module_ids:
+            for t in range(shape.topics):
+                topic_rows.append({
+                    **parents, "module_id": module_id, "slug": f"topic-{t}",
+                    **self._rich_row(f"Topic {t}", t),
+                })
+                topic_modules.append(module_id)
+        topic_ids = self._insert(conn, Topic, topic_rows)
+
+        sub_rows, sub_parents = [], []
+        for topic_id, module_id in zip(topic_ids, topic_modules):
+            for s in range(shape.sub_topics):
+                sub_rows.append({
+                    **parents, "module_id": module_id, "topic_id": topic_id,
+                    "slug": f"sub-topic-{s}", **self._rich_row(f"Sub-topic {s}", s),
+                })
+                sub_parents.append((module_id, topic_id))
+        sub_ids = self._insert(conn, SubTopic, sub_rows)
+
+        lesson_rows = []
+        for sub_id, (module_id, topic_id) in zip(sub_ids, sub_parents):
+            for lesson in range(shape.lessons):
+                lesson_rows.append({
+                    **parents, "module_id": module_id, "topic_id": topic_id,
+                    "sub_topic_id": sub_id, "slug": f"lesson-{lesson}",
+                    **self._rich_row(f"Lesson {lesson}", lesson, plain=True),
+                })
+        self._insert(conn, Lesson, lesson_rows)
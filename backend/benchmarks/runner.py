@@ -0,0 +1,441 @@
+"""
+Drives the API with httpx and records latency / throughput / queries.
+
+By default requests go through `httpx.ASGITransport` straight into the
+real FastAPI app (same middleware, same engine); pass a base URL to hit a
+running server instead. Queries per request are read from the
+`Server-Timing` header emitted by `TimingMiddleware`.
+"""
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import random
+import re
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+
+from app.models.lesson import Lesson
+from app.models.module import Module
+from app.models.roadmap import Roadmap
+from app.models.sub_topic import SubTopic
+from app.models.technology import Technology
+from app.models.topic import Topic
+
+API = "/api/v1"
+_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+# ── Samples ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class Sample:
+    name: str
+    latency: float
+    status: int
+    queries: int | None
+
+
+@dataclass
+class Dataset:
+    """
+    Random existing rows used to build request URLs.
+    """
+    roadmaps: list = field(default_factory=list)
+    technologies: list = field(default_factory=list)
+    modules: list = field(default_factory=list)
+    topics: list = field(default_factory=list)
+    sub_topics: list = field(default_factory=list)
+    lessons: list = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, engine: Engine, limit: int = 200) -> "Dataset":
+        parent_columns = (
+            "roadmap_id", "technology_id", "module_id", "topic_id", "sub_topic_id",
+        )
+        levels = {
+            "roadmaps": Roadmap,
+            "technologies": Technology,
+            "modules": Module,
+            "topics": Topic,
+            "sub_topics": SubTopic,
+            "lessons": Lesson,
+        }
+        data = cls()
+        with engine.connect() as conn:
+            for name, model in levels.items():
+                columns = [model.id, model.slug] + [
+                    getattr(model, column)
+                    for column in parent_columns
+                    if hasattr(model, column)
+                ]
+                rows = conn.execute(
+                    select(*columns)
+                    .where(model.is_active.is_(True))
+                    .order_by(func.random())
+                    .limit(limit)
+                ).mappings().all()
+                setattr(data, name, [dict(row) for row in rows])
+                data.counts[name] = conn.execute(
+                    select(func.count()).select_from(model)
+                ).scalar_one()
+        return data
+
+
+def editor_token(engine: Engine) -> str:
+    """
+    Bearer token of a benchmark user allowed to read the draft catalog
+    (created on first use).
+    """
+    from sqlalchemy.orm import Session
+
+    from app.core.security import create_access_token
+    from app.models import Permission, User, UserRole
+
+    with Session(engine) as db:
+        user = db.scalar(select(User).where(User.username == "bench-editor"))
+        if user is None:
+            permission = db.scalar(select(Permission).where(Permission.name == "update_roadmap"))
+            role = UserRole(
+                name="bench_editor",
+                permissions=[permission or Permission(name="update_roadmap")],
+            )
+            user = User(email="bench-editor@example.com", username="bench-editor",
+                        hashed_password="-", role=role, is_verified=True)
+            db.add(user)
+            db.commit()
+        return create_access_token({"sub": str(user.id)})
+
+
+class Client:
+    def __init__(self, http: httpx.AsyncClient):
+        self.http = http
+        self.samples: list[Sample] = []
+
+    async def request(self, name: str, method: str, url: str, json=None) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.http.request(method, API + url, json=json)
+        latency = time.perf_counter() - start
+        match = _QUERIES.search(response.headers.get("server-timing", ""))
+        self.samples.append(Sample(
+            name=name,
+            latency=latency,
+            status=response.status_code,
+            queries=int(match.group(1)) if match else None,
+        ))
+        return response
+
+
+# ── Scenarios ─────────────────────────────────────────────────────────────────
+
+Scenario = Callable[[Client, Dataset, random.Random], Awaitable[None]]
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str):
+    def register(fn: Scenario) -> Scenario:
+        SCENARIOS[name] = fn
+        return fn
+    return register
+
+
+@scenario("roadmaps.list")
+async def _(client, data, rng):
+    await client.request("roadmaps.list", "GET", "/roadmaps/")
+
+
+@scenario("roadmaps.get_by_slug")
+async def _(client, data, rng):
+    row = rng.choice(data.roadmaps)
+    await client.request("roadmaps.get_by_slug", "GET", f"/roadmaps/{row['slug']}")
+
+
+@scenario("technologies.list")
+async def _(client, data, rng):
+    await client.request("technologies.list", "GET", "/technologies/")
+
+
+@scenario("technologies.list_by_roadmap")
+async def _(client, data, rng):
+    row = rng.choice(data.technologies)
+    await client.request(
+        "technologies.list_by_roadmap", "GET", f"/technologies/roadmap/{row['roadmap_id']}"
+    )
+
+
+@scenario("technologies.get_by_slug")
+async def _(client, data, rng):
+    row = rng.choice(data.technologies)
+    await client.request(
+        "technologies.get_by_slug", "GET",
+        f"/technologies/roadmap/{row['roadmap_id']}/{row['slug']}",
+    )
+
+
+@scenario("modules.list_by_technology")
+async def _(client, data, rng):
+    row = rng.choice(data.modules)
+    await client.request(
+        "modules.list_by_technology", "GET", f"/modules/technology/{row['technology_id']}"
+    )
+
+
+@scenario("modules.get_by_slug")
+async def _(client, data, rng):
+    row = rng.choice(data.modules)
+    await client.request(
+        "modules.get_by_slug", "GET",
+        f"/modules/technology/{row['technology_id']}/{row['slug']}",
+    )
+
+
+@scenario("topics.list_by_module")
+async def _(client, data, rng):
+    row = rng.choice(data.topics)
+    await client.request("topics.list_by_module", "GET", f"/topics/module/{row['module_id']}")
+
+
+@scenario("topics.get_by_slug")
+async def _(client, data, rng):
+    row = rng.choice(data.topics)
+    await client.request(
+        "topics.get_by_slug", "GET", f"/topics/module/{row['module_id']}/{row['slug']}"
+    )
+
+
+@scenario("sub_topics.list_by_topic")
+async def _(client, data, rng):
+    row = rng.choice(data.sub_topics)
+    await client.request(
+        "sub_topics.list_by_topic", "GET", f"/sub-topics/topic/{row['topic_id']}"
+    )
+
+
+@scenario("sub_topics.get_by_slug")
+async def _(client, data, rng):
+    row = rng.choice(data.sub_topics)
+    await client.request(
+        "sub_topics.get_by_slug", "GET", f"/sub-topics/topic/{row['topic_id']}/{row['slug']}"
+    )
+
+
+@scenario("lessons.list_by_sub_topic")
+async def _(client, data, rng):
+    row = rng.choice(data.lessons)
+    await client.request(
+        "lessons.list_by_sub_topic", "GET", f"/lessons/sub-topic/{row['sub_topic_id']}"
+    )
+
+
+@scenario("lessons.get_by_slug")
+async def _(client, data, rng):
+    row = rng.choice(data.lessons)
+    await client.request(
+        "lessons.get_by_slug", "GET", f"/lessons/sub-topic/{row['sub_topic_id']}/{row['slug']}"
+    )
+
+
+def _slug(rng: random.Random) -> str:
+    return f"bench-write-{rng.getrandbits(48):x}"
+
+
+async def _write_cycle(client: Client, prefix: str, path: str, payload: dict, update: dict):
+    """
+    create → update → delete of one throwaway row, recorded separately.
+    """
+    response = await client.request(f"{prefix}.create", "POST", f"{path}/", json=payload)
+    if response.status_code != 200:
+        return
+    row_id = response.json()["id"]
+    await client.request(f"{prefix}.update", "PUT", f"{path}/{row_id}", json=update)
+    await client.request(f"{prefix}.delete", "DELETE", f"{path}/{row_id}")
+
+
+@scenario("roadmaps.write")
+async def _(client, data, rng):
+    await _write_cycle(
+        client, "roadmaps", "/roadmaps",
+        {"slug": _slug(rng), "title": "Bench roadmap", "seo": {"meta_title": "Bench"}},
+        {"title": "Bench roadmap (edited)", "seo": {"meta_title": "Bench 2"}},
+    )
+
+
+@scenario("technologies.write")
+async def _(client, data, rng):
+    row = rng.choice(data.roadmaps)
+    await _write_cycle(
+        client, "technologies", "/technologies",
+        {"roadmap_id": row["id"], "slug": _slug(rng), "title": "Bench tech"},
+        {"title": "Bench tech (edited)"},
+    )
+
+
+@scenario("modules.write")
+async def _(client, data, rng):
+    row = rng.choice(data.technologies)
+    await _write_cycle(
+        client, "modules", "/modules",
+        {"roadmap_id": row["roadmap_id"], "technology_id": row["id"],
+         "slug": _slug(rng), "title": "Bench module"},
+        {"title": "Bench module (edited)"},
+    )
+
+
+def _content(rng: random.Random) -> list[dict]:
+    from benchmarks.generator import content
+
+    return content(rng, 12)
+
+
+@scenario("topics.write")
+async def _(client, data, rng):
+    row = rng.choice(data.topics)
+    await _write_cycle(
+        client, "topics", "/topics",
+        {"roadmap_id": row["roadmap_id"], "technology_id": row["technology_id"],
+         "module_id": row["module_id"], "slug": _slug(rng), "title": "Bench topic",
+         "content": _content(rng)},
+        {"content": _content(rng)},
+    )
+
+
+@scenario("sub_topics.write")
+async def _(client, data, rng):
+    row = rng.choice(data.sub_topics)
+    await _write_cycle(
+        client, "sub_topics", "/sub-topics",
+        {"roadmap_id": row["roadmap_id"], "technology_id": row["technology_id"],
+         "module_id": row["module_id"], "topic_id": row["topic_id"],
+         "slug": _slug(rng), "title": "Bench sub-topic", "content": _content(rng)},
+        {"content": _content(rng)},
+    )
+
+
+@scenario("lessons.write")
+async def _(client, data, rng):
+    row = rng.choice(data.lessons)
+    await _write_cycle(
+        client, "lessons", "/lessons",
+        {"roadmap_id": row["roadmap_id"], "technology_id": row["technology_id"],
+         "module_id": row["module_id"], "topic_id": row["topic_id"],
+         "sub_topic_id": row["sub_topic_id"], "slug": _slug(rng),
+         "title": "Bench lesson", "content": _content(rng)},
+        {"content": _content(rng)},
+    )
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+def summarize(samples: list[Sample], wall_time: float) -> dict:
+    latencies = sorted(sample.latency * 1000 for sample in samples)
+    queries = [sample.queries for sample in samples if sample.queries is not None]
+    return {
+        "count": len(samples),
+        "errors": sum(1 for sample in samples if sample.status >= 400),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "throughput_rps": round(len(samples) / wall_time, 1) if wall_time else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ── Runner ────────────────────────────────────────────────────────────────────
+
+async def run_benchmarks(
+    engine: Engine,
+    iterations: int = 200,
+    concurrency: int = 8,
+    only: list[str] | None = None,
+    base_url: str | None = None,
+    seed: int = 42,
+    warmup: int = 10,
+) -> dict:
+    data = Dataset.load(engine)
+    if not data.lessons:
+        raise RuntimeError("No content found - run `python -m benchmarks generate` first")
+
+    names = [
+        name for name in SCENARIOS
+        if not only or any(fnmatch.fnmatch(name, pattern) for pattern in only)
+    ]
+
+    # Catalog reads serve the draft, to editors only
+    headers = {"Authorization": f"Bearer {editor_token(engine)}"}
+    if base_url:
+        http = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60)
+    else:
+        from app.main import app
+
+        http = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmark",
+            headers=headers, timeout=60,
+        )
+
+    rng = random.Random(seed)
+    endpoints: dict[str, dict] = {}
+    async with http:
+        for name in names:
+            fn = SCENARIOS[name]
+
+            warm = Client(http)
+            for _ in range(warmup):
+                await fn(warm, data, rng)
+
+            client = Client(http)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one():
+                async with semaphore:
+                    await fn(client, data, rng)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(iterations)))
+            wall_time = time.perf_counter() - start
+
+            by_request: dict[str, list[Sample]] = {}
+            for sample in client.samples:
+                by_request.setdefault(sample.name, []).append(sample)
+            for request_name, samples in by_request.items():
+                endpoints[request_name] = summarize(samples, wall_time)
+
+    return {
+        "meta": {
+            "git_revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "database": engine.dialect.name,
+            "target": base_url or "in-process",
+            "iterations": iterations,
+            "concurrency": concurrency,
+            "rows": data.counts,
+        },
+        "endpoints": endpoints,
+    }
@@ -0,0 +1,62 @@
+"""
+Gunicorn settings.
+
+Usage:
+    PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus gunicorn -c gunicorn_conf.py app.main:app
+
+With preload_app (the default) the app is imported once in the master and
+shared copy-on-write with the workers; each worker still fills its own
+caches in the lifespan hook before it accepts traffic.
+"""
+import multiprocessing
+import os
+import shutil
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+timeout = int(os.getenv("TIMEOUT", "60"))
+accesslog = "-"
+errorlog = "-"
+preload_app = os.getenv("PRELOAD_APP", "true") == "true"
+
+
+# ======================================================
+# Prometheus multiprocess mode
+# ======================================================
+
+def on_starting(server):
+    # Stale sample files from a previous master would be merged into /metrics.
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+# ======================================================
+# Preloading
+# ======================================================
+
+def when_ready(server):
+    # Master only, before the first fork: mappers, schemas, OpenAPI.
+    if server.cfg.preload_app:
+        from app.main import app
+        from app.services.warmup import prepare
+
+        prepare(app)
+
+
+def post_fork(server, worker):
+    # Pooled connections must never be shared across processes.
+    if server.cfg.preload_app:
+        from app.db.session import engine
+
+        engine.dispose(close=False)